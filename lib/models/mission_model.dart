@@ -25,6 +25,7 @@ class Mission {
     this.isPast = false,
   });
 
+  // 압축 스키마 {b,t,so,cn,l,c,bf,df,s} 는 scripts/drg_data/missions.py 의 Mission.to_compact() 가 쓴다
   factory Mission.fromJson(Map<String, dynamic> json) {
     return Mission(
       biome: json['b'] ?? "",
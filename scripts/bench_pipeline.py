@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+scripts/bench_pipeline.py
+미션 데이터 파이프라인 오프라인 벤치마크
+
+합성 bulkmissions 파일(일수 / 슬롯 / 바이옴 / 바이옴당 미션 수 지정)과
+녹화해 둔 Deep Dive 응답(scripts/fixtures/deep_dive.json)으로 출력 모드별 성능을 잽니다.
+
+  legacy      : 날짜별 파일 전체를 json.load → dict 누적 → json.dumps 한 번 (예전 방식)
+  json        : 증분 파싱 → 타임슬롯 단위 변환 → daily_missions.json (현재 fetch_bulk_data)
+  packed      : daily_missions.json → packed 포맷 (--packed)
+  shards-slot : daily_missions.json → 슬롯별 샤드 (--shards slot)
+  shards-hour : daily_missions.json → 시간별 샤드 (--shards hour)
+  index       : daily_missions.json → 역색인 (--index)
+  archive     : daily_missions.json → SQLite 아카이브 병합 (--archive)
+  artifacts   : daily_missions.json + deep_dive.json → 사전 압축 산출물 (--artifacts)
+  deep-dive   : 녹화된 Deep Dive 응답 파싱 + 저장 (fetch_deep_dive), 반복 실행
+  e2e         : 원본 → json → 위의 모든 출력을 한 번에 (CI 실행과 같은 순서)
+  select      : fetch_assets.pick_best 후보 선택 로직 (합성 검색 결과)
+  filter-dicts: 고정 질의 묶음을 슬롯 dict 중첩 루프로 (비교 기준)
+  filter-store: 같은 질의를 SlotStore 열 마스크로 (drg_data.missions)
+
+측정값: 처리 레코드, 벽시계 시간, records/sec, 최대 RSS, 출력 바이트.
+모드마다 새 프로세스(spawn)에서 실행하므로 최대 RSS 가 서로 섞이지 않습니다.
+결과는 JSON 으로 저장되며 --compare 로 이전 결과와 비교할 수 있습니다.
+
+사용법:
+  python scripts/bench_pipeline.py                          # 2 / 7 / 28일, 전체 모드
+  python scripts/bench_pipeline.py --days 2 14 56           # 일수 지정
+  python scripts/bench_pipeline.py --slots 96 --biomes 11 --per-biome 8
+  python scripts/bench_pipeline.py --modes json packed      # 일부 모드만
+  python scripts/bench_pipeline.py --compare .cache/bench/prev.json
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import platform
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from drg_data import codec, shards
+from drg_data.archive import MissionArchive
+from drg_data.artifacts import build_artifacts
+from drg_data.index import build_index
+from drg_data.jsonstream import iter_file_items, write_if_changed, write_object_stream
+from drg_data.missions import SlotStore
+from drg_data.synth import BIOMES, write_fixture
+from drg_data.transform import SlotStats, iter_compact_slots, transform_in_memory
+
+try:
+    import resource
+except ImportError:   # Windows
+    resource = None
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
+
+BASE_DIR = Path(__file__).parent.parent
+DD_FIXTURE = Path(__file__).parent / "fixtures" / "deep_dive.json"
+RESULTS_DIR = BASE_DIR / ".cache" / "bench"
+RESULTS_VERSION = 1
+DD_REPEAT = 2000          # Deep Dive 는 작아서 반복 실행으로 처리량을 잰다
+SELECT_REPEAT = 200       # pick_best 반복 횟수 (이름 목록 전체 기준)
+FILTER_REPEAT = 10        # 필터 질의 묶음 반복 횟수
+REGRESSION_RATIO = 1.2    # --compare 에서 이 배수 이상 느려지거나 커지면 표시
+
+# ── 출력 모드 ─────────────────────────────────────────────────────────────────
+# 각 모드: (sources, work, base_json) → (처리 레코드 수, 출력 바이트)
+# base_json 은 부모 프로세스가 미리 만들어 둔 daily_missions.json (json 모드 결과)
+
+def _size(path: Path) -> int:
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    return path.stat().st_size if path.exists() else 0
+
+
+def _missions(path: Path) -> int:
+    return sum(len(ms) for _, ms in iter_file_items(path) if isinstance(ms, list))
+
+
+def run_in_memory(sources: list[tuple[str, Path]], out: Path) -> int:
+    raws = []
+    for _, path in sources:
+        with open(path, encoding="utf-8") as f:
+            raws.append(json.load(f))
+    data = transform_in_memory(raws)
+    out.write_bytes(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+    return sum(len(ms) for ms in data.values())
+
+
+def run_streaming(sources: list[tuple[str, Path]], out: Path) -> int:
+    stats = SlotStats()
+    write_object_stream(out, iter_compact_slots(sources, stats))
+    return stats.missions
+
+
+def mode_legacy(sources, work: Path, base_json: Path) -> tuple[int, int]:
+    out = work / "daily_missions.json"
+    return run_in_memory(sources, out), _size(out)
+
+
+def mode_json(sources, work: Path, base_json: Path) -> tuple[int, int]:
+    out = work / "daily_missions.json"
+    return run_streaming(sources, out), _size(out)
+
+
+def mode_packed(sources, work: Path, base_json: Path) -> tuple[int, int]:
+    out = work / "daily_missions.packed.json"
+    stats = codec.PackStats()
+    write_object_stream(out, codec.encode_items(lambda: iter_file_items(base_json), stats), compact=True)
+    return stats.records, _size(out)
+
+
+def _mode_shards(granularity: str):
+    def run(sources, work: Path, base_json: Path) -> tuple[int, int]:
+        out = work / "missions"
+        shards.write_shards(iter_file_items(base_json), out, granularity)
+        return _missions(base_json), _size(out)
+    return run
+
+
+def mode_index(sources, work: Path, base_json: Path) -> tuple[int, int]:
+    out = work / "mission_index.json"
+    doc = build_index(iter_file_items(base_json))
+    write_if_changed(out, json.dumps(doc, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    return _missions(base_json), _size(out)
+
+
+def mode_archive(sources, work: Path, base_json: Path) -> tuple[int, int]:
+    out = work / "archive.sqlite3"
+    with MissionArchive(out) as archive:
+        _, rows = archive.merge(iter_file_items(base_json))
+    return rows, sum(_size(p) for p in work.glob("archive.sqlite3*"))
+
+
+def mode_artifacts(sources, work: Path, base_json: Path) -> tuple[int, int]:
+    out = work / "dist"
+    build_artifacts([base_json, DD_FIXTURE], out)
+    return _missions(base_json), _size(out)
+
+
+def mode_deep_dive(sources, work: Path, base_json: Path) -> tuple[int, int]:
+    out = work / "deep_dive.json"
+    raw = DD_FIXTURE.read_bytes()
+    stages = 0
+    for _ in range(DD_REPEAT):
+        data = json.loads(raw)
+        write_if_changed(out, json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        stages += sum(len(dd.get("Stages", [])) for dd in data.get("Deep Dives", {}).values())
+    return stages, _size(out)
+
+
+def mode_e2e(sources, work: Path, base_json: Path) -> tuple[int, int]:
+    records, _ = mode_json(sources, work, base_json)
+    src = work / "daily_missions.json"
+    for step in (mode_packed, _mode_shards("slot"), mode_index, mode_archive, mode_artifacts):
+        step(sources, work, src)
+    dd = json.loads(DD_FIXTURE.read_bytes())
+    write_if_changed(work / "deep_dive.json", json.dumps(dd, ensure_ascii=False).encode("utf-8"))
+    return records, _size(work)
+
+
+def _select_cases() -> list[tuple[str, dict, list[str]]]:
+    """fetch_assets 이름 목록마다 위키 검색 결과처럼 생긴 후보 목록을 만든다 (고정 시드)."""
+    fetch_assets = _import_fetch_assets()
+    rng = random.Random(0)
+    noise = ["DRG logo.png", "Thumbnail.jpg", "Mission icon.png", "Map.webp", "Banner.jpg", "Dwarf.png"]
+    cases = []
+    for cfg in fetch_assets.CATEGORY_CONFIG.values():
+        for name in cfg["names"]:
+            candidates = [f"{name}.jpg", f"{name} icon.png", f"{name.replace(' ', '_')}.webp"]
+            candidates += rng.sample(noise, 4)
+            rng.shuffle(candidates)
+            cases.append((name, cfg, candidates))
+    return cases
+
+
+_KEEP_ALIVE: list = []
+
+
+def _import_fetch_assets():
+    """fetch_assets 는 import 시 sys.stdout 을 다시 감싼다 — 기존 래퍼를 살려 둬 버퍼가 닫히지 않게 한다."""
+    _KEEP_ALIVE.append(sys.stdout)
+    import fetch_assets
+    _KEEP_ALIVE.append(sys.stdout)
+    return fetch_assets
+
+
+def mode_select(sources, work: Path, base_json: Path) -> tuple[int, int]:
+    fetch_assets = _import_fetch_assets()
+    cases = _select_cases()
+    picks = 0
+    for _ in range(SELECT_REPEAT):
+        for name, cfg, candidates in cases:
+            if fetch_assets.pick_best(
+                candidates, name,
+                prefer_ext=cfg["prefer_ext"],
+                require_keywords=cfg["require_keywords"],
+            ):
+                picks += 1
+            fetch_assets.to_snake(name)
+    return picks, 0
+
+
+# 분석 도구에서 흔한 질의 (합성 데이터의 값 이름 기준)
+FILTER_QUERIES: list[dict] = [
+    {"mutator": "Double XP"},
+    {"warning": "Low Oxygen"},
+    {"mutator": "Gold Rush", "type": "Point Extraction"},
+    {"biome": ["Magma Core", "Salt Pits"], "length": 3},
+    {"warning": "Elite Threat", "complexity": 3, "season": "s6"},
+    {"mutator": None, "secondary": "Fossils"},
+]
+
+
+def _dict_match(m: dict, query: dict) -> bool:
+    for name, wanted in query.items():
+        wanted = wanted if isinstance(wanted, list) else [wanted]
+        if name == "warning":
+            if not m["df"] or not any(w in m["df"].split(", ") for w in wanted):
+                return False
+        elif name == "season":
+            if not any(s in m["s"] for s in wanted):
+                return False
+        elif m[{"mutator": "bf", "type": "t", "biome": "b", "secondary": "so",
+                 "length": "l", "complexity": "c"}[name]] not in wanted:
+            return False
+    return True
+
+
+def mode_filter_dicts(sources, work: Path, base_json: Path) -> tuple[int, int]:
+    data = [(ts, ms) for ts, ms in iter_file_items(base_json) if ms and isinstance(ms, list)]
+    for _ in range(FILTER_REPEAT):
+        for query in FILTER_QUERIES:
+            sum(1 for _, ms in data for m in ms if _dict_match(m, query))
+    rows = sum(len(ms) for _, ms in data)
+    return rows * FILTER_REPEAT * len(FILTER_QUERIES), 0
+
+
+def mode_filter_store(sources, work: Path, base_json: Path) -> tuple[int, int]:
+    store = SlotStore.load(base_json)
+    for _ in range(FILTER_REPEAT):
+        for query in FILTER_QUERIES:
+            store.count(**query)
+    return len(store) * FILTER_REPEAT * len(FILTER_QUERIES), 0
+
+
+MODES = {
+    "legacy": mode_legacy,
+    "json": mode_json,
+    "packed": mode_packed,
+    "shards-slot": _mode_shards("slot"),
+    "shards-hour": _mode_shards("hour"),
+    "index": mode_index,
+    "archive": mode_archive,
+    "artifacts": mode_artifacts,
+    "deep-dive": mode_deep_dive,
+    "e2e": mode_e2e,
+    "select": mode_select,
+    "filter-dicts": mode_filter_dicts,
+    "filter-store": mode_filter_store,
+}
+
+
+# ── 측정 ──────────────────────────────────────────────────────────────────────
+def _max_rss() -> int | None:
+    """현재 프로세스 최대 RSS (바이트). Linux 는 KB, macOS 는 바이트 단위로 돌려준다."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def _run_mode(mode: str, sources: list[tuple[str, Path]], base_json: str) -> dict:
+    """spawn 된 자식 프로세스에서 모드 하나를 실행하고 측정값을 돌려준다."""
+    rss_base = _max_rss()
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        records, out_bytes = MODES[mode](sources, Path(tmp), Path(base_json))
+        elapsed = time.perf_counter() - started
+    return {
+        "records": records,
+        "seconds": elapsed,
+        "records_per_sec": records / elapsed if elapsed else None,
+        "peak_rss_bytes": _max_rss(),
+        "base_rss_bytes": rss_base,
+        "output_bytes": out_bytes,
+    }
+
+
+def measure(mode: str, sources: list[tuple[str, Path]], base_json: Path) -> dict:
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+        return pool.submit(_run_mode, mode, sources, str(base_json)).result()
+
+
+def compare(previous: dict, current: dict) -> list[str]:
+    """이전 결과 대비 시간 / 최대 RSS / 출력 크기 비율 (출력용 문자열 줄)."""
+    def key(r):
+        return r["days"], r["mode"]
+    before = {key(r): r for r in previous.get("results", [])}
+    lines = []
+    for r in current["results"]:
+        p = before.get(key(r))
+        if not p:
+            continue
+        cells = []
+        flagged = False
+        for field, label in (("seconds", "time"), ("peak_rss_bytes", "rss"), ("output_bytes", "bytes")):
+            if p.get(field) and r.get(field):
+                ratio = r[field] / p[field]
+                flagged |= ratio >= REGRESSION_RATIO
+                cells.append(f"{label} {ratio:>5.2f}x")
+        mark = "⚠" if flagged else " "
+        lines.append(f"  {mark} {r['days']:>4}일 {r['mode']:12} " + "  ".join(cells))
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="미션 데이터 파이프라인 출력 모드별 처리량 / 메모리 / 크기 벤치마크")
+    parser.add_argument("--days", type=int, nargs="+", default=[2, 7, 28], help="비교할 일수 목록")
+    parser.add_argument("--slots", type=int, default=48, help="하루 타임슬롯 수 (기본 48 = 30분)")
+    parser.add_argument("--biomes", type=int, default=5, help="슬롯당 바이옴 수 (최대 11)")
+    parser.add_argument("--per-biome", type=int, default=5, help="바이옴당 미션 수")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 시드")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES), help="실행할 모드")
+    parser.add_argument("--out", type=Path, help="결과 JSON 경로 (기본 .cache/bench/bench-<UTC시각>.json)")
+    parser.add_argument("--compare", type=Path, help="이전 결과 JSON 과 비교")
+    args = parser.parse_args()
+    args.biomes = min(args.biomes, len(BIOMES))
+
+    doc = {
+        "v": RESULTS_VERSION,
+        "created": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "slots": args.slots, "biomes": args.biomes, "per_biome": args.per_biome,
+            "seed": args.seed, "dd_fixture": DD_FIXTURE.name,
+        },
+        "results": [],
+        "checks": [],
+    }
+
+    print(f"{'days':>5} {'mode':>12} {'records':>9} {'sec':>8} {'rec/s':>10} {'RSS MB':>7} {'out KB':>9}")
+    print("─" * 66)
+    for days in args.days:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            sources = write_fixture(root, days, args.seed, args.slots, args.biomes, args.per_biome)
+            base_json = root / "daily_missions.json"
+            run_streaming(sources, base_json)
+
+            for mode in args.modes:
+                r = {"days": days, "mode": mode, **measure(mode, sources, base_json)}
+                doc["results"].append(r)
+                rss = f"{r['peak_rss_bytes'] / 1e6:>7.1f}" if r["peak_rss_bytes"] else f"{'n/a':>7}"
+                rate = f"{r['records_per_sec']:>10.0f}" if r["records_per_sec"] else f"{'-':>10}"
+                print(f"{days:>5} {mode:>12} {r['records']:>9} {r['seconds']:>8.3f} {rate} "
+                      f"{rss} {r['output_bytes'] // 1024:>9}")
+
+            if "legacy" in args.modes:
+                legacy = root / "legacy.json"
+                run_in_memory(sources, legacy)
+                # 스트리밍은 'dailyDeal' 같은 키를 맨 뒤에 두므로 키 순서가 아니라 내용을 비교한다
+                same = json.loads(legacy.read_bytes()) == json.loads(base_json.read_bytes())
+                doc["checks"].append({"days": days, "legacy_equals_json": same})
+                print(f"{'':>5} {'출력 동일':>10} {same}")
+
+    out = args.out or RESULTS_DIR / f"bench-{doc['created'].replace(':', '')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(doc, ensure_ascii=False, indent=1), encoding="utf-8")
+    print(f"\n📝 결과 저장: {out}")
+
+    if args.compare:
+        previous = json.loads(args.compare.read_text(encoding="utf-8"))
+        print(f"\n📊 {args.compare} 대비 (⚠ = {REGRESSION_RATIO}배 이상)")
+        for line in compare(previous, doc):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+scripts/deep_dive_history.py
+Deep Dive 주간 이력 조회 CLI
+
+fetch_daily_missions.py 가 실행마다 이번 주 Deep Dive 를 쌓아 두는 data/deep_dive_history.json 을
+조회합니다. 지난 주들은 fetch_daily_missions.py --dd-since <날짜> 로 한 번 백필하세요.
+
+사용법:
+  python scripts/deep_dive_history.py last --kind elite --biome "Hollow Bough"   # 가장 최근 등장
+  python scripts/deep_dive_history.py list --warning "Low Oxygen" --limit 10
+  python scripts/deep_dive_history.py list --type "Deep Scan" --kind normal
+  python scripts/deep_dive_history.py show 2026-10-15                             # 그 주의 스테이지
+  python scripts/deep_dive_history.py info                                        # 보관 범위
+"""
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+from drg_data.deep_dives import INDEXED, KINDS, DeepDiveHistory
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_HISTORY = BASE_DIR / "data" / "deep_dive_history.json"
+
+
+def _print_dive(history: DeepDiveHistory, week: str, kind: str, stages: bool = False) -> None:
+    dive = history.dive(week, kind)
+    print(f"  {week}  {kind:6}  {dive['b'] or '-':28} {dive['cn'] or '-'}")
+    if stages:
+        for i, s in enumerate(dive["stages"], 1):
+            print(f"      {i}. {s['t'] or '-':20} {s['so'] or '-':26} L{s['l']} C{s['c']}  {s['df'] or '-'}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Deep Dive 주간 이력 조회")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY,
+                        help="이력 파일 (기본 data/deep_dive_history.json)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("info", help="보관 중인 주 범위")
+    p_show = sub.add_parser("show", help="한 주의 Normal / Elite 스테이지")
+    p_show.add_argument("week", help="리셋 날짜 (목요일, 예: 2026-10-15)")
+
+    for name, help_text in (("last", "조건에 맞는 가장 최근 다이브"),
+                            ("list", "조건에 맞는 다이브 목록 (최신부터)")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("--kind", choices=list(KINDS))
+        for attr in INDEXED:
+            p.add_argument(f"--{attr}")
+        p.add_argument("--stages", action="store_true", help="스테이지까지 출력")
+        if name == "list":
+            p.add_argument("--limit", type=int, default=20)
+
+    args = parser.parse_args()
+    started = time.perf_counter()
+    history = DeepDiveHistory.load(args.history)
+
+    if args.command == "info":
+        weeks = history.weeks
+        span = f"{weeks[0]} ~ {weeks[-1]}" if weeks else "비어 있음"
+        print(f"🗓 {args.history}: {len(weeks)}주 ({span})")
+    elif args.command == "show":
+        if args.week not in history:
+            print(f"❌ 이력에 없는 주: {args.week}")
+            sys.exit(1)
+        for kind in KINDS:
+            if history.dive(args.week, kind):
+                _print_dive(history, args.week, kind, stages=True)
+    else:
+        filters = {attr: getattr(args, attr) for attr in INDEXED if getattr(args, attr) is not None}
+        found = history.find(args.kind, **filters)
+        if args.command == "last":
+            found = found[:1]
+            if not found:
+                print("조건에 맞는 다이브가 없습니다.")
+        else:
+            print(f"{len(found)}건")
+            found = found[:args.limit]
+        for week, kind in found:
+            _print_dive(history, week, kind, stages=args.stages)
+
+    print(f"⏱ {(time.perf_counter() - started) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
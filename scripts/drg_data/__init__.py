@@ -0,0 +1,40 @@
+"""
+scripts/drg_data
+DRG Bosco Terminal — 데이터 파이프라인 공용 모듈
+
+fetch_daily_missions.py / fetch_assets.py 가 함께 사용하는 헬퍼 모음입니다.
+scripts/ 디렉터리에서 실행되는 스크립트가 `from drg_data import ...` 로 가져다 씁니다.
+"""
+
+from . import atlas, codec, deep_dives, delta, imageopt, seasons, shards, timeline
+from .asset_lock import AssetLock
+from .digest import AlarmDigest
+from .http_cache import CachedResponse, HttpCache, fingerprint
+from .index import MissionIndex
+from .metrics import Metrics
+from .missions import Mission, SlotStore
+from .ratelimit import HostRateLimiter, TokenBucket
+from .upcoming import NextOccurrence
+
+__all__ = [
+    "AlarmDigest",
+    "AssetLock",
+    "CachedResponse",
+    "HostRateLimiter",
+    "HttpCache",
+    "Metrics",
+    "Mission",
+    "MissionIndex",
+    "NextOccurrence",
+    "SlotStore",
+    "TokenBucket",
+    "atlas",
+    "codec",
+    "deep_dives",
+    "delta",
+    "fingerprint",
+    "imageopt",
+    "seasons",
+    "shards",
+    "timeline",
+]
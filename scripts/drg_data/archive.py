@@ -0,0 +1,265 @@
+"""
+추가 전용(append-only) 미션 이력 아카이브 (SQLite)
+
+fetch_daily_missions.py 는 매 실행마다 daily_missions.json 을 덮어쓰므로 이력이 남지 않는다.
+이 아카이브에 실행마다 슬롯을 병합해 두면 "지난 90일간 Double XP Industrial Sabotage 가
+몇 번 나왔나" 같은 범위/빈도 질의를 수 ms 안에 답할 수 있다.
+
+테이블
+  missions          고유 미션 (모든 필드가 같으면 같은 미션, key 로 중복 제거)
+  mission_warnings  미션별 주의보 (df 를 ", " 로 나눈 것)
+  mission_seasons   미션별 시즌 태그
+  slot_missions     (슬롯번호, 위치) → 미션 — 슬롯번호 = epoch 초 // 1800
+  slots             기록된 슬롯 (슬롯번호 → 미션 수) — 병합 시 존재 확인, 범위 조회용
+  meta              slot_count 등 누적 카운터 (info 가 테이블을 세지 않도록)
+
+이미 있는 슬롯은 덮어쓰지 않는다. 병합 비용은 새로 들어오는 슬롯 수에만 비례하고,
+span() 은 slots 의 PK 양 끝과 meta 한 행만 읽으므로 아카이브 크기와 무관하다.
+slots / meta 가 없던 예전 아카이브는 처음 열 때 한 번만 slot_missions 에서 채운다.
+
+CI 에서 아카이브는 actions/cache 가 아니라 GitHub 릴리스 "archive" 의 자산으로 보관한다
+(캐시는 7일 미사용 등으로 지워질 수 있고, 그러면 이력이 조용히 처음부터 다시 쌓인다).
+"""
+
+import hashlib
+import json
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+
+from .codec import CodecError, mission_key, slot_index, slot_key
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS missions (
+    id          INTEGER PRIMARY KEY,
+    key         BLOB NOT NULL UNIQUE,    -- sha256(미션 동일성 키)[:16]
+    biome       TEXT,
+    type        TEXT,
+    secondary   TEXT,
+    codename    TEXT,
+    length      INTEGER,
+    complexity  INTEGER,
+    mutator     TEXT,
+    warnings    TEXT
+);
+CREATE TABLE IF NOT EXISTS mission_warnings (
+    mission_id  INTEGER NOT NULL REFERENCES missions(id),
+    warning     TEXT NOT NULL,
+    PRIMARY KEY (mission_id, warning)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS mission_seasons (
+    mission_id  INTEGER NOT NULL REFERENCES missions(id),
+    season      TEXT NOT NULL,
+    pos         INTEGER NOT NULL,
+    PRIMARY KEY (mission_id, season)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS slot_missions (
+    slot        INTEGER NOT NULL,
+    pos         INTEGER NOT NULL,
+    mission_id  INTEGER NOT NULL REFERENCES missions(id),
+    PRIMARY KEY (slot, pos)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS slots (
+    slot        INTEGER PRIMARY KEY,
+    missions    INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key         TEXT PRIMARY KEY,
+    value       INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_missions_mutator ON missions(mutator, type);
+CREATE INDEX IF NOT EXISTS idx_missions_type    ON missions(type, biome);
+CREATE INDEX IF NOT EXISTS idx_missions_biome   ON missions(biome);
+CREATE INDEX IF NOT EXISTS idx_missions_second  ON missions(secondary);
+CREATE INDEX IF NOT EXISTS idx_warnings_name    ON mission_warnings(warning, mission_id);
+CREATE INDEX IF NOT EXISTS idx_seasons_name     ON mission_seasons(season, mission_id);
+CREATE INDEX IF NOT EXISTS idx_slot_mission     ON slot_missions(mission_id, slot);
+"""
+
+# 질의 필터 이름 → SQL 조건 (m = missions, sm = slot_missions)
+FILTERS = {
+    "mutator":   "m.mutator = ?",
+    "type":      "m.type = ?",
+    "biome":     "m.biome = ?",
+    "secondary": "m.secondary = ?",
+    "length":    "m.length = ?",
+    "complexity": "m.complexity = ?",
+    "warning":   "EXISTS (SELECT 1 FROM mission_warnings w WHERE w.mission_id = m.id AND w.warning = ?)",
+    "season":    "EXISTS (SELECT 1 FROM mission_seasons s WHERE s.mission_id = m.id AND s.season = ?)",
+}
+
+# 빈도 집계 기준 → 컬럼
+GROUP_COLUMNS = {
+    "mutator": "m.mutator",
+    "type": "m.type",
+    "biome": "m.biome",
+    "secondary": "m.secondary",
+    "warning": "w.warning",
+}
+
+
+class MissionArchive:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute("PRAGMA synchronous = NORMAL")
+        self.db.executescript(SCHEMA)
+        self._backfill_slots()
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self) -> "MissionArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _backfill_slots(self) -> None:
+        """slots / meta 가 생기기 전의 아카이브 — 한 번만 slot_missions 를 훑어 채운다."""
+        if self.db.execute("SELECT 1 FROM meta WHERE key = 'slot_count'").fetchone():
+            return
+        with self.db:
+            self.db.execute(
+                "INSERT OR IGNORE INTO slots (slot, missions)"
+                " SELECT slot, COUNT(*) FROM slot_missions GROUP BY slot"
+            )
+            self.db.execute(
+                "INSERT INTO meta (key, value) SELECT 'slot_count', COUNT(*) FROM slots"
+            )
+
+    # ── 병합 ──────────────────────────────────────────────────────────────────
+    def _mission_id(self, m: dict, cache: dict[bytes, int]) -> int:
+        key = hashlib.sha256(json.dumps(mission_key(m), ensure_ascii=False).encode("utf-8")).digest()[:16]
+        if key in cache:
+            return cache[key]
+        row = self.db.execute("SELECT id FROM missions WHERE key = ?", (key,)).fetchone()
+        if row:
+            cache[key] = row[0]
+            return row[0]
+        cur = self.db.execute(
+            "INSERT INTO missions (key, biome, type, secondary, codename, length, complexity, mutator, warnings)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, m["b"], m["t"], m["so"], m["cn"], m["l"], m["c"], m["bf"], m["df"]),
+        )
+        mission_id = cur.lastrowid
+        if m["df"]:
+            self.db.executemany(
+                "INSERT OR IGNORE INTO mission_warnings (mission_id, warning) VALUES (?, ?)",
+                [(mission_id, w) for w in m["df"].split(", ")],
+            )
+        self.db.executemany(
+            "INSERT OR IGNORE INTO mission_seasons (mission_id, season, pos) VALUES (?, ?, ?)",
+            [(mission_id, s, i) for i, s in enumerate(m["s"] or ())],
+        )
+        cache[key] = mission_id
+        return mission_id
+
+    def merge(self, slots: Iterable[tuple[str, list[dict]]]) -> tuple[int, int]:
+        """
+        슬롯 스트림을 병합한다. 이미 기록된 슬롯은 건드리지 않는다.
+        반환: (새로 추가된 슬롯 수, 새로 추가된 미션-슬롯 행 수)
+        """
+        new_slots = new_rows = 0
+        cache: dict[bytes, int] = {}
+        with self.db:
+            for ts, missions in slots:
+                try:
+                    slot = slot_index(ts)
+                except CodecError:
+                    continue
+                if self.db.execute("SELECT 1 FROM slots WHERE slot = ?", (slot,)).fetchone():
+                    continue
+                rows = [(slot, pos, self._mission_id(m, cache)) for pos, m in enumerate(missions)]
+                self.db.executemany(
+                    "INSERT OR IGNORE INTO slot_missions (slot, pos, mission_id) VALUES (?, ?, ?)", rows
+                )
+                self.db.execute("INSERT INTO slots (slot, missions) VALUES (?, ?)", (slot, len(rows)))
+                new_slots += 1
+                new_rows += len(rows)
+            if new_slots:
+                self.db.execute("UPDATE meta SET value = value + ? WHERE key = 'slot_count'", (new_slots,))
+        return new_slots, new_rows
+
+    # ── 조회 ──────────────────────────────────────────────────────────────────
+    @staticmethod
+    def _where(filters: dict[str, str | int], start: int | None, end: int | None) -> tuple[str, list]:
+        clauses, params = [], []
+        for name, value in filters.items():
+            if name not in FILTERS:
+                raise ValueError(f"알 수 없는 필터: {name} (가능: {', '.join(FILTERS)})")
+            clauses.append(FILTERS[name])
+            params.append(value)
+        if start is not None:
+            clauses.append("sm.slot >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("sm.slot < ?")
+            params.append(end)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def count(self, filters: dict[str, str | int], start: int | None = None, end: int | None = None) -> dict:
+        """조건에 맞는 등장 횟수, 등장 슬롯 수, 처음/마지막 등장 타임슬롯."""
+        where, params = self._where(filters, start, end)
+        n, slots, first, last = self.db.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT sm.slot), MIN(sm.slot), MAX(sm.slot)"
+            " FROM slot_missions sm JOIN missions m ON m.id = sm.mission_id" + where,
+            params,
+        ).fetchone()
+        return {
+            "occurrences": n,
+            "slots": slots,
+            "first": slot_key(first) if first is not None else None,
+            "last": slot_key(last) if last is not None else None,
+        }
+
+    def frequency(
+        self,
+        by: str,
+        filters: dict[str, str | int],
+        start: int | None = None,
+        end: int | None = None,
+    ) -> list[tuple[str | None, int]]:
+        """by 기준 값별 등장 횟수 (많은 순)."""
+        if by not in GROUP_COLUMNS:
+            raise ValueError(f"알 수 없는 집계 기준: {by} (가능: {', '.join(GROUP_COLUMNS)})")
+        where, params = self._where(filters, start, end)
+        join = " JOIN mission_warnings w ON w.mission_id = m.id" if by == "warning" else ""
+        col = GROUP_COLUMNS[by]
+        return self.db.execute(
+            f"SELECT {col}, COUNT(*) AS n FROM slot_missions sm JOIN missions m ON m.id = sm.mission_id"
+            f"{join}{where} GROUP BY {col} ORDER BY n DESC",
+            params,
+        ).fetchall()
+
+    def occurrences(
+        self,
+        filters: dict[str, str | int],
+        start: int | None = None,
+        end: int | None = None,
+        limit: int = 50,
+    ) -> list[tuple[str, dict]]:
+        """조건에 맞는 (타임슬롯, 레코드) — 최근 순."""
+        where, params = self._where(filters, start, end)
+        rows = self.db.execute(
+            "SELECT sm.slot, m.biome, m.type, m.secondary, m.codename, m.length, m.complexity,"
+            " m.mutator, m.warnings FROM slot_missions sm JOIN missions m ON m.id = sm.mission_id"
+            f"{where} ORDER BY sm.slot DESC, sm.pos LIMIT ?",
+            params + [limit],
+        ).fetchall()
+        fields = ["b", "t", "so", "cn", "l", "c", "bf", "df"]
+        return [(slot_key(r[0]), dict(zip(fields, r[1:]))) for r in rows]
+
+    def span(self) -> tuple[str | None, str | None, int]:
+        """(가장 이른 슬롯, 가장 늦은 슬롯, 슬롯 수)."""
+        # MIN / MAX 를 따로 물어야 각각 PK 한쪽 끝 탐색 (한 SELECT 에 둘이면 전체 스캔)
+        first, last = self.db.execute(
+            "SELECT (SELECT MIN(slot) FROM slots), (SELECT MAX(slot) FROM slots)"
+        ).fetchone()
+        n = self.db.execute("SELECT value FROM meta WHERE key = 'slot_count'").fetchone()[0]
+        return (slot_key(first) if first is not None else None,
+                slot_key(last) if last is not None else None, n)
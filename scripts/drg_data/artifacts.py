@@ -0,0 +1,149 @@
+"""
+정적 호스팅용 사전 압축 + 콘텐츠 해시 파일명 산출물
+
+data/*.json 을 그대로 두고, data/dist/ 아래에 다음을 만든다.
+
+  daily_missions.3f9a1c2b.json        원본 (이름에 sha256 앞 8자리)
+  daily_missions.3f9a1c2b.json.gz     gzip  (표준 라이브러리)
+  daily_missions.3f9a1c2b.json.br     brotli (brotli 패키지가 있을 때)
+  daily_missions.3f9a1c2b.json.zst    zstd  (zstandard 패키지 또는 Python 3.14+ compression.zstd)
+  manifest.json                       논리 이름 → 해시 파일명 / 크기 / sha256 / 인코딩별 파일
+
+해시가 이름에 들어가므로 각 파일은 immutable 캐시 헤더로 서빙할 수 있고,
+클라이언트는 manifest 만 짧게 캐시하면 된다. 직전 manifest 를 아직 들고 있는 클라이언트/CDN 이
+404 를 받지 않도록 직전 세대 파일은 남기고, 현재와 직전 manifest 어디에도 없는 파일만 지운다.
+
+data/dist/ 는 git 에 커밋하지 않는다 (.gitignore). 실행마다 새 해시 변형이 쌓여 저장소가 계속
+커지기 때문이다. CI 는 data-dist 브랜치에서 직전 산출물을 받아 와 이 함수를 돌린 뒤,
+결과를 같은 브랜치에 단일 커밋(force_orphan)으로 게시한다. 그 브랜치 크기는 최대 두 세대
+(현재 + 직전) 분량으로 고정된다.
+"""
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+from .jsonstream import write_if_changed
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def _gzip(data: bytes) -> bytes:
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return lambda data: brotli.compress(data, quality=11)
+
+
+def _zstd():
+    try:
+        import zstandard
+        return lambda data: zstandard.ZstdCompressor(level=19).compress(data)
+    except ImportError:
+        pass
+    try:
+        from compression import zstd   # Python 3.14+
+        return lambda data: zstd.compress(data, level=19)
+    except ImportError:
+        return None
+
+
+def available_encodings() -> dict[str, tuple[str, object]]:
+    """인코딩 이름 → (확장자, 압축 함수 또는 None=사용 불가)."""
+    return {
+        "gzip": (".gz", _gzip),
+        "br": (".br", _brotli()),
+        "zstd": (".zst", _zstd()),
+    }
+
+
+def hashed_name(name: str, digest: str) -> str:
+    stem, dot, ext = name.rpartition(".")
+    return f"{stem}.{digest[:8]}.{ext}" if dot else f"{name}.{digest[:8]}"
+
+
+def load_manifest(out_dir: Path) -> dict | None:
+    path = Path(out_dir) / MANIFEST_NAME
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def manifest_paths(manifest: dict | None) -> set[str]:
+    """manifest 가 가리키는 파일 이름 전부 (원본 + 인코딩 변형)."""
+    paths = set()
+    for entry in (manifest or {}).get("files", {}).values():
+        paths.add(entry["path"])
+        paths.update(e["path"] for e in entry["encodings"].values())
+    return paths
+
+
+def build_artifacts(sources: list[Path], out_dir: Path) -> dict:
+    """
+    sources 각각의 해시 파일명 원본 + 압축 변형을 out_dir 에 쓰고 manifest 를 갱신한다.
+    반환: manifest dict (없는 원본은 건너뜀)
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    encodings = available_encodings()
+    previous = load_manifest(out_dir)
+    files = {}
+
+    for src in sources:
+        if not src.exists():
+            continue
+        data = src.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        name = hashed_name(src.name, digest)
+        write_if_changed(out_dir / name, data)
+        entry = {"path": name, "bytes": len(data), "sha256": digest, "encodings": {}}
+        for enc, (ext, compress) in encodings.items():
+            if compress is None:
+                continue
+            path = out_dir / (name + ext)
+            # 같은 해시 이름이면 내용이 같으므로 다시 압축하지 않는다 (brotli 11 / zstd 19 는 느림)
+            if not path.exists():
+                write_if_changed(path, compress(data))
+            entry["encodings"][enc] = {"path": path.name, "bytes": path.stat().st_size}
+        files[src.name] = entry
+
+    manifest = {"v": MANIFEST_VERSION, "files": files}
+    # 현재 + 직전 세대만 남긴다 (직전 manifest 를 캐시한 클라이언트가 받을 파일)
+    keep = manifest_paths(manifest) | manifest_paths(previous) | {MANIFEST_NAME}
+    for path in out_dir.iterdir():
+        if path.is_file() and path.name not in keep:
+            path.unlink()
+
+    write_if_changed(out_dir / MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=1).encode("utf-8"))
+    return manifest
+
+
+def size_report(manifest: dict) -> list[str]:
+    """파일별 원본 대비 인코딩 크기 표 (출력용 문자열 줄)."""
+    encs = list(available_encodings())
+    lines = [f"  {'file':30} {'raw':>9} " + " ".join(f"{e:>15}" for e in encs)]
+    total_raw = 0
+    totals = {e: 0 for e in encs}
+    for logical, entry in manifest["files"].items():
+        raw = entry["bytes"]
+        total_raw += raw
+        cells = []
+        for e in encs:
+            info = entry["encodings"].get(e)
+            if info is None:
+                cells.append(f"{'n/a':>15}")
+                continue
+            totals[e] += info["bytes"]
+            cells.append(f"{info['bytes']:>8} ({info['bytes'] / raw:>4.0%})")
+        lines.append(f"  {logical:30} {raw:>9} " + " ".join(cells))
+    cells = [f"{totals[e]:>8} ({totals[e] / total_raw:>4.0%})" if totals[e] else f"{'n/a':>15}" for e in encs]
+    lines.append(f"  {'합계':28} {total_raw:>9} " + " ".join(cells))
+    return lines
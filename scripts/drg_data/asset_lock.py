@@ -0,0 +1,107 @@
+"""
+에셋 해석 결과 잠금 파일 (fetch_assets.py 재실행 시 검색 생략 + 조건부 재다운로드용)
+
+구조 (scripts/assets.lock.json, 커밋 대상):
+  {
+    "v": 1,
+    "categories": {
+      "<category>": {
+        "<이름>": {
+          "source":  "direct" | "search" | "manual",
+          "file":    위키 파일명 (manual 은 null),
+          "url":     CDN 다운로드 URL,
+          "etag", "last_modified", "size", "sha256":  원본 검증 정보 (조건부 GET 용),
+          "profile":    앱 에셋 생성 설정 (imageopt.profile 또는 "copy"),
+          "built_from": 앱 에셋을 만든 원본의 sha256,
+          "outputs":    {앱 에셋 경로(assets/ 아래): {"bytes", "sha256"}}
+        }
+      }
+    }
+  }
+
+원본은 .cache/assets/ (커밋 안 함) 에만 있으므로 경로를 기록하지 않고, 검증(--verify)은
+커밋된 앱 에셋(outputs) 만 대조한다 — 새로 받은 저장소에서도 그대로 돈다.
+위키 해석 전에 기존 앱 에셋만 등록한 항목(fetch_assets.py --lock-existing)은 outputs 만 있다.
+
+키를 정렬해서 저장하므로 변경이 없으면 파일 바이트도 그대로 유지된다.
+"""
+
+import json
+import threading
+from pathlib import Path
+
+from .jsonstream import file_sha256, write_if_changed
+
+LOCK_VERSION = 1
+
+
+class AssetLock:
+    """카테고리 → 이름 → 해석/검증 정보. 여러 스레드에서 동시에 갱신해도 안전하다."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._categories: dict[str, dict[str, dict]] = {}
+        if self.path.exists():
+            doc = json.loads(self.path.read_text(encoding="utf-8"))
+            if doc.get("v") == LOCK_VERSION:
+                self._categories = doc.get("categories", {})
+
+    def get(self, category: str, name: str) -> dict | None:
+        with self._lock:
+            entry = self._categories.get(category, {}).get(name)
+            return dict(entry) if entry else None
+
+    def put(self, category: str, name: str, entry: dict) -> None:
+        with self._lock:
+            self._categories.setdefault(category, {})[name] = dict(entry)
+
+    def drop(self, category: str, name: str) -> None:
+        with self._lock:
+            self._categories.get(category, {}).pop(name, None)
+
+    def entries(self, category: str) -> dict[str, dict]:
+        with self._lock:
+            return {name: dict(e) for name, e in self._categories.get(category, {}).items()}
+
+    def save(self) -> bool:
+        """변경이 있을 때만 원자적으로 저장. 반환: 실제로 썼는지."""
+        with self._lock:
+            doc = {"v": LOCK_VERSION, "categories": self._categories}
+            data = json.dumps(doc, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+        return write_if_changed(self.path, data.encode("utf-8"))
+
+
+def verify_raw(path: Path, entry: dict) -> str | None:
+    """캐시된 원본 파일을 잠금 기록과 대조 (조건부 GET 전 확인). 반환: 문제 설명, 정상이면 None."""
+    path = Path(path)
+    if not path.exists():
+        return "파일 없음"
+    size = path.stat().st_size
+    if size != entry.get("size"):
+        return f"크기 불일치 ({size} != {entry.get('size')})"
+    if file_sha256(path) != entry.get("sha256"):
+        return "sha256 불일치"
+    return None
+
+
+def output_record(base_dir: Path, paths: list[Path]) -> dict[str, dict]:
+    """앱 에셋 파일들 → outputs 기록 {저장소 루트 기준 경로: {"bytes", "sha256"}}."""
+    return {
+        Path(p).relative_to(base_dir).as_posix(): {"bytes": Path(p).stat().st_size, "sha256": file_sha256(p)}
+        for p in paths
+    }
+
+
+def verify_outputs(base_dir: Path, entry: dict) -> str | None:
+    """앱 에셋 출력 파일들을 잠금 기록과 대조. 반환: 첫 번째 문제 설명, 정상이면 None."""
+    outputs = entry.get("outputs")
+    if not outputs:
+        return "출력 기록 없음"
+    for rel, info in outputs.items():
+        path = Path(base_dir) / rel
+        if not path.exists():
+            return f"{rel} 없음"
+        if path.stat().st_size != info["bytes"] or file_sha256(path) != info["sha256"]:
+            return f"{rel} sha256 불일치"
+    return None
@@ -0,0 +1,166 @@
+"""
+아이콘 스프라이트 아틀라스 패킹 (Pillow 필요)
+
+아이콘 패밀리(폴더) 하나 → 아틀라스 이미지 하나 + 좌표 manifest.
+같은 픽셀의 아이콘은 한 번만 싣는다. 패밀리를 넘는 중복(예: mutators/ 와 warnings/ 의
+shield_disruption)은 먼저 처리한 패밀리의 아틀라스에만 들어가고, 나머지 패밀리의
+스프라이트는 그 아틀라스의 같은 사각형을 가리킨다.
+
+manifest.json:
+  {
+    "v": 1,
+    "atlases": {"<family>": {"file", "density", "width", "height", "bytes", "sha256"}},
+    "sprites": {"<family>": {"<snake 이름>": {"atlas", "x", "y", "w", "h"}}}
+  }
+"""
+
+import hashlib
+import io
+import json
+import math
+from dataclasses import dataclass
+from pathlib import Path
+
+from .jsonstream import write_if_changed
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+PADDING = 2   # 스프라이트 사이 여백 (필터링 시 옆 아이콘 번짐 방지)
+
+
+def available() -> bool:
+    return Image is not None
+
+
+@dataclass
+class Sprite:
+    name: str
+    family: str
+    image: object          # PIL.Image (RGBA)
+    digest: str            # 크기 + RGBA 픽셀 sha256 — 재인코딩된 같은 아이콘도 잡는다
+    src_bytes: int
+    x: int = 0
+    y: int = 0
+
+
+def load_sprite(path: Path, family: str, max_size: int) -> Sprite:
+    """아이콘 하나를 RGBA 로 읽고, 긴 변이 max_size 를 넘으면 비율 유지 축소."""
+    with Image.open(path) as im:
+        im = im.convert("RGBA")
+    if max(im.size) > max_size:
+        im.thumbnail((max_size, max_size), Image.LANCZOS)
+    digest = hashlib.sha256(f"{im.size}".encode() + im.tobytes()).hexdigest()
+    return Sprite(path.stem, family, im, digest, path.stat().st_size)
+
+
+def shelf_pack(sprites: list[Sprite]) -> tuple[int, int]:
+    """
+    높이 순 선반(shelf) 패킹. sprite.x / sprite.y 를 채우고 (가로, 세로) 를 돌려준다.
+    가로는 전체 면적의 제곱근 근처(최소 가장 넓은 아이콘)로 잡아 정사각형에 가깝게 만든다.
+    """
+    if not sprites:
+        return 0, 0
+    cells = [(s.image.width + PADDING, s.image.height + PADDING) for s in sprites]
+    area = sum(w * h for w, h in cells)
+    width = max(max(w for w, _ in cells), math.ceil(math.sqrt(area * 1.1)))
+    width = (width + 3) // 4 * 4
+
+    x = y = shelf_h = 0
+    order = sorted(range(len(sprites)), key=lambda i: (-cells[i][1], -cells[i][0], sprites[i].name))
+    for i in order:
+        w, h = cells[i]
+        if x + w > width:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        sprites[i].x, sprites[i].y = x, y
+        x += w
+        shelf_h = max(shelf_h, h)
+    return width, y + shelf_h
+
+
+def render(sprites: list[Sprite], size: tuple[int, int], fmt: str) -> bytes:
+    atlas = Image.new("RGBA", size, (0, 0, 0, 0))
+    for s in sprites:
+        atlas.paste(s.image, (s.x, s.y))
+    buf = io.BytesIO()
+    if fmt == "webp":
+        atlas.save(buf, "WEBP", lossless=True, method=6)
+    else:
+        atlas.save(buf, "PNG", optimize=True)
+    return buf.getvalue()
+
+
+def build_atlases(
+    families: dict[str, Path],
+    out_dir: Path,
+    max_size: int = 128,
+    fmt: str = "png",
+    density: int = 1,
+) -> tuple[dict, dict[str, dict[str, int]]]:
+    """
+    families: {패밀리 이름: 아이콘 폴더} — 순서대로 처리 (앞쪽 패밀리가 중복 아이콘을 소유).
+    density > 1 이면 폴더의 <density>.0x/ 변형이 있는 아이콘은 그것을 쓴다 (없으면 1x).
+    반환: (manifest, 패밀리별 통계 {"icons", "packed", "src_bytes", "atlas_bytes"})
+    """
+    out_dir = Path(out_dir)
+    previous = load_manifest(out_dir) if (out_dir / MANIFEST_NAME).exists() else {}
+    owners: dict[str, Sprite] = {}
+    manifest: dict = {"v": MANIFEST_VERSION, "atlases": {}, "sprites": {}}
+    stats: dict[str, dict[str, int]] = {}
+
+    for family, folder in families.items():
+        packed: list[Sprite] = []
+        entries: dict[str, Sprite] = {}
+        src_bytes = 0
+        for path in sorted(Path(folder).glob("*.png")):
+            variant = path.parent / f"{density}.0x" / path.name
+            sprite = load_sprite(variant if density > 1 and variant.exists() else path, family, max_size)
+            src_bytes += sprite.src_bytes
+            owner = owners.setdefault(sprite.digest, sprite)
+            if owner is sprite:
+                packed.append(sprite)
+            entries[sprite.name] = owner
+
+        width, height = shelf_pack(packed)
+        atlas_bytes = 0
+        if packed:
+            data = render(packed, (width, height), fmt)
+            file_name = f"{family}.{fmt}"
+            write_if_changed(out_dir / file_name, data)
+            atlas_bytes = len(data)
+            manifest["atlases"][family] = {
+                "file": file_name,
+                "density": density,
+                "width": width,
+                "height": height,
+                "bytes": atlas_bytes,
+                "sha256": hashlib.sha256(data).hexdigest(),
+            }
+        manifest["sprites"][family] = {
+            name: {"atlas": s.family, "x": s.x, "y": s.y, "w": s.image.width, "h": s.image.height}
+            for name, s in entries.items()
+        }
+        stats[family] = {
+            "icons": len(entries),
+            "packed": len(packed),
+            "src_bytes": src_bytes,
+            "atlas_bytes": atlas_bytes,
+        }
+
+    # 직전 manifest 에 있던 아틀라스 중 이번에 만들지 않은 것만 정리 (--out 의 다른 파일은 건드리지 않는다)
+    keep = {a["file"] for a in manifest["atlases"].values()}
+    for info in previous.get("atlases", {}).values():
+        if info["file"] not in keep:
+            (out_dir / Path(info["file"]).name).unlink(missing_ok=True)
+
+    data = json.dumps(manifest, ensure_ascii=False, indent=1, sort_keys=True) + "\n"
+    write_if_changed(out_dir / MANIFEST_NAME, data.encode("utf-8"))
+    return manifest, stats
+
+
+def load_manifest(out_dir: Path) -> dict:
+    return json.loads((Path(out_dir) / MANIFEST_NAME).read_text(encoding="utf-8"))
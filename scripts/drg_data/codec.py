@@ -0,0 +1,293 @@
+"""
+daily_missions.json 사전 인코딩(packed) 포맷 인코더 / 디코더
+
+기존 포맷은 바이옴·미션 타입·변이·주의보 이름과 시즌 태그, ISO 타임슬롯 키가
+레코드마다 반복된다. packed 포맷은 이를 다음과 같이 줄인다.
+
+  {
+    "v": 4,                                   스키마 버전
+    "slot_minutes": 30,
+    "fields": ["b","t","so","cn","l","c","bf","df","s"],
+    "tables": {"b": [...], "t": [...], ...},  필드별 문자열 테이블 (정렬)
+    "seasons": ["s0","s1","s3","s6"],         시즌 비트 순서
+    "missions": {"<미션ID>": [b,t,so,cn,l,c,bf,df,시즌마스크], ...},   고유 미션 테이블 (ID 순)
+    "slots": [[슬롯번호, [미션ID, ...]], ...]
+  }
+
+  - 문자열 필드는 테이블 인덱스, null 은 -1
+  - 시즌 목록은 seasons 순서의 비트마스크, "s": null(원본 included_in: null)은 -1 ([] 는 0)
+  - 같은 미션(모든 필드 동일)이 여러 슬롯에 걸쳐 유지되므로 missions 에 한 번만 싣고
+    슬롯은 미션ID 만 가진다. 미션ID 는 미션 내용(문자열 값 그대로)의 blake2b 48비트 해시라
+    실행마다 같은 미션은 같은 ID 다 (테이블 인덱스, 등장 순서, 함께 실린 다른 미션과 무관).
+    48비트는 JSON 숫자로 정확히 표현되는 범위(2^53) 안이고, 수천 개 미션에서 충돌 확률은
+    1e-8 수준이다. 그래도 충돌하면 ID 를 바꿔 맞추지 않고 CodecError 로 실패한다
+  - 슬롯번호 = epoch 초 // 1800 (30분 단위)
+  - 타임슬롯이 아닌 키(원본의 'dailyDeal' 등)는 문자열 그대로 둔다
+
+v2 는 미션 테이블 없이 슬롯마다 행을 직접 싣는 형식이다
+("slots": [[슬롯번호, [[b,t,...], ...]], ...]). 인코더는 기본으로 v2 를 내고,
+v4 는 intern=True 로 명시할 때만 쓴다. 실데이터(data/daily_missions.json, 97 슬롯)는
+2514 레코드 중 고유 미션이 2498 개(1.006배)로 미션이 슬롯을 거의 이어가지 않아,
+v4 가 v2 보다 원본 62% · gzip 후 2.2배 크다. 중복 제거 비율은 --packed 실행마다
+출력되므로 데이터 성격이 바뀌면 그 수치로 다시 판단한다.
+v3 는 v4 와 같되 missions 가 목록이고 미션ID 가 첫 등장 순서 인덱스였다 (실행마다 바뀜).
+디코더는 v2 / v3 / v4 를 모두 읽는다.
+
+decode(encode(data)) 는 원본과 키 순서·값·JSON 바이트까지 동일하다.
+"""
+
+import hashlib
+import json
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime, timezone
+from typing import Any
+
+SCHEMA_VERSION = 4
+SUPPORTED_VERSIONS = (2, 3, 4)
+ID_BITS = 48   # 미션ID 해시 폭 — JSON 숫자(2^53) 안에서 충돌이 사실상 없는 크기
+SLOT_MINUTES = 30
+SLOT_SECONDS = SLOT_MINUTES * 60
+TIME_KEY_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+FIELDS = ["b", "t", "so", "cn", "l", "c", "bf", "df", "s"]
+STRING_FIELDS = ["b", "t", "so", "cn", "bf", "df"]
+NULL = -1
+
+Slots = Iterable[tuple[str, list[dict]]]
+
+
+class CodecError(ValueError):
+    """packed 포맷으로 정확히 표현할 수 없는 입력."""
+
+
+# ── 타임슬롯 키 ↔ 슬롯번호 ─────────────────────────────────────────────────────
+def slot_index(time_key: str) -> int:
+    """'2026-03-02T00:30:00Z' → epoch 초 // 1800."""
+    try:
+        dt = datetime.strptime(time_key, TIME_KEY_FORMAT).replace(tzinfo=timezone.utc)
+    except ValueError as e:
+        raise CodecError(f"타임슬롯 키 형식 오류: {time_key}") from e
+    epoch = int(dt.timestamp())
+    if epoch % SLOT_SECONDS or slot_key(epoch // SLOT_SECONDS) != time_key:
+        raise CodecError(f"30분 경계가 아닌 타임슬롯: {time_key}")
+    return epoch // SLOT_SECONDS
+
+
+def slot_key(index: int) -> str:
+    """슬롯번호 → 'YYYY-MM-DDTHH:MM:00Z' (MissionService._getTimeKey 와 같은 형식)."""
+    return datetime.fromtimestamp(index * SLOT_SECONDS, tz=timezone.utc).strftime(TIME_KEY_FORMAT)
+
+
+def _encode_key(time_key: str) -> int | str:
+    """타임슬롯 키면 슬롯번호, 아니면('dailyDeal' 등) 문자열 그대로."""
+    try:
+        return slot_index(time_key)
+    except CodecError:
+        return time_key
+
+
+def _decode_key(key: int | str) -> str:
+    return key if isinstance(key, str) else slot_key(key)
+
+
+def _season_sort_key(tag: str):
+    num = tag[1:]
+    return (0, int(num), tag) if num.isdigit() else (1, 0, tag)
+
+
+# ── 인코딩 ────────────────────────────────────────────────────────────────────
+def mission_key(m: dict) -> tuple:
+    """미션 동일성 키 — 모든 필드가 같으면 같은 미션."""
+    return tuple((tuple(m[f]) if m[f] is not None else None) if f == "s" else m[f] for f in FIELDS)
+
+
+class PackStats:
+    """인코딩 1회의 중복 제거 통계."""
+    __slots__ = ("records", "unique")
+
+    def __init__(self):
+        self.records = 0
+        self.unique = 0
+
+    @property
+    def ratio(self) -> float:
+        return self.records / self.unique if self.unique else 1.0
+
+
+def content_id(key: tuple) -> int:
+    """미션 동일성 키 → 내용 해시 ID (ID_BITS 비트)."""
+    data = json.dumps(key, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=ID_BITS // 8).digest(), "big")
+
+
+def assign_ids(keys: Iterable[tuple]) -> dict[tuple, int]:
+    """
+    미션 키 → 미션ID (content_id 그대로). ID 가 다른 키 집합에 좌우되지 않도록
+    충돌을 다른 값으로 옮기지 않고 CodecError 로 알린다.
+    """
+    ids: dict[tuple, int] = {}
+    owner: dict[int, tuple] = {}
+    for key in keys:
+        mid = content_id(key)
+        if owner.setdefault(mid, key) != key:
+            raise CodecError(f"미션ID 해시 충돌: {mid} ({owner[mid]} / {key})")
+        ids[key] = mid
+    return ids
+
+
+class Tables:
+    """필드별 문자열 테이블 + 시즌 테이블 + 고유 미션 테이블 (미션ID 순)."""
+
+    def __init__(self, strings: dict[str, list[str]], seasons: list[str], missions: list[dict]):
+        self.strings = strings
+        self.seasons = seasons
+        self._index = {f: {v: i for i, v in enumerate(vals)} for f, vals in strings.items()}
+        self._season_bit = {tag: i for i, tag in enumerate(seasons)}
+        by_key = {mission_key(m): m for m in missions}
+        self._mission_id = assign_ids(by_key)
+        self.missions = sorted(missions, key=self.mission_id)
+
+    @classmethod
+    def build(cls, slots: Slots, stats: PackStats | None = None) -> "Tables":
+        values: dict[str, set[str]] = {f: set() for f in STRING_FIELDS}
+        seasons: set[str] = set()
+        unique: dict[tuple, dict] = {}
+        records = 0
+        for _, missions in slots:
+            for m in missions:
+                records += 1
+                key = mission_key(m)
+                if key in unique:
+                    continue
+                unique[key] = m
+                for f in STRING_FIELDS:
+                    if m[f] is not None:
+                        values[f].add(m[f])
+                seasons.update(m["s"] or ())
+        if stats is not None:
+            stats.records = records
+            stats.unique = len(unique)
+        return cls(
+            {f: sorted(v) for f, v in values.items()},
+            sorted(seasons, key=_season_sort_key),
+            list(unique.values()),
+        )
+
+    def mission_id(self, m: dict) -> int:
+        return self._mission_id[mission_key(m)]
+
+    def season_mask(self, tags: list[str] | None) -> int:
+        if tags is None:
+            return NULL
+        if not isinstance(tags, list):
+            raise CodecError(f"시즌 목록은 리스트 또는 null 이어야 합니다: {tags!r}")
+        mask = 0
+        for tag in tags:
+            mask |= 1 << self._season_bit[tag]
+        # 비트마스크는 순서·중복을 담지 못하므로 정규 순서일 때만 허용
+        if season_tags(self.seasons, mask) != tags:
+            raise CodecError(f"정규 순서가 아닌 시즌 목록: {tags}")
+        return mask
+
+    def encode_mission(self, m: dict) -> list[int]:
+        if list(m) != FIELDS:
+            raise CodecError(f"예상하지 못한 레코드 키: {list(m)}")
+        row = []
+        for f in FIELDS:
+            v = m[f]
+            if f == "s":
+                row.append(self.season_mask(v))
+            elif f in ("l", "c"):
+                if type(v) is not int:
+                    raise CodecError(f"{f} 는 정수여야 합니다: {v!r}")
+                row.append(v)
+            else:
+                row.append(NULL if v is None else self._index[f][v])
+        return row
+
+
+def encode_items(
+    slots_factory: Callable[[], Slots],
+    stats: PackStats | None = None,
+    intern: bool = False,
+) -> Iterator[tuple[str, Any]]:
+    """
+    packed 문서의 (키, 값) 을 순서대로 yield — jsonstream.write_object_stream 에 바로 넘긴다.
+    slots_factory 는 호출할 때마다 같은 슬롯 이터러블을 새로 돌려줘야 한다
+    (1회차: 테이블·고유 미션 수집, 2회차: 슬롯별 행/미션ID). "slots" 값은 제너레이터로 내보낸다.
+
+    intern: True → v4 (미션 테이블 + 내용 해시 ID), False → v2 (슬롯별 행, 기본)
+    """
+    stats = stats if stats is not None else PackStats()
+    tables = Tables.build(slots_factory(), stats)
+
+    yield "v", SCHEMA_VERSION if intern else 2
+    yield "slot_minutes", SLOT_MINUTES
+    yield "fields", FIELDS
+    yield "tables", tables.strings
+    yield "seasons", tables.seasons
+    if intern:
+        yield "missions", {str(tables.mission_id(m)): tables.encode_mission(m) for m in tables.missions}
+        yield "slots", (
+            [_encode_key(ts), [tables.mission_id(m) for m in missions]]
+            for ts, missions in slots_factory()
+        )
+    else:
+        yield "slots", (
+            [_encode_key(ts), [tables.encode_mission(m) for m in missions]]
+            for ts, missions in slots_factory()
+        )
+
+
+def encode(
+    data: dict[str, list[dict]],
+    stats: PackStats | None = None,
+    intern: bool = False,
+) -> dict:
+    """기존 포맷 dict → packed dict (메모리 내 변환)."""
+    doc = {}
+    for key, value in encode_items(lambda: data.items(), stats, intern):
+        doc[key] = list(value) if isinstance(value, Iterator) else value
+    return doc
+
+
+# ── 디코딩 ────────────────────────────────────────────────────────────────────
+def season_tags(seasons: list[str], mask: int) -> list[str]:
+    return [tag for i, tag in enumerate(seasons) if mask >> i & 1]
+
+
+def iter_decoded(doc: dict) -> Iterator[tuple[str, list[dict]]]:
+    """packed dict → (타임슬롯 키, 기존 포맷 레코드 목록) 순서대로."""
+    version = doc.get("v")
+    if version not in SUPPORTED_VERSIONS:
+        raise CodecError(f"지원하지 않는 스키마 버전: {version}")
+    fields = doc["fields"]
+    tables = doc["tables"]
+    seasons = doc["seasons"]
+
+    def decode_row(row: list[int]) -> dict:
+        m = {}
+        for f, v in zip(fields, row):
+            if f == "s":
+                m[f] = None if v == NULL else season_tags(seasons, v)
+            elif f in tables:
+                m[f] = None if v == NULL else tables[f][v]
+            else:
+                m[f] = v
+        return m
+
+    if version == 2:
+        for key, rows in doc["slots"]:
+            yield _decode_key(key), [decode_row(r) for r in rows]
+        return
+
+    missions = doc["missions"]
+    if version == 4:
+        missions = {int(mid): row for mid, row in missions.items()}
+    for key, ids in doc["slots"]:
+        yield _decode_key(key), [decode_row(missions[i]) for i in ids]
+
+
+def decode(doc: dict) -> dict[str, list[dict]]:
+    """packed dict → 기존 포맷 dict."""
+    return dict(iter_decoded(doc))
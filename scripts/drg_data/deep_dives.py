@@ -0,0 +1,201 @@
+"""
+Deep Dive 주간 이력 (Normal / Elite 스테이지) + 바이옴 / 미션 타입 / 주의보 색인
+
+doublexp.net 은 매주 목요일 11:00 UTC 에 DD_<날짜>T11-00-00Z.json 을 새로 올린다.
+data/deep_dive.json 은 이번 주 파일로 덮어쓰이므로, 지난 주들은 이 이력에 압축해 쌓는다.
+
+  data/deep_dive_history.json
+    {
+      "v": 1,
+      "weeks": {
+        "2026-10-15": {
+          "normal": {"b": "Magma Core", "cn": "Secret Cell", "stages": [{"t","so","l","c","bf","df"}, ...]},
+          "elite":  {...}
+        }, ...                                      주 (리셋 날짜) 오름차순
+      },
+      "index": {
+        "biome":     {"Hollow Bough": ["2026-10-15/elite", ...], ...},   시간순
+        "type":      {...},   스테이지 주 목표
+        "secondary": {...},
+        "warning":   {...}    df 의 주의보를 각각 색인
+      }
+    }
+
+스테이지 필드 이름과 값은 daily_missions.json 압축 레코드(missions.Mission)와 같다.
+type / secondary / warning 은 "그 값을 가진 스테이지가 하나라도 있는 다이브" 로 색인된다.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from .jsonstream import write_if_changed
+from .missions import WARNING_SEPARATOR, Mission
+
+HISTORY_VERSION = 1
+RESET_WEEKDAY = 3      # 목요일 (Mon=0)
+RESET_HOUR = 11        # 11:00 UTC (KST 20:00)
+WEEK = timedelta(days=7)
+
+# 이력 키 → 원본 "Deep Dives" 키
+KINDS = {"normal": "Deep Dive Normal", "elite": "Deep Dive Elite"}
+STAGE_FIELDS = ("t", "so", "l", "c", "bf", "df")
+INDEXED = ("biome", "type", "secondary", "warning")
+
+Dive = tuple[str, str]   # (주 'YYYY-MM-DD', "normal" / "elite")
+
+
+# ── 주 계산 ───────────────────────────────────────────────────────────────────
+def week_start(now: datetime | None = None) -> datetime:
+    """now 시점에 유효한 Deep Dive 의 리셋 시각 (가장 최근 목요일 11:00 UTC)."""
+    now = now or datetime.now(timezone.utc)
+    thursday = now - timedelta(days=(now.weekday() - RESET_WEEKDAY) % 7)
+    thursday = thursday.replace(hour=RESET_HOUR, minute=0, second=0, microsecond=0)
+    # 목요일인데 아직 리셋 전이면 지난주
+    return thursday - WEEK if now < thursday else thursday
+
+
+def weeks_between(start: datetime, end: datetime | None = None) -> list[datetime]:
+    """start 시점의 주부터 end(기본 지금) 시점의 주까지 리셋 시각 목록 (오름차순)."""
+    week, last = week_start(start), week_start(end)
+    weeks = []
+    while week <= last:
+        weeks.append(week)
+        week += WEEK
+    return weeks
+
+
+def week_key(week: datetime) -> str:
+    return week.strftime("%Y-%m-%d")
+
+
+def file_name(week: datetime) -> str:
+    """doublexp.net 의 주간 파일 이름 (DD_2026-10-15T11-00-00Z.json)."""
+    return f"DD_{week_key(week)}T{RESET_HOUR:02d}-00-00Z.json"
+
+
+# ── 압축 ──────────────────────────────────────────────────────────────────────
+def compact_week(data: dict) -> dict:
+    """원본 Deep Dive 응답 → {"normal": {...}, "elite": {...}} (없는 종류는 빠진다)."""
+    dives = data.get("Deep Dives", {})
+    out = {}
+    for kind, raw_key in KINDS.items():
+        dive = dives.get(raw_key)
+        if not dive:
+            continue
+        biome = dive.get("Biome")
+        stages = []
+        for stage in dive.get("Stages", []):
+            m = Mission.from_raw(biome, stage).to_compact()
+            stages.append({f: m[f] for f in STAGE_FIELDS})
+        out[kind] = {"b": biome, "cn": dive.get("CodeName"), "stages": stages}
+    if not out:
+        raise ValueError("Deep Dive 항목이 없는 응답")
+    return out
+
+
+def dive_values(attr: str, dive: dict) -> set[str]:
+    """다이브 하나가 색인 속성 attr 에 대해 갖는 값 집합."""
+    if attr == "biome":
+        return {dive["b"]} if dive["b"] else set()
+    values = set()
+    for stage in dive["stages"]:
+        v = stage[{"type": "t", "secondary": "so", "warning": "df"}[attr]]
+        if not v:
+            continue
+        values.update(v.split(WARNING_SEPARATOR) if attr == "warning" else (v,))
+    return values
+
+
+class DeepDiveHistory:
+    """deep_dive_history.json 병합 / 조회."""
+
+    def __init__(self, doc: dict | None = None):
+        doc = doc or {"v": HISTORY_VERSION, "weeks": {}}
+        if doc.get("v") != HISTORY_VERSION:
+            raise ValueError(f"지원하지 않는 이력 버전: {doc.get('v')}")
+        self._weeks: dict[str, dict] = doc["weeks"]
+        self._index: dict[str, dict[str, list[str]]] | None = doc.get("index")
+
+    @classmethod
+    def load(cls, path: Path) -> "DeepDiveHistory":
+        """파일이 없으면 빈 이력."""
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def __contains__(self, week: str) -> bool:
+        return week in self._weeks
+
+    def __len__(self) -> int:
+        return len(self._weeks)
+
+    @property
+    def weeks(self) -> list[str]:
+        return sorted(self._weeks)
+
+    def add(self, week: str, data: dict) -> bool:
+        """원본 응답 하나를 병합. 새 주이거나 내용이 바뀌었으면 True."""
+        compact = compact_week(data)
+        if self._weeks.get(week) == compact:
+            return False
+        self._weeks[week] = compact
+        self._index = None
+        return True
+
+    def dive(self, week: str, kind: str) -> dict | None:
+        return self._weeks.get(week, {}).get(kind)
+
+    # ── 색인 ──────────────────────────────────────────────────────────────────
+    def index(self) -> dict[str, dict[str, list[str]]]:
+        if self._index is None:
+            index: dict[str, dict[str, list[str]]] = {attr: {} for attr in INDEXED}
+            for week in self.weeks:
+                for kind, dive in self._weeks[week].items():
+                    for attr, postings in index.items():
+                        for value in dive_values(attr, dive):
+                            postings.setdefault(value, []).append(f"{week}/{kind}")
+            self._index = {attr: dict(sorted(p.items())) for attr, p in index.items()}
+        return self._index
+
+    def values(self, attr: str) -> list[str]:
+        return list(self.index()[attr])
+
+    def find(self, kind: str | None = None, **filters: str) -> list[Dive]:
+        """
+        조건을 모두 만족하는 (주, 종류) 목록, 최신 주부터. 예:
+          find(kind="elite", biome="Hollow Bough")
+          find(warning="Low Oxygen", type="Deep Scan")
+        type / secondary / warning 은 다이브 안 아무 스테이지에나 있으면 만족한다.
+        """
+        if kind is not None and kind not in KINDS:
+            raise ValueError(f"알 수 없는 종류: {kind} (가능: {', '.join(KINDS)})")
+        for attr in filters:
+            if attr not in INDEXED:
+                raise ValueError(f"알 수 없는 속성: {attr} (가능: {', '.join(INDEXED)})")
+        index = self.index()
+        if filters:
+            postings = sorted((index[a].get(v, []) for a, v in filters.items()), key=len)
+            others = [set(p) for p in postings[1:]]
+            keys = [k for k in postings[0] if all(k in s for s in others)]
+        else:
+            keys = [f"{week}/{k}" for week in self.weeks for k in KINDS if k in self._weeks[week]]
+        dives = [tuple(k.split("/")) for k in keys]
+        return [d for d in reversed(dives) if kind is None or d[1] == kind]
+
+    def last(self, kind: str | None = None, **filters: str) -> Dive | None:
+        """조건에 맞는 가장 최근 다이브 (없으면 None)."""
+        found = self.find(kind, **filters)
+        return found[0] if found else None
+
+    def save(self, path: Path) -> bool:
+        """주 오름차순 + 색인 포함으로 저장. 내용이 같으면 쓰지 않는다."""
+        doc = {
+            "v": HISTORY_VERSION,
+            "weeks": {week: self._weeks[week] for week in self.weeks},
+            "index": self.index(),
+        }
+        data = json.dumps(doc, ensure_ascii=False, separators=(",", ":")) + "\n"
+        return write_if_changed(Path(path), data.encode("utf-8"))
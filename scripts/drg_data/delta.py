@@ -0,0 +1,175 @@
+"""
+daily_missions.json 게시 간 슬롯 단위 델타 (data/deltas/)
+
+연속된 게시는 슬롯 대부분이 같고, 앞쪽에 새 날짜가 붙고 뒤쪽의 지난 슬롯이 빠지는 정도다.
+직전 게시본(base)과 새 게시본(target)을 비교해 바뀐 부분만 담은 델타를 base 의 sha256 으로 찾게 둔다.
+
+  data/deltas/<base sha256 앞 16자리>.json
+    {
+      "v": 1,
+      "base": "<base 파일 sha256>",
+      "target": "<target 파일 sha256>",
+      "removed": ["2026-03-01T00:00:00Z", ...],                 빠진 키
+      "added":   {"2026-03-03T00:00:00Z": [레코드...], ...},     새 키 + 미션 수가 바뀐 슬롯 (통째로)
+      "changed": {"2026-03-02T12:30:00Z": {"3": 레코드}, ...},   미션 수가 같은 슬롯의 바뀐 위치만
+      "others":  {"dailyDeal": 48},                          타임슬롯이 아닌 키의 target 내 위치
+      "order":   [...]                                        (타임슬롯이 오름차순이 아닐 때만 전체 키 순서)
+    }
+  data/deltas/manifest.json
+    {"v": 1, "target": "<최신 sha256>", "bytes": 최신 파일 크기,
+     "deltas": [{"base", "target", "file", "bytes"}, ...]}      최신 델타부터 DELTA_KEEP 개
+
+클라이언트는 가진 파일의 sha256 으로 델타를 찾아 적용하고, 결과가 target 이 아니면 다음 델타를
+이어 적용한다 (몇 버전 뒤처져도 델타를 체인으로 따라간다). 델타가 없으면 전체 파일을 받는다.
+키 순서는 타임슬롯 오름차순 사이에 그 밖의 키('dailyDeal' 등)를 others 의 위치에 끼워 넣어 복원한다
+(daily_missions.json 에서는 dailyDeal 이 맨 뒤에 오지만 순서를 가정하지 않는다).
+적용 결과는 json.dumps(ensure_ascii=False) 로 직렬화해 원본과 바이트 단위로 같다.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable
+from pathlib import Path
+
+from .codec import CodecError, slot_index
+from .jsonstream import write_if_changed
+
+DELTA_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+DELTA_KEEP = 14        # manifest 에 남길 델타 수 (매일 게시 기준 2주)
+
+
+class DeltaError(ValueError):
+    pass
+
+
+def render(doc: dict) -> bytes:
+    """daily_missions.json 과 같은 직렬화 (write_object_stream 기본 구분자)."""
+    return json.dumps(doc, ensure_ascii=False).encode("utf-8")
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def delta_file_name(base: str) -> str:
+    return f"{base[:16]}.json"
+
+
+def _split_keys(keys: Iterable[str]) -> tuple[list[tuple[int, str]], dict[str, int]]:
+    """키 목록 → ([(슬롯번호, 타임슬롯 키)...], {그 밖의 키: 위치})."""
+    slots, others = [], {}
+    for pos, key in enumerate(keys):
+        try:
+            slots.append((slot_index(key), key))
+        except CodecError:
+            others[key] = pos
+    return slots, others
+
+
+def _arrange(keys: Iterable[str], others: dict[str, int]) -> list[str]:
+    """타임슬롯 오름차순 + 그 밖의 키를 others 의 위치에 끼워 넣은 순서."""
+    slots, _ = _split_keys(keys)
+    order = [key for _, key in sorted(slots)]
+    for key, pos in sorted(others.items(), key=lambda kv: kv[1]):
+        order.insert(pos, key)
+    return order
+
+
+def make_delta(base: dict, target: dict, base_sha: str, target_sha: str) -> dict:
+    """base → target 델타."""
+    removed = [key for key in base if key not in target]
+    added, changed = {}, {}
+    for key, missions in target.items():
+        old = base.get(key)
+        if old == missions:
+            continue
+        if old is None or not isinstance(old, list) or not isinstance(missions, list) \
+                or len(old) != len(missions):
+            added[key] = missions
+            continue
+        changed[key] = {str(pos): m for pos, (o, m) in enumerate(zip(old, missions)) if o != m}
+    slots, others = _split_keys(target)
+    delta = {"v": DELTA_VERSION, "base": base_sha, "target": target_sha,
+             "removed": removed, "added": added, "changed": changed, "others": others}
+    if slots != sorted(slots):
+        delta["order"] = list(target)
+    return delta
+
+
+def apply_delta(base: bytes, delta: dict) -> bytes:
+    """
+    base 파일 바이트에 델타를 적용해 target 파일 바이트를 만든다.
+    base 해시가 델타의 base 와 다르거나 결과 해시가 target 과 다르면 DeltaError.
+    """
+    if delta.get("v") != DELTA_VERSION:
+        raise DeltaError(f"지원하지 않는 델타 버전: {delta.get('v')}")
+    if sha256(base) != delta["base"]:
+        raise DeltaError("base 해시가 델타와 다릅니다")
+    doc = json.loads(base)
+    for key in delta["removed"]:
+        doc.pop(key, None)
+    doc.update(delta["added"])
+    for key, positions in delta["changed"].items():
+        missions = doc[key]
+        for pos, m in positions.items():
+            missions[int(pos)] = m
+    order = delta.get("order") or _arrange(doc, delta["others"])
+    out = render({key: doc[key] for key in order})
+    if sha256(out) != delta["target"]:
+        raise DeltaError("적용 결과가 target 해시와 다릅니다")
+    return out
+
+
+def load_manifest(out_dir: Path) -> dict:
+    path = Path(out_dir) / MANIFEST_NAME
+    if not path.exists():
+        return {"v": MANIFEST_VERSION, "target": None, "bytes": 0, "deltas": []}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def publish(base: bytes, target: bytes, out_dir: Path, keep: int = DELTA_KEEP) -> dict | None:
+    """
+    base → target 델타를 만들어 적용 검증 후 out_dir 에 쓰고 manifest 를 갱신한다.
+    반환: manifest 항목 (델타가 target 전체보다 크면 쓰지 않고 None — 체인은 거기서 끊기고 전체를 받는다)
+    """
+    out_dir = Path(out_dir)
+    base_sha, target_sha = sha256(base), sha256(target)
+    delta = make_delta(json.loads(base), json.loads(target), base_sha, target_sha)
+    data = json.dumps(delta, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    apply_delta(base, delta)   # 바이트 단위 재구성 검증 (실패하면 DeltaError)
+
+    manifest = load_manifest(out_dir)
+    entries = [e for e in manifest["deltas"] if e["base"] != base_sha]
+    entry = None
+    if len(data) < len(target):
+        entry = {"base": base_sha, "target": target_sha, "file": delta_file_name(base_sha), "bytes": len(data)}
+        write_if_changed(out_dir / entry["file"], data)
+        entries.insert(0, entry)
+    entries = entries[:keep]
+
+    keep_files = {e["file"] for e in entries} | {MANIFEST_NAME}
+    for old in out_dir.glob("*.json"):
+        if old.name not in keep_files:
+            old.unlink()
+    manifest = {"v": MANIFEST_VERSION, "target": target_sha, "bytes": len(target), "deltas": entries}
+    write_if_changed(out_dir / MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=1).encode("utf-8"))
+    return entry
+
+
+def catch_up(base: bytes, out_dir: Path) -> bytes | None:
+    """out_dir 의 델타 체인으로 base 를 최신 게시본까지 올린다 (체인이 끊기면 None)."""
+    out_dir = Path(out_dir)
+    manifest = load_manifest(out_dir)
+    by_base = {e["base"]: e for e in manifest["deltas"]}
+    current, seen = base, set()
+    while sha256(current) != manifest["target"]:
+        entry = by_base.get(sha256(current))
+        if entry is None or entry["base"] in seen:   # 되돌아간 게시로 생긴 순환도 끊긴 것으로 본다
+            return None
+        seen.add(entry["base"])
+        with open(out_dir / entry["file"], encoding="utf-8") as f:
+            current = apply_delta(current, json.load(f))
+    return current
@@ -0,0 +1,158 @@
+"""
+알림용 고정 폭 바이너리 다이제스트 (data/alarm_digest.bin) + mmap 리더
+
+백그라운드 알람은 "지금 슬롯에 변이(buff)가 붙은 미션이 있나, 있다면 어떤 타입인가" 만 알면 된다.
+daily_missions.json 전체를 파싱하는 대신, 슬롯마다 미션 타입 비트마스크 두 개만 담은
+고정 폭 레코드를 슬롯번호로 계산한 위치에서 몇 바이트 읽는다.
+
+파일 구조 (리틀 엔디언):
+  헤더 32 바이트
+    0   4s  magic  b"DRGA"
+    4   H   버전 (1)
+    6   H   레코드 크기 (8)
+    8   q   첫 슬롯번호 (epoch 초 // 1800)
+    16  I   슬롯 수
+    20  B   미션 타입 수 (≤ 32)
+    21  11x 예약
+  레코드 × 슬롯 수 — 위치 = 32 + (슬롯번호 - 첫 슬롯번호) * 8
+    0   I   변이가 있는 미션의 타입 비트마스크
+    4   I   Double XP 미션의 타입 비트마스크
+  타입 테이블 — 레코드 뒤, 비트 순서대로 UTF-8 이름을 "\\n" 으로 이음
+
+데이터에 없는 슬롯(중간 공백)은 0 레코드다.
+"""
+
+import mmap
+import struct
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .codec import CodecError, SLOT_SECONDS, slot_index
+from .jsonstream import write_if_changed
+
+MAGIC = b"DRGA"
+DIGEST_VERSION = 1
+HEADER = struct.Struct("<4sHHqIB11x")
+RECORD = struct.Struct("<II")
+MAX_TYPES = 32
+DOUBLE_XP = "Double XP"
+
+
+def build_digest(slots: Iterable[tuple[str, list[dict]]]) -> bytes:
+    """(타임슬롯 키, 압축 레코드 목록) 스트림 → 다이제스트 바이트. 타임슬롯이 아닌 키는 제외."""
+    masks: dict[int, tuple[list[str], list[str]]] = {}   # 슬롯번호 → (변이 타입들, Double XP 타입들)
+    types: set[str] = set()
+    for ts, missions in slots:
+        try:
+            si = slot_index(ts)
+        except CodecError:
+            continue
+        buffed = [m["t"] for m in missions if m["bf"]]
+        double = [m["t"] for m in missions if m["bf"] == DOUBLE_XP]
+        masks[si] = (buffed, double)
+        types.update(m["t"] for m in missions if m["t"])
+
+    table = sorted(types)
+    if len(table) > MAX_TYPES:
+        raise ValueError(f"미션 타입이 {MAX_TYPES}개를 넘습니다: {len(table)}")
+    bit = {t: 1 << i for i, t in enumerate(table)}
+
+    def mask(names: list[str]) -> int:
+        return sum({bit[n] for n in names if n in bit})
+
+    first = min(masks) if masks else 0
+    count = max(masks) - first + 1 if masks else 0
+    out = bytearray(HEADER.pack(MAGIC, DIGEST_VERSION, RECORD.size, first, count, len(table)))
+    out += bytes(RECORD.size * count)
+    for si, (buffed, double) in masks.items():
+        RECORD.pack_into(out, HEADER.size + (si - first) * RECORD.size, mask(buffed), mask(double))
+    out += "\n".join(table).encode("utf-8")
+    return bytes(out)
+
+
+def write_digest(slots: Iterable[tuple[str, list[dict]]], path: Path) -> bool:
+    return write_if_changed(Path(path), build_digest(slots))
+
+
+class AlarmDigest:
+    """
+    alarm_digest.bin mmap 리더.
+
+      with AlarmDigest(Path("data/alarm_digest.bin")) as digest:
+          digest.buffed_types()                       # 지금 슬롯의 변이 미션 타입
+          digest.should_notify(exclude={"Egg Hunt"})  # 알림 여부만
+    """
+
+    def __init__(self, path: Path):
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:   # 빈 파일
+            self._file.close()
+            raise ValueError(f"빈 다이제스트 파일: {path}") from None
+        magic, version, record_size, self.first_slot, self.slot_count, self._type_count = (
+            HEADER.unpack_from(self._mm, 0))
+        if magic != MAGIC or version != DIGEST_VERSION or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"지원하지 않는 다이제스트: {magic!r} v{version}")
+        self._types: list[str] | None = None
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "AlarmDigest":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def types(self) -> list[str]:
+        """비트 순서의 미션 타입 이름 (파일 끝 테이블, 처음 필요할 때만 읽는다)."""
+        if self._types is None:
+            tail = self._mm[HEADER.size + self.slot_count * RECORD.size:]
+            self._types = tail.decode("utf-8").split("\n") if self._type_count else []
+        return self._types
+
+    def type_mask(self, names: Iterable[str]) -> int:
+        wanted = set(names)
+        return sum(1 << i for i, t in enumerate(self.types) if t in wanted)
+
+    @staticmethod
+    def slot_at(when: datetime | None = None) -> int:
+        when = when or datetime.now(timezone.utc)
+        return int(when.timestamp()) // SLOT_SECONDS
+
+    def record(self, slot: int) -> tuple[int, int] | None:
+        """슬롯번호 → (변이 타입 마스크, Double XP 타입 마스크). 범위 밖이면 None."""
+        i = slot - self.first_slot
+        if not 0 <= i < self.slot_count:
+            return None
+        return RECORD.unpack_from(self._mm, HEADER.size + i * RECORD.size)
+
+    def should_notify(
+        self,
+        when: datetime | None = None,
+        exclude: Iterable[str] = (),
+        double_xp_only: bool = False,
+    ) -> bool:
+        """알림 콜백의 판정: 그 슬롯에 제외 타입이 아닌 변이(또는 Double XP) 미션이 있는가."""
+        rec = self.record(self.slot_at(when))
+        if rec is None:
+            return False
+        mask = rec[1] if double_xp_only else rec[0]
+        if not mask:
+            return False   # 대부분의 슬롯은 여기서 끝 — 타입 테이블도 읽지 않는다
+        return bool(mask & ~self.type_mask(exclude))
+
+    def buffed_types(self, when: datetime | None = None, double_xp_only: bool = False) -> list[str]:
+        rec = self.record(self.slot_at(when))
+        mask = (rec[1] if double_xp_only else rec[0]) if rec else 0
+        return list(self._names(mask))
+
+    def _names(self, mask: int) -> Iterator[str]:
+        for i, name in enumerate(self.types):
+            if mask >> i & 1:
+                yield name
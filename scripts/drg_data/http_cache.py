@@ -0,0 +1,155 @@
+"""
+URL 단위 디스크 응답 캐시 (ETag / Last-Modified 조건부 요청용)
+
+캐시 디렉터리 구조:
+  <root>/<sha256(url)>.json   메타데이터 (url, etag, last_modified, sha256, size, fetched_at)
+  <root>/<sha256(url)>.body   원본 응답 바디 (바이트 그대로)
+  <root>/outputs.json         출력 파일별 마지막 입력 지문 (변경 없는 재생성 방지)
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+@dataclass
+class CachedResponse:
+    """
+    조건부 요청 결과. changed=False면 캐시 바디와 동일한 내용.
+    바디는 메모리에 올리지 않고 캐시 파일 경로(path)로만 들고 다닌다.
+    """
+    url: str
+    status: int          # 실제 HTTP 상태 (200 / 304 / ...)
+    path: Path | None    # 바디 파일 (실패 응답이면 None)
+    sha256: str
+    changed: bool
+
+    @property
+    def ok(self) -> bool:
+        return self.status in (200, 304) and self.path is not None
+
+    @property
+    def body(self) -> bytes:
+        return self.path.read_bytes() if self.path else b""
+
+    def open(self):
+        """바디를 UTF-8 텍스트 스트림으로 연다 (증분 파싱용)."""
+        return open(self.path, encoding="utf-8")
+
+    def json(self):
+        with self.open() as f:
+            return json.load(f)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+class HttpCache:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _meta_path(self, url: str) -> Path:
+        return self.root / f"{self._key(url)}.json"
+
+    def body_path(self, url: str) -> Path:
+        return self.root / f"{self._key(url)}.body"
+
+    def meta(self, url: str) -> dict | None:
+        """캐시된 메타데이터. 바디 파일이 없으면 캐시가 없는 것으로 본다."""
+        path = self._meta_path(url)
+        if not path.exists() or not self.body_path(url).exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """If-None-Match / If-Modified-Since 헤더 (캐시 없으면 빈 dict)."""
+        meta = self.meta(url)
+        if not meta:
+            return {}
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def load(self, url: str, status: int = 304) -> CachedResponse | None:
+        """캐시된 바디를 변경 없음(changed=False) 응답으로 반환."""
+        meta = self.meta(url)
+        if not meta:
+            return None
+        return CachedResponse(url, status, self.body_path(url), meta["sha256"], changed=False)
+
+    def store(self, url: str, headers, chunks: Iterable[bytes]) -> CachedResponse:
+        """
+        200 응답 바디를 청크 단위로 디스크에 흘려 쓰면서 해시를 계산한다.
+        이전 바디와 해시가 같으면 changed=False.
+        headers: requests의 대소문자 무시 헤더 맵 (dict도 가능)
+        """
+        body_path = self.body_path(url)
+        tmp = body_path.with_name(body_path.name + ".tmp")
+        h = hashlib.sha256()
+        size = 0
+        with open(tmp, "wb") as f:
+            for chunk in chunks:
+                h.update(chunk)
+                size += len(chunk)
+                f.write(chunk)
+        digest = h.hexdigest()
+
+        previous = self.meta(url)
+        changed = previous is None or previous.get("sha256") != digest
+        os.replace(tmp, body_path)
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "sha256": digest,
+            "size": size,
+            "fetched_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        _write_atomic(self._meta_path(url), json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+        return CachedResponse(url, 200, body_path, digest, changed)
+
+    # ── 출력 지문 ─────────────────────────────────────────────────────────────
+    def _outputs_path(self) -> Path:
+        return self.root / "outputs.json"
+
+    def _outputs(self) -> dict[str, str]:
+        try:
+            return json.loads(self._outputs_path().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def output_unchanged(self, name: str, fingerprint: str) -> bool:
+        """name 출력이 마지막으로 같은 입력(fingerprint)으로 만들어졌는지."""
+        return self._outputs().get(name) == fingerprint
+
+    def record_output(self, name: str, fingerprint: str) -> None:
+        outputs = self._outputs()
+        outputs[name] = fingerprint
+        _write_atomic(self._outputs_path(), json.dumps(outputs, indent=2).encode("utf-8"))
+
+
+def fingerprint(responses: list[CachedResponse]) -> str:
+    """입력 응답 묶음의 지문 — URL 순서와 바디 해시로 결정."""
+    h = hashlib.sha256()
+    for r in responses:
+        h.update(r.url.encode("utf-8"))
+        h.update(r.sha256.encode("ascii"))
+    return h.hexdigest()
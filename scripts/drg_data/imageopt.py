@@ -0,0 +1,149 @@
+"""
+다운로드한 원본 이미지 → 앱 번들용 최적화 이미지 (프로세스 풀)
+
+카테고리별 목표 크기(논리 픽셀, 1x)에 맞춰 비율을 유지한 채 축소하고
+Flutter 해상도 변형 규칙대로 1x / 2x / 3x 를 만든다.
+
+  assets/images/biomes/azure_weald.png          1x
+  assets/images/biomes/2.0x/azure_weald.png     2x
+  assets/images/biomes/3.0x/azure_weald.png     3x
+
+- 원본보다 키우지 않는다. 원본이 작아 이전 밀도와 크기가 같아지면 그 밀도는 건너뛴다
+  (Flutter 가 가장 가까운 밀도로 대체).
+- EXIF / ICC / 텍스트 청크 등 메타데이터는 쓰지 않는다.
+- 파일명은 AssetHelper 가 찾는 `<snake>.png` 그대로 유지한다. Flutter 는 확장자가 아니라
+  내용으로 디코딩하므로 WebP 도 그대로 읽힌다 (기존 바이옴 이미지도 WebP 였다).
+
+Pillow 가 없으면 available() 이 False — fetch_assets.py 는 원본을 그대로 복사한다.
+"""
+
+import hashlib
+import io
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+DENSITIES = (1, 2, 3)
+FORMATS = ("webp", "png")
+WEBP_QUALITY = 82
+
+# 카테고리 → 1x 목표 상자 (가로, 세로 논리 픽셀). 화면에서 쓰이는 가장 큰 크기 기준.
+TARGETS: dict[str, tuple[int, int]] = {
+    "biomes":   (480, 270),   # 미션 카드 / 딥다이브 헤더 배경 (BoxFit.cover)
+    "missions": (48, 48),     # 미션 타입 아이콘 46px
+    "mutators": (32, 32),     # 뮤테이터 아이콘 28px
+    "warnings": (36, 36),     # 경고 아이콘 최대 34px
+}
+
+
+def available() -> bool:
+    return Image is not None
+
+
+def profile(box: tuple[int, int], fmt: str) -> str:
+    """출력 설정 식별자 — 바뀌면 원본이 같아도 다시 만든다."""
+    dens = ",".join(str(d) for d in DENSITIES)
+    quality = f"q{WEBP_QUALITY}" if fmt == "webp" else "opt"
+    return f"{fmt}:{quality}:{box[0]}x{box[1]}@{dens}"
+
+
+def variant_path(out_path: Path, density: int) -> Path:
+    """Flutter 해상도 변형 경로: 1x 는 그대로, 나머지는 <dir>/<d>.0x/<name>."""
+    if density == 1:
+        return out_path
+    return out_path.parent / f"{density}.0x" / out_path.name
+
+
+def _fit(size: tuple[int, int], box: tuple[int, int]) -> tuple[int, int]:
+    """비율을 유지하며 box 안에 맞춘 크기 (키우지 않음)."""
+    scale = min(box[0] / size[0], box[1] / size[1], 1.0)
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+
+def _encode(im, fmt: str) -> bytes:
+    buf = io.BytesIO()
+    if fmt == "webp":
+        im.save(buf, "WEBP", quality=WEBP_QUALITY, method=6)
+    else:
+        im.save(buf, "PNG", optimize=True)
+    return buf.getvalue()
+
+
+def optimize_image(src: str, out_path: str, box: tuple[int, int], fmt: str) -> dict:
+    """
+    원본 하나 → 밀도별 출력 파일 (프로세스 풀 작업 단위, 인자는 피클 가능한 값만).
+    반환: {"src_bytes": int, "outputs": {경로: {"bytes", "sha256", "size": [w, h]}}}
+    """
+    with Image.open(src) as im:
+        im = ImageOps.exif_transpose(im)
+        has_alpha = im.mode in ("RGBA", "LA", "PA") or "transparency" in im.info
+        im = im.convert("RGBA" if has_alpha else "RGB")
+        im.info.clear()
+
+        outputs: dict[str, dict] = {}
+        previous = None
+        for density in DENSITIES:
+            size = _fit(im.size, (box[0] * density, box[1] * density))
+            if size == previous:
+                continue
+            previous = size
+            resized = im if size == im.size else im.resize(size, Image.LANCZOS)
+            data = _encode(resized, fmt)
+
+            dest = variant_path(Path(out_path), density)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = dest.with_name(dest.name + ".tmp")
+            tmp.write_bytes(data)
+            tmp.replace(dest)
+            outputs[str(dest)] = {
+                "bytes": len(data),
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "size": list(size),
+            }
+    return {"src_bytes": Path(src).stat().st_size, "outputs": outputs}
+
+
+def optimize_all(jobs: list[tuple[str, str, tuple[int, int], str]], workers: int | None = None) -> list:
+    """
+    jobs: [(src, out_path, box, fmt), ...] → 같은 순서의 결과 목록.
+    실패한 작업은 결과 대신 예외 객체가 들어간다.
+    """
+    if not jobs:
+        return []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(optimize_image, *job) for job in jobs]
+        results = []
+        for fut in futures:
+            try:
+                results.append(fut.result())
+            except Exception as e:
+                results.append(e)
+    return results
+
+
+def budget_report(totals: dict[str, dict[str, int]]) -> list[str]:
+    """
+    카테고리별 바이트 예산 표 (출력용 문자열 줄).
+    totals: {category: {"files", "before", "x1", "all"}}
+    """
+    lines = [f"  {'category':12} {'files':>5} {'before':>11} {'1x':>11} {'1x+2x+3x':>17}"]
+    sums = {"files": 0, "before": 0, "x1": 0, "all": 0}
+    for cat, t in totals.items():
+        for k in sums:
+            sums[k] += t[k]
+        lines.append(_report_line(cat, t))
+    lines.append(_report_line("합계", sums))
+    return lines
+
+
+def _report_line(label: str, t: dict[str, int]) -> str:
+    before = t["before"] or 1
+    width = 12 - sum(1 for ch in label if ord(ch) > 0x1100)   # 한글은 두 칸
+    return (
+        f"  {label:{width}} {t['files']:>5} {t['before'] // 1024:>8} KB"
+        f" {t['x1'] // 1024:>8} KB {t['all'] // 1024:>8} KB ({t['all'] / before:>4.0%})"
+    )
@@ -0,0 +1,144 @@
+"""
+미션 역색인 (변이 / 주의보 / 미션 타입 / 바이옴 / 2차 목표 / 시즌 → 슬롯·위치)
+
+"Double XP 가 있는 슬롯", "Magma Core 의 Deep Scan", "Low Oxygen 미션 전부" 같은 질의를
+슬롯 전체를 훑지 않고 결과 크기에 비례하는 비용으로 답하기 위한 색인이다.
+
+  data/mission_index.json
+    {
+      "v": 1,
+      "slots": ["2026-03-02T00:00:00Z", ...],          슬롯 번호 → 타임슬롯 키
+      "index": {
+        "mutator":   {"Double XP": [슬롯, 위치, 슬롯, 위치, ...], ...},
+        "warning":   {...},   df 의 ", " 로 묶인 주의보를 각각 색인
+        "type":      {...},
+        "biome":     {...},
+        "secondary": {...},
+        "season":    {"s0": [...], ...}
+      }
+    }
+
+위치는 daily_missions.json 의 해당 슬롯 목록 안 인덱스다. 목록은 (슬롯, 위치) 순으로 정렬돼 있다.
+"""
+
+import json
+from collections.abc import Iterable
+from pathlib import Path
+
+from .codec import CodecError, slot_index
+from .missions import WARNING_SEPARATOR
+
+INDEX_VERSION = 1
+
+# 색인 속성 → 압축 레코드 필드
+ATTRIBUTES = {
+    "mutator": "bf",
+    "warning": "df",
+    "type": "t",
+    "biome": "b",
+    "secondary": "so",
+    "season": "s",
+}
+
+Hit = tuple[str, int]   # (타임슬롯 키, 슬롯 내 위치)
+
+
+def mission_values(attr: str, m: dict) -> list[str]:
+    """레코드 하나가 속성 attr 에 대해 갖는 값 목록 (주의보·시즌은 여러 개)."""
+    v = m[ATTRIBUTES[attr]]
+    if v is None:
+        return []
+    if attr == "warning":
+        return v.split(WARNING_SEPARATOR)
+    if attr == "season":
+        return list(v)
+    return [v]
+
+
+def build_index(slots: Iterable[tuple[str, list[dict]]]) -> dict:
+    """슬롯 스트림 → 색인 dict. 타임슬롯이 아닌 키('dailyDeal' 등)는 제외."""
+    keys: list[str] = []
+    index: dict[str, dict[str, list[int]]] = {attr: {} for attr in ATTRIBUTES}
+    for ts, missions in slots:
+        try:
+            slot_index(ts)
+        except CodecError:
+            continue
+        si = len(keys)
+        keys.append(ts)
+        for pos, m in enumerate(missions):
+            for attr, postings in index.items():
+                for value in mission_values(attr, m):
+                    postings.setdefault(value, []).extend((si, pos))
+    return {
+        "v": INDEX_VERSION,
+        "slots": keys,
+        "index": {attr: dict(sorted(p.items())) for attr, p in index.items()},
+    }
+
+
+class MissionIndex:
+    """mission_index.json 조회 API."""
+
+    def __init__(self, doc: dict):
+        if doc.get("v") != INDEX_VERSION:
+            raise ValueError(f"지원하지 않는 색인 버전: {doc.get('v')}")
+        self.slot_keys: list[str] = doc["slots"]
+        self._index: dict[str, dict[str, list[int]]] = doc["index"]
+        self._sets: dict[tuple[str, str], set[tuple[int, int]]] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> "MissionIndex":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def values(self, attr: str) -> list[str]:
+        """속성에 등장하는 값 목록 (예: values('mutator'))."""
+        return list(self._index[attr])
+
+    def _pairs(self, attr: str, value: str) -> list[tuple[int, int]]:
+        flat = self._index[attr].get(value, [])
+        return list(zip(flat[0::2], flat[1::2]))
+
+    def _set(self, attr: str, value: str) -> set[tuple[int, int]]:
+        key = (attr, value)
+        if key not in self._sets:
+            self._sets[key] = set(self._pairs(attr, value))
+        return self._sets[key]
+
+    def count(self, attr: str, value: str) -> int:
+        return len(self._index[attr].get(value, [])) // 2
+
+    def find(self, **filters: str) -> list[Hit]:
+        """
+        모든 조건을 만족하는 (타임슬롯, 위치) 목록. 예:
+          find(mutator="Double XP")
+          find(type="Deep Scan", biome="Magma Core")
+        가장 짧은 목록만 순회하고 나머지 조건은 집합 조회로 거른다.
+        """
+        if not filters:
+            raise ValueError("조건이 하나 이상 필요합니다")
+        for attr in filters:
+            if attr not in ATTRIBUTES:
+                raise ValueError(f"알 수 없는 속성: {attr} (가능: {', '.join(ATTRIBUTES)})")
+        ordered = sorted(filters.items(), key=lambda kv: self.count(*kv))
+        base_attr, base_value = ordered[0]
+        others = [self._set(a, v) for a, v in ordered[1:]]
+        return [
+            (self.slot_keys[si], pos)
+            for si, pos in self._pairs(base_attr, base_value)
+            if all((si, pos) in s for s in others)
+        ]
+
+    def slots(self, **filters: str) -> list[str]:
+        """조건을 만족하는 미션이 하나라도 있는 타임슬롯 키 (시간순, 중복 없음)."""
+        seen: list[str] = []
+        for ts, _ in self.find(**filters):
+            if not seen or seen[-1] != ts:
+                seen.append(ts)
+        return seen
+
+
+def resolve(hits: list[Hit], data: dict[str, list[dict]]) -> list[dict]:
+    """find() 결과를 daily_missions.json 레코드로 바꾼다."""
+    return [data[ts][pos] for ts, pos in hits]
@@ -0,0 +1,187 @@
+"""
+최상위 JSON 객체의 증분 파서 / 라이터
+
+bulkmissions 파일은 {"<타임슬롯>": {...}, ...} 형태의 거대한 객체 하나다.
+전체를 json.load 하지 않고 (키, 값) 쌍을 하나씩 꺼내 처리한 뒤 버릴 수 있도록
+표준 라이브러리 JSONDecoder.raw_decode 를 버퍼 위에서 반복 호출한다.
+메모리 사용량은 가장 큰 값 하나 + 읽기 버퍼 크기로 고정된다.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_WS = " \t\n\r"
+
+
+class _Buffer:
+    def __init__(self, fp: TextIO, chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """버퍼에 청크를 더 읽어 붙인다. 이미 소비한 앞부분은 잘라낸다."""
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def skip_ws(self) -> None:
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WS:
+                self.pos += 1
+            if self.pos < len(self.text) or not self.fill():
+                return
+
+    def expect(self, chars: str) -> str:
+        self.skip_ws()
+        if self.pos >= len(self.text):
+            raise ValueError("JSON이 예기치 않게 끝났습니다")
+        c = self.text[self.pos]
+        if c not in chars:
+            raise ValueError(f"'{chars}' 가 필요한 위치에 '{c}' (offset {self.pos})")
+        self.pos += 1
+        return c
+
+    def value(self, terminators: str) -> Any:
+        """
+        다음 JSON 값 하나를 디코드. 버퍼 끝에 걸친 값은 더 읽어서 재시도.
+        숫자처럼 구분자 없이 끝나는 값은 잘린 채로도 디코드될 수 있으므로
+        (예: '1.5' 가 '1.' 에서 잘리면 '1'), 값 뒤에 terminators 중 하나가
+        보일 때만 받아들인다.
+        """
+        self.skip_ws()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            nxt = end
+            while nxt < len(self.text) and self.text[nxt] in _WS:
+                nxt += 1
+            if (nxt == len(self.text) or self.text[nxt] not in terminators) and self.fill():
+                continue
+            self.pos = end
+            return obj
+
+
+def iter_object_items(fp: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str, Any]]:
+    """최상위 JSON 객체의 (키, 값) 쌍을 파일 순서대로 하나씩 yield."""
+    buf = _Buffer(fp, chunk_size)
+    buf.fill()
+    buf.expect("{")
+    buf.skip_ws()
+    if buf.pos < len(buf.text) and buf.text[buf.pos] == "}":
+        return
+    while True:
+        key = buf.value(":")
+        if not isinstance(key, str):
+            raise ValueError("객체 키는 문자열이어야 합니다")
+        buf.expect(":")
+        yield key, buf.value(",}")
+        if buf.expect(",}") == "}":
+            return
+
+
+def _emit_object(items: Iterable[tuple[str, Any]], emit, compact: bool) -> None:
+    item_sep, key_sep = (",", ":") if compact else (", ", ": ")
+    separators = (item_sep, key_sep)
+
+    def dumps(v: Any) -> str:
+        return json.dumps(v, ensure_ascii=False, separators=separators)
+
+    emit("{")
+    first = True
+    for key, value in items:
+        if not first:
+            emit(item_sep)
+        first = False
+        emit(dumps(key))
+        emit(key_sep)
+        if isinstance(value, Iterator):
+            # 제너레이터 값은 배열로, 원소 하나씩 기록 (전체를 메모리에 모으지 않음)
+            emit("[")
+            for i, element in enumerate(value):
+                if i:
+                    emit(item_sep)
+                emit(dumps(element))
+            emit("]")
+        else:
+            emit(dumps(value))
+    emit("}")
+
+
+def write_object_stream(path: Path, items: Iterable[tuple[str, Any]], compact: bool = False) -> bool:
+    """
+    (키, 값) 쌍을 한 항목씩 JSON 객체로 써 내려간다.
+    결과 바이트는 json.dump(dict(items), ensure_ascii=False) 와 동일하다
+    (compact=True 면 separators=(",", ":") 와 동일).
+    값이 이터레이터면 list(값) 과 같은 JSON 배열로 원소 단위로 기록한다.
+    임시 파일에 쓴 뒤 기존 파일과 내용이 같으면 버리고, 다르면 원자적으로 교체한다.
+    반환: 실제로 파일을 교체했는지
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    h = hashlib.sha256()
+    with open(tmp, "w", encoding="utf-8") as f:
+        def emit(s: str) -> None:
+            f.write(s)
+            h.update(s.encode("utf-8"))
+
+        _emit_object(items, emit, compact)
+
+    if path.exists() and file_sha256(path) == h.hexdigest():
+        tmp.unlink()
+        return False
+    os.replace(tmp, path)
+    return True
+
+
+def object_sha256(items: Iterable[tuple[str, Any]], compact: bool = False) -> str:
+    """write_object_stream 이 쓸 바이트의 sha256 (파일을 만들지 않고 계산)."""
+    h = hashlib.sha256()
+    _emit_object(items, lambda s: h.update(s.encode("utf-8")), compact)
+    return h.hexdigest()
+
+
+def iter_file_items(path: Path) -> Iterator[tuple[str, Any]]:
+    """파일을 열어 iter_object_items — 다 읽으면 파일을 닫는다."""
+    with open(path, encoding="utf-8") as f:
+        yield from iter_object_items(f)
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """내용이 다를 때만 파일을 원자적으로 쓴다 (no-op 커밋 방지). 반환: 실제로 썼는지."""
+    path = Path(path)
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
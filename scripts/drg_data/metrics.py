@@ -0,0 +1,265 @@
+"""
+수집 스크립트 계측 (요청별 타이밍 + 단계별 시간 → JSON)
+
+요청 하나마다:
+  dns       getaddrinfo 시간 (커넥션 재사용 시 0)
+  connect   TCP 연결 시간 (커넥션 재사용 시 0)
+  ttfb      요청 시작 → 응답 헤더 수신 (TLS 핸드셰이크 + 서버 처리 포함, dns/connect 제외)
+  transfer  바디 수신 시간
+  bytes / status / retries (urllib3 Retry 기록) / reused / error
+
+단계(phase)마다 누적 시간과 처리 레코드 수 → records/sec.
+
+DNS / connect 는 install() 이 거는 두 훅으로 잰다. urllib3 의 create_connection 은 원래 함수를
+그대로 불러 걸린 시간만 재고 (주소 순회, IPv6/IPv4 폴백은 원래 동작 그대로), 그 안에서 부르는
+socket.getaddrinfo 시간을 dns 로 따로 떼어 connect 에서 뺀다. 두 훅 모두 측정 중인 요청이 없는
+스레드에서는 원래 함수를 그대로 부른다. install() 은 계측을 켠 실행에서만 부른다.
+측정 중인 요청은 스레드 로컬로 찾으므로 스레드 풀에서 동시에 요청해도 섞이지 않는다.
+"""
+
+import cProfile
+import io
+import json
+import platform
+import pstats
+import socket
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from urllib3.util import connection as _urllib3_connection
+
+METRICS_VERSION = 1
+
+_local = threading.local()
+_original_create_connection = _urllib3_connection.create_connection
+_original_getaddrinfo = socket.getaddrinfo
+
+
+def _timed_getaddrinfo(*args, **kwargs):
+    """연결 생성 중인 요청이 있으면 이름 해석 시간을 그 요청의 dns 에 더한다."""
+    record = getattr(_local, "connecting", None)
+    if record is None:
+        return _original_getaddrinfo(*args, **kwargs)
+    started = time.perf_counter()
+    try:
+        return _original_getaddrinfo(*args, **kwargs)
+    finally:
+        record.dns += time.perf_counter() - started
+
+
+def _timed_create_connection(address, *args, **kwargs):
+    """원래 create_connection 을 그대로 부르고, 걸린 시간에서 dns 를 뺀 만큼을 connect 로 남긴다."""
+    record = getattr(_local, "record", None)
+    if record is None:
+        return _original_create_connection(address, *args, **kwargs)
+    dns_before = record.dns
+    _local.connecting = record
+    started = time.perf_counter()
+    try:
+        return _original_create_connection(address, *args, **kwargs)
+    finally:
+        _local.connecting = None
+        record.connect += time.perf_counter() - started - (record.dns - dns_before)
+
+
+def install() -> None:
+    """urllib3 연결 생성과 이름 해석에 타이밍 훅을 건다 (여러 번 불러도 한 번만)."""
+    _urllib3_connection.create_connection = _timed_create_connection
+    socket.getaddrinfo = _timed_getaddrinfo
+
+
+def uninstall() -> None:
+    """install() 로 건 훅을 원래 함수로 되돌린다."""
+    _urllib3_connection.create_connection = _original_create_connection
+    socket.getaddrinfo = _original_getaddrinfo
+
+
+class RequestRecord:
+    """요청 하나의 측정값. Metrics.request() 안에서만 만든다."""
+
+    __slots__ = ("url", "status", "bytes", "dns", "connect", "ttfb", "transfer",
+                 "total", "retries", "error", "_started", "_headers_at")
+
+    def __init__(self, url: str):
+        self.url = url
+        self.status: int | None = None
+        self.bytes = 0
+        self.dns = 0.0
+        self.connect = 0.0
+        self.ttfb = 0.0
+        self.transfer = 0.0
+        self.total = 0.0
+        self.retries = 0
+        self.error: str | None = None
+        self._started = time.perf_counter()
+        self._headers_at: float | None = None
+
+    def response(self, res) -> None:
+        """응답 헤더를 받은 직후 호출 (stream=True 면 바디는 아직 안 읽은 상태)."""
+        self._headers_at = time.perf_counter()
+        self.status = res.status_code
+        self.ttfb = max(0.0, self._headers_at - self._started - self.dns - self.connect)
+        retries = getattr(getattr(res, "raw", None), "retries", None)
+        self.retries = len(retries.history) if retries is not None and retries.history else 0
+
+    def body(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """바디 청크를 그대로 흘려보내며 바이트 수와 수신 시간을 잰다."""
+        for chunk in chunks:
+            self.bytes += len(chunk)
+            yield chunk
+        if self._headers_at is not None:
+            self.transfer = time.perf_counter() - self._headers_at
+
+    def as_dict(self) -> dict:
+        return {
+            "url": self.url,
+            "status": self.status,
+            "bytes": self.bytes,
+            "dns": round(self.dns, 6),
+            "connect": round(self.connect, 6),
+            "ttfb": round(self.ttfb, 6),
+            "transfer": round(self.transfer, 6),
+            "total": round(self.total, 6),
+            "retries": self.retries,
+            "reused": self.dns == 0 and self.connect == 0,
+            "error": self.error,
+        }
+
+
+class Metrics:
+    """한 번의 스크립트 실행 동안 모은 요청 / 단계 측정값."""
+
+    def __init__(self, script: str):
+        self.script = script
+        self.started = datetime.now(timezone.utc)
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self.requests: list[RequestRecord] = []
+        self.phases: dict[str, dict] = {}
+
+    @contextmanager
+    def request(self, url: str) -> Iterator[RequestRecord]:
+        record = RequestRecord(url)
+        _local.record = record
+        try:
+            yield record
+        except Exception as e:
+            record.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _local.record = None
+            record.total = time.perf_counter() - record._started
+            with self._lock:
+                self.requests.append(record)
+
+    @contextmanager
+    def phase(self, name: str, records: int | None = None) -> Iterator[dict]:
+        """
+        단계 시간 측정. 같은 이름으로 여러 번 쓰면 누적된다.
+        블록 안에서 info["records"] 를 채우면 records/sec 가 계산된다.
+        """
+        info = {"records": records}
+        started = time.perf_counter()
+        try:
+            yield info
+        finally:
+            self.add_phase(name, time.perf_counter() - started, info["records"])
+
+    def add_phase(self, name: str, seconds: float, records: int | None = None) -> None:
+        with self._lock:
+            p = self.phases.setdefault(name, {"seconds": 0.0, "records": None, "calls": 0})
+            p["seconds"] += seconds
+            p["calls"] += 1
+            if records is not None:
+                p["records"] = (p["records"] or 0) + records
+
+    def as_dict(self) -> dict:
+        phases = {}
+        for name, p in self.phases.items():
+            rate = p["records"] / p["seconds"] if p["records"] and p["seconds"] else None
+            phases[name] = {**p, "seconds": round(p["seconds"], 6),
+                            "records_per_sec": round(rate, 1) if rate else None}
+        reqs = [r.as_dict() for r in self.requests]
+        return {
+            "v": METRICS_VERSION,
+            "script": self.script,
+            "started": self.started.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "wall_seconds": round(time.perf_counter() - self._t0, 6),
+            "python": platform.python_version(),
+            "phases": phases,
+            "requests": reqs,
+            "totals": {
+                "requests": len(reqs),
+                "bytes": sum(r["bytes"] for r in reqs),
+                "retries": sum(r["retries"] for r in reqs),
+                "errors": sum(1 for r in reqs if r["error"] or (r["status"] or 0) >= 400),
+                "not_modified": sum(1 for r in reqs if r["status"] == 304),
+            },
+        }
+
+    def write(self, path: Path) -> dict:
+        doc = self.as_dict()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(doc, ensure_ascii=False, indent=1), encoding="utf-8")
+        return doc
+
+    @staticmethod
+    def report_lines(doc: dict, slowest: int = 5) -> list[str]:
+        """요약 표 (출력용 문자열 줄): 단계별 시간 + 느린 요청 상위."""
+        lines = [f"  {'phase':18} {'sec':>8} {'records':>9} {'rec/s':>10}"]
+        for name, p in doc["phases"].items():
+            rate = f"{p['records_per_sec']:>10.0f}" if p["records_per_sec"] else f"{'-':>10}"
+            records = p["records"] if p["records"] is not None else "-"
+            lines.append(f"  {name:18} {p['seconds']:>8.3f} {records:>9} {rate}")
+        t = doc["totals"]
+        lines.append(f"  요청 {t['requests']}건, {t['bytes'] // 1024} KB, 재시도 {t['retries']}, "
+                     f"오류 {t['errors']}, 304 {t['not_modified']} — 전체 {doc['wall_seconds']:.2f}s")
+        reqs = sorted(doc["requests"], key=lambda r: r["total"], reverse=True)[:slowest]
+        if reqs:
+            lines.append(f"  {'느린 요청':14} {'dns':>6} {'conn':>6} {'ttfb':>6} {'xfer':>6} {'st':>4}")
+            for r in reqs:
+                name = r["url"].rsplit("/", 1)[-1][:16]
+                lines.append(f"  {name:16} {r['dns'] * 1000:>6.0f} {r['connect'] * 1000:>6.0f} "
+                             f"{r['ttfb'] * 1000:>6.0f} {r['transfer'] * 1000:>6.0f} {r['status'] or '-':>4}  (ms)")
+        return lines
+
+
+def run_profiled(fn, out: Path, top: int = 25):
+    """fn() 을 cProfile 로 감싸 실행하고 out(.prof) 저장 + 누적 시간 상위 top 개 출력."""
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(fn)
+    finally:
+        out = Path(out)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(out)
+        buf = io.StringIO()
+        pstats.Stats(profiler, stream=buf).sort_stats("cumulative").print_stats(top)
+        print(buf.getvalue())
+        print(f"🧪 프로파일 저장: {out} (python -m pstats {out.name} 로 열람)")
+
+
+class IterTimer:
+    """이터레이터의 next() 에 걸린 시간만 누적 (스트리밍 파이프라인에서 생산자/소비자 시간 분리용)."""
+
+    __slots__ = ("seconds",)
+
+    def __init__(self):
+        self.seconds = 0.0
+
+    def wrap(self, iterable: Iterable) -> Iterator:
+        it = iter(iterable)
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(it)
+            except StopIteration:
+                self.seconds += time.perf_counter() - started
+                return
+            self.seconds += time.perf_counter() - started
+            yield item
@@ -0,0 +1,285 @@
+"""
+미션 레코드 (__slots__) + 열 지향 슬롯 저장소 (배치 필터)
+
+압축 스키마 {b,t,so,cn,l,c,bf,df,s} 를 아는 곳은 여기 한 군데다.
+  Mission.from_raw()    bulkmissions 원본 미션 → 레코드 (transform.py 가 사용)
+  Mission.to_compact()  레코드 → 앱이 읽는 압축 dict (lib/models/mission_model.dart 의 Mission.fromJson)
+  Mission.from_compact()
+
+SlotStore 는 daily_missions.json 의 슬롯들을 행(미션) 단위 열로 펼쳐 둔다.
+  slot / pos              array — 행 → 슬롯번호(epoch 초 // 1800), 슬롯 내 위치
+  biome / type / ...      bytearray — 행마다 열 테이블의 코드 1바이트
+  warnings / seasons      주의보·시즌 "조합" 을 값 하나로 보고 코드화 (조합 수는 수십 개)
+
+필터 하나 = bytes.translate 한 번으로 행마다 0/1 바이트를 만드는 것이고, 여러 조건은
+그 바이트열을 정수로 읽어 & 로 합친다. 슬롯 수천 개 × 미션 수십 개를 dict 루프 없이
+C 수준의 한 번의 패스로 거른다. NumPy 없이 표준 라이브러리만 쓴다.
+
+  store = SlotStore.load(Path("data/daily_missions.json"))
+  store.count(mutator="Double XP", type="Point Extraction")
+  store.hits(warning="Low Oxygen", biome=["Magma Core", "Salt Pits"], length=3)
+  store.frequency("mutator", season="s6")
+"""
+
+import itertools
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from .codec import CodecError, slot_index, slot_key
+from .jsonstream import iter_file_items
+
+WARNING_SEPARATOR = ", "   # df 는 주의보 이름을 ", " 로 이은 문자열 (앱은 ',' 로 나눠 trim)
+MAX_CODES = 256            # 열 하나의 서로 다른 값 수 상한 (코드 1바이트)
+
+# 필터 이름 → 열 (mission_archive.py / MissionArchive.FILTERS 와 같은 이름)
+FILTERS = {
+    "mutator": "mutator",
+    "warning": "warnings",
+    "type": "type",
+    "biome": "biome",
+    "secondary": "secondary",
+    "length": "length",
+    "complexity": "complexity",
+    "season": "seasons",
+}
+COLUMNS = ("biome", "type", "secondary", "length", "complexity", "mutator", "warnings", "seasons")
+MULTI_VALUED = {"warnings", "seasons"}
+
+
+class Mission:
+    """미션 하나 (앱 Mission 모델과 같은 필드, 주의보·시즌은 튜플)."""
+
+    __slots__ = ("biome", "type", "secondary", "codename", "length", "complexity",
+                 "mutator", "warnings", "seasons")
+
+    def __init__(
+        self,
+        biome: str,
+        type: str | None,
+        secondary: str | None = None,
+        codename: str | None = None,
+        length: int = 1,
+        complexity: int = 1,
+        mutator: str | None = None,
+        warnings: tuple[str, ...] = (),
+        seasons: tuple[str, ...] | None = (),
+    ):
+        self.biome = biome
+        self.type = type
+        self.secondary = secondary
+        self.codename = codename
+        self.length = length
+        self.complexity = complexity
+        self.mutator = mutator
+        self.warnings = warnings
+        self.seasons = seasons
+
+    @classmethod
+    def from_raw(cls, biome: str, m: dict) -> "Mission":
+        """bulkmissions 원본 미션 하나 → 레코드."""
+        seasons = m.get("included_in", [])
+        return cls(
+            biome,
+            m.get("PrimaryObjective"),
+            m.get("SecondaryObjective"),
+            m.get("CodeName"),
+            int(m.get("Length", 1)),
+            int(m.get("Complexity", 1)),
+            m.get("MissionMutator") or None,
+            tuple(m.get("MissionWarnings") or ()),
+            tuple(seasons) if seasons is not None else None,
+        )
+
+    @classmethod
+    def from_compact(cls, m: dict) -> "Mission":
+        df = m.get("df")
+        seasons = m.get("s")
+        return cls(
+            m["b"], m["t"], m.get("so"), m.get("cn"), m.get("l", 1), m.get("c", 1), m.get("bf"),
+            tuple(df.split(WARNING_SEPARATOR)) if df else (),
+            tuple(seasons) if seasons is not None else None,
+        )
+
+    def to_compact(self) -> dict:
+        """앱용 압축 dict (키 순서까지 daily_missions.json 과 동일)."""
+        return {
+            "b": self.biome,
+            "t": self.type,
+            "so": self.secondary,
+            "cn": self.codename,
+            "l": self.length,
+            "c": self.complexity,
+            "bf": self.mutator,
+            "df": WARNING_SEPARATOR.join(self.warnings) if self.warnings else None,
+            "s": list(self.seasons) if self.seasons is not None else None,
+        }
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Mission):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"Mission({self.biome!r}, {self.type!r}, mutator={self.mutator!r}, warnings={self.warnings!r})"
+
+
+class SlotStore:
+    """슬롯 → 미션 목록을 열 단위로 보관하고 조건 필터를 일괄 처리한다."""
+
+    def __init__(self):
+        self.slot = array("q")          # 행 → 슬롯번호
+        self.pos = array("H")           # 행 → 슬롯 내 위치
+        self.codename: list[str | None] = []
+        self._columns: dict[str, bytearray] = {c: bytearray() for c in COLUMNS}
+        self._tables: dict[str, list] = {c: [] for c in COLUMNS}
+        self._codes: dict[str, dict] = {c: {} for c in COLUMNS}
+        self._sorted = True
+
+    # ── 적재 ──────────────────────────────────────────────────────────────────
+    @classmethod
+    def from_slots(cls, slots: Iterable[tuple[str, list[dict]]]) -> "SlotStore":
+        """(타임슬롯 키, 압축 레코드 목록) 스트림 → 저장소. 타임슬롯이 아닌 키('dailyDeal' 등)는 제외."""
+        store = cls()
+        for ts, missions in slots:
+            try:
+                si = slot_index(ts)
+            except CodecError:
+                continue
+            store.append(si, [Mission.from_compact(m) for m in missions])
+        return store
+
+    @classmethod
+    def load(cls, path: Path) -> "SlotStore":
+        """daily_missions.json 을 증분 파싱해 적재."""
+        return cls.from_slots(iter_file_items(Path(path)))
+
+    def _code(self, column: str, value) -> int:
+        codes = self._codes[column]
+        code = codes.get(value)
+        if code is None:
+            code = len(codes)
+            if code >= MAX_CODES:
+                raise ValueError(f"{column} 열의 서로 다른 값이 {MAX_CODES}개를 넘습니다")
+            codes[value] = code
+            self._tables[column].append(value)
+        return code
+
+    def append(self, slot: int, missions: list[Mission]) -> None:
+        """슬롯 하나의 미션을 행으로 추가 (슬롯번호가 오름차순이면 기간 필터가 이분 탐색을 쓴다)."""
+        if self.slot and slot < self.slot[-1]:
+            self._sorted = False
+        cols = self._columns
+        for pos, m in enumerate(missions):
+            self.slot.append(slot)
+            self.pos.append(pos)
+            self.codename.append(m.codename)
+            for column in COLUMNS:
+                cols[column].append(self._code(column, getattr(m, column)))
+
+    def __len__(self) -> int:
+        return len(self.slot)
+
+    def values(self, name: str) -> list:
+        """필터에 쓸 수 있는 값 목록 (예: values('warning'))."""
+        column = FILTERS[name]
+        if column in MULTI_VALUED:
+            return sorted({v for combo in self._tables[column] if combo for v in combo})
+        return list(self._tables[column])
+
+    # ── 필터 (행마다 0x00/0x01 바이트를 정수 하나로 묶은 마스크) ──────────────
+    def _full(self) -> int:
+        return int.from_bytes(b"\x01" * len(self), "little")
+
+    def _value_mask(self, name: str, wanted) -> int:
+        if name not in FILTERS:
+            raise ValueError(f"알 수 없는 필터: {name} (가능: {', '.join(FILTERS)})")
+        column = FILTERS[name]
+        wanted = set(wanted) if isinstance(wanted, (list, tuple, set, frozenset)) else {wanted}
+        table = self._tables[column]
+        if column in MULTI_VALUED:
+            hits = [i for i, combo in enumerate(table) if combo and not wanted.isdisjoint(combo)]
+        else:
+            hits = [i for i, v in enumerate(table) if v in wanted]
+        if not hits:
+            return 0
+        translate = bytearray(256)
+        for i in hits:
+            translate[i] = 1
+        return int.from_bytes(self._columns[column].translate(translate), "little")
+
+    def _range_mask(self, start: int | None, end: int | None) -> int:
+        n = len(self)
+        if self._sorted:
+            lo = bisect_left(self.slot, start) if start is not None else 0
+            hi = bisect_left(self.slot, end) if end is not None else n
+            hi = max(lo, hi)
+            return int.from_bytes(bytes(lo) + b"\x01" * (hi - lo) + bytes(n - hi), "little")
+        lo = start if start is not None else float("-inf")
+        hi = end if end is not None else float("inf")
+        return int.from_bytes(bytes(lo <= s < hi for s in self.slot), "little")
+
+    def mask(self, start: int | None = None, end: int | None = None, **filters) -> int:
+        """
+        조건을 모두 만족하는 행의 마스크. 값에 목록을 주면 그중 하나(OR).
+        warning / season 은 해당 값을 포함하는 미션, mutator=None 은 변이 없는 미션.
+        start / end 는 슬롯번호 범위 [start, end).
+        """
+        result = self._full()
+        if start is not None or end is not None:
+            result &= self._range_mask(start, end)
+        for name, wanted in filters.items():
+            result &= self._value_mask(name, wanted)
+            if not result:
+                break
+        return result
+
+    def _selected(self, mask: int) -> bytes:
+        return mask.to_bytes(len(self), "little")
+
+    def rows(self, **filters) -> list[int]:
+        """조건에 맞는 행 번호 (행 순서 = 슬롯 순서)."""
+        return list(itertools.compress(range(len(self)), self._selected(self.mask(**filters))))
+
+    def count(self, **filters) -> int:
+        return self._selected(self.mask(**filters)).count(1)
+
+    def hits(self, **filters) -> list[tuple[str, int]]:
+        """(타임슬롯 키, 슬롯 내 위치) 목록 — MissionIndex.find() 와 같은 모양."""
+        return [(slot_key(self.slot[r]), self.pos[r]) for r in self.rows(**filters)]
+
+    def slots(self, **filters) -> list[str]:
+        """조건을 만족하는 미션이 하나라도 있는 타임슬롯 키 (행 순서, 중복 없음)."""
+        selected = itertools.compress(self.slot, self._selected(self.mask(**filters)))
+        return [slot_key(si) for si, _ in itertools.groupby(selected)]
+
+    def frequency(self, by: str, **filters) -> list[tuple[object, int]]:
+        """조건에 맞는 행을 by 필터 값별로 센다 (많은 순). 주의보·시즌은 값마다 따로 센다."""
+        column = FILTERS[by]
+        selected = bytes(itertools.compress(self._columns[column], self._selected(self.mask(**filters))))
+        counts: Counter = Counter()
+        for code, value in enumerate(self._tables[column]):
+            n = selected.count(code)
+            if not n:
+                continue
+            if column in MULTI_VALUED:
+                for v in value or ():
+                    counts[v] += n
+            else:
+                counts[value] += n
+        return counts.most_common()
+
+    # ── 행 → 레코드 ───────────────────────────────────────────────────────────
+    def mission(self, row: int) -> Mission:
+        values = {c: self._tables[c][self._columns[c][row]] for c in COLUMNS}
+        return Mission(codename=self.codename[row], **values)
+
+    def missions(self, **filters) -> list[Mission]:
+        return [self.mission(r) for r in self.rows(**filters)]
+
+    def iter_slots(self) -> Iterator[tuple[str, list[dict]]]:
+        """(타임슬롯 키, 압축 레코드 목록) — from_slots() 의 역 (미션이 없는 슬롯은 행이 없어 빠진다)."""
+        for si, rows in itertools.groupby(range(len(self)), key=self.slot.__getitem__):
+            yield slot_key(si), [self.mission(r).to_compact() for r in rows]
@@ -0,0 +1,64 @@
+"""
+토큰 버킷 요청 속도 제한기 (스레드 안전) + 실패 재시도 백오프
+
+고정 time.sleep 대신, 초당 rate 개의 토큰이 burst 개까지 쌓이고 요청마다 하나씩 쓴다.
+여러 스레드가 같은 버킷을 공유하면 전체 요청 속도가 rate 를 넘지 않는다.
+"""
+
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate 는 0보다 커야 합니다")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """토큰 하나를 얻을 때까지 기다린다. 반환: 기다린 시간(초)."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class HostRateLimiter:
+    """호스트별 TokenBucket — 같은 호스트로 가는 요청만 서로 속도를 나눠 쓴다."""
+
+    def __init__(self, rates: dict[str, tuple[float, int]], default: tuple[float, int]):
+        self._rates = rates
+        self._default = default
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> float:
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(*self._rates.get(host, self._default))
+            bucket = self._buckets[host]
+        return bucket.acquire()
+
+
+def backoff_delay(failures: int, base: float, cap: float, rng: random.Random | None = None) -> float:
+    """
+    연속 실패 failures 회 뒤의 재시도 대기(초): min(cap, base * 2^(failures-1)) 의 50~100% 에서 무작위.
+    여러 인스턴스가 같은 순간에 몰려 재시도하지 않도록 지터를 섞는다.
+    """
+    delay = min(cap, base * 2 ** max(0, failures - 1))
+    return delay * (rng or random).uniform(0.5, 1.0)
@@ -0,0 +1,122 @@
+"""
+시즌별 미션 뷰 — 시즌 하나만 쓰는 클라이언트가 자기 몫만 받도록 daily_missions.json 을 나눈다
+
+압축 레코드의 s (예: ["s0","s1","s3","s6"]) 는 그 미션이 열리는 시즌 목록이고, 앱은 고른 시즌이
+들어 있는 미션만 보여 준다 (live_missions_tab.dart: m.seasons.contains(currentSeason)).
+전체 파일을 받으면 다른 시즌 미션까지 내려받아 디코드하므로 data/seasons/ 아래에 다음을 만든다.
+
+  data/seasons/daily_missions.s6.json   {타임슬롯: [레코드...]} — s 에 s6 이 있는 미션만 (기존 포맷 그대로)
+  data/seasons/manifest.json            뷰마다 파일 / 슬롯 수 / 미션 수 / 크기(원본·gzip) / sha256
+
+s 가 null 이거나 빈 미션은 어느 시즌 뷰에도 들어가지 않는다 (앱에서도 보이지 않는다).
+전체 시즌이 필요한 클라이언트는 daily_missions.json 을 그대로 받는다. 미션을 한 번씩만 싣고
+시즌 소속을 위치 목록으로 붙이는 전체 시즌 뷰(all.json)도 만들어 봤지만, 반복되는 시즌 목록은
+gzip 이 거의 공짜로 줄이므로 실데이터에서 전송 크기가 원본의 약 104% 라 게시하지 않는다
+(예전 실행이 남긴 all.json 은 다음 실행에서 정리된다).
+시즌 뷰는 원본을 시즌마다 한 번씩 증분 파싱해 써 내려가므로 메모리 사용량이 슬롯 수와 무관하다.
+"""
+
+import gzip
+import hashlib
+import json
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+
+from .codec import CodecError, slot_index
+from .jsonstream import write_if_changed, write_object_stream
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+Slots = Iterable[tuple[str, list[dict]]]
+
+
+def view_file_name(season: str) -> str:
+    return f"daily_missions.{season}.json"
+
+
+def _time_slots(slots: Slots) -> Iterator[tuple[str, list[dict]]]:
+    """타임슬롯이 아닌 키('dailyDeal' 등)는 제외."""
+    for ts, missions in slots:
+        try:
+            slot_index(ts)
+        except CodecError:
+            continue
+        yield ts, missions
+
+
+def list_seasons(slots: Slots) -> list[str]:
+    """데이터에 나오는 시즌 (앱 availableSeasons 와 같은 정렬)."""
+    return sorted({s for _, missions in _time_slots(slots) for m in missions for s in m["s"] or ()})
+
+
+def season_slots(slots: Slots, season: str) -> Iterator[tuple[str, list[dict]]]:
+    """시즌 뷰의 (타임슬롯, 레코드) — 그 시즌 미션이 하나도 없는 슬롯은 빠진다."""
+    for ts, missions in _time_slots(slots):
+        picked = [m for m in missions if season in (m["s"] or ())]
+        if picked:
+            yield ts, picked
+
+
+def gzip_size(data: bytes) -> int:
+    return len(gzip.compress(data, compresslevel=9, mtime=0))
+
+
+def _entry(path: Path, slots: int, missions: int) -> dict:
+    data = path.read_bytes()
+    return {
+        "file": path.name,
+        "slots": slots,
+        "missions": missions,
+        "bytes": len(data),
+        "gzip_bytes": gzip_size(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+
+
+def _counted(slots: Slots, counts: list[int]) -> Iterator[tuple[str, list[dict]]]:
+    for ts, missions in slots:
+        counts[0] += 1
+        counts[1] += len(missions)
+        yield ts, missions
+
+
+def write_views(items: Callable[[], Slots], out_dir: Path) -> dict:
+    """
+    시즌 뷰 + manifest 를 out_dir 에 쓴다. 반환: manifest.
+    items 는 호출할 때마다 원본 (타임슬롯, 레코드) 스트림을 새로 여는 함수 (시즌마다 한 번씩 읽는다).
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    seasons = list_seasons(items())
+    views = {}
+
+    for season in seasons:
+        counts = [0, 0]   # 슬롯 수, 미션 수
+        path = out_dir / view_file_name(season)
+        write_object_stream(path, _counted(season_slots(items(), season), counts))
+        views[season] = _entry(path, *counts)
+
+    # 사라진 시즌의 예전 뷰 (와 예전에 쓰던 all.json) 정리
+    keep = {v["file"] for v in views.values()} | {MANIFEST_NAME}
+    for old in out_dir.glob("*.json"):
+        if old.name not in keep:
+            old.unlink()
+
+    manifest = {"v": MANIFEST_VERSION, "seasons": seasons, "views": views}
+    write_if_changed(out_dir / MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=1).encode("utf-8"))
+    return manifest
+
+
+def size_report(manifest: dict, full: Path) -> list[str]:
+    """뷰별 크기 표 — 전체 daily_missions.json 대비 비율 (출력용 문자열 줄)."""
+    raw = full.stat().st_size
+    packed = gzip_size(full.read_bytes())
+    lines = [f"  {'view':8} {'slots':>6} {'missions':>9} {'raw':>16} {'gzip':>15}",
+             f"  {'(full)':8} {'':>6} {'':>9} {raw:>9} ({1:>4.0%}) {packed:>8} ({1:>4.0%})"]
+    for name, v in manifest["views"].items():
+        lines.append(f"  {name:8} {v['slots']:>6} {v['missions']:>9} "
+                     f"{v['bytes']:>9} ({v['bytes'] / raw:>4.0%}) "
+                     f"{v['gzip_bytes']:>8} ({v['gzip_bytes'] / packed:>4.0%})")
+    return lines
+
@@ -0,0 +1,133 @@
+"""
+daily_missions.json → 슬롯(또는 시간) 단위 샤드 + manifest
+
+클라이언트는 현재 슬롯과 다음 몇 슬롯만 필요하므로, 전체 파일 대신 필요한 샤드만
+받거나 읽을 수 있도록 data/missions/ 아래에 나눠 쓴다.
+
+  data/missions/2026-03-02T00-30-00Z.json   {"2026-03-02T00:30:00Z": [...]}  (기존 포맷 그대로)
+  data/missions/manifest.json
+    {
+      "v": 1,
+      "granularity": "slot",           slot | hour
+      "shards": [
+        {"file": "...json", "slots": ["2026-03-02T00:30:00Z"], "bytes": 4012, "sha256": "..."},
+        ...
+      ]
+    }
+
+샤드 본문은 전체 파일과 같은 {타임슬롯: [레코드...]} 형태라 앱의 기존 파서로 그대로 읽힌다.
+파일명은 Windows 호환을 위해 ':' 를 '-' 로 바꾼다 (DD_..T11-00-00Z.json 과 같은 규칙).
+해시가 같은 샤드는 다시 쓰지 않고, manifest 에서 빠진 샤드 파일은 지운다.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from .codec import CodecError, slot_index
+from .jsonstream import write_if_changed
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+GRANULARITIES = ("slot", "hour")
+
+
+class ShardReport:
+    __slots__ = ("written", "unchanged", "removed", "bytes")
+
+    def __init__(self):
+        self.written = 0
+        self.unchanged = 0
+        self.removed = 0
+        self.bytes = 0
+
+
+def shard_file_name(time_key: str) -> str:
+    return time_key.replace(":", "-") + ".json"
+
+
+def _shard_start(time_key: str, granularity: str) -> str:
+    """샤드 대표 키 — slot 이면 자기 자신, hour 면 정시(:00) 키."""
+    if granularity == "hour":
+        return time_key[:14] + "00:00Z"
+    return time_key
+
+
+def _group_shards(
+    slots: Iterable[tuple[str, list[dict]]],
+    granularity: str,
+) -> Iterator[tuple[str, list[tuple[str, list[dict]]]]]:
+    """연속된 슬롯을 샤드 단위로 묶는다. 타임슬롯이 아닌 키('dailyDeal' 등)는 제외."""
+    current: str | None = None
+    group: list[tuple[str, list[dict]]] = []
+    for ts, missions in slots:
+        try:
+            slot_index(ts)
+        except CodecError:
+            continue
+        start = _shard_start(ts, granularity)
+        if start != current and group:
+            yield current, group
+            group = []
+        current = start
+        group.append((ts, missions))
+    if group:
+        yield current, group
+
+
+def write_shards(
+    slots: Iterable[tuple[str, list[dict]]],
+    out_dir: Path,
+    granularity: str = "slot",
+) -> ShardReport:
+    """슬롯 스트림을 샤드 파일로 나눠 쓰고 manifest 를 갱신한다 (샤드 하나씩 메모리에 유지)."""
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"지원하지 않는 샤드 단위: {granularity}")
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    report = ShardReport()
+    entries = []
+
+    for start, group in _group_shards(slots, granularity):
+        name = shard_file_name(start)
+        body = json.dumps(dict(group), ensure_ascii=False).encode("utf-8")
+        if write_if_changed(out_dir / name, body):
+            report.written += 1
+        else:
+            report.unchanged += 1
+        report.bytes += len(body)
+        entries.append({
+            "file": name,
+            "slots": [ts for ts, _ in group],
+            "bytes": len(body),
+            "sha256": hashlib.sha256(body).hexdigest(),
+        })
+
+    # manifest 에서 빠진 예전 샤드 정리
+    keep = {e["file"] for e in entries} | {MANIFEST_NAME}
+    for path in out_dir.glob("*.json"):
+        if path.name not in keep:
+            path.unlink()
+            report.removed += 1
+
+    manifest = {"v": MANIFEST_VERSION, "granularity": granularity, "shards": entries}
+    write_if_changed(out_dir / MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=1).encode("utf-8"))
+    return report
+
+
+def load_manifest(out_dir: Path) -> dict:
+    with open(Path(out_dir) / MANIFEST_NAME, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def read_slot(out_dir: Path, time_key: str) -> list[dict] | None:
+    """manifest 로 샤드를 찾아 해당 슬롯의 레코드만 읽는다 (없으면 None)."""
+    out_dir = Path(out_dir)
+    manifest = load_manifest(out_dir)
+    name = shard_file_name(_shard_start(time_key, manifest["granularity"]))
+    path = out_dir / name
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get(time_key)
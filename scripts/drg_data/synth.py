@@ -0,0 +1,98 @@
+"""
+합성 doublexp.net 데이터 (벤치마크 / 로컬 대역 서버 공용)
+
+bulkmissions 하루치 파일과 같은 형식(타임슬롯 + dailyDeal + ver)과 주간 Deep Dive 파일을
+시드 고정 난수로 만든다.
+"""
+
+import json
+import random
+from datetime import date, timedelta
+from pathlib import Path
+
+BIOMES = [
+    "Azure Weald", "Crystalline Caverns", "Dense Biozone", "Fungus Bogs",
+    "Glacial Strata", "Hollow Bough", "Magma Core", "Radioactive Exclusion Zone",
+    "Salt Pits", "Sandblasted Corridors", "Ossuary Depths",
+]
+MISSION_TYPES = [
+    "Mining Expedition", "Egg Hunt", "On-Site Refining", "Point Extraction",
+    "Salvage Operation", "Escort Duty", "Elimination", "Industrial Sabotage",
+    "Deep Scan", "Heavy Excavation",
+]
+SECONDARIES = ["Fester Fleas", "Gunk Seeds", "Glyphid Eggs", "Dystrum", "Ebonuts", "Fossils", "Apoca Blooms"]
+MUTATORS = ["Double XP", "Gold Rush", "Mineral Mania", "Low Gravity", "Volatile Guts", "Golden Bugs"]
+WARNINGS = ["Mactera Plague", "Low Oxygen", "Parasites", "Swarmageddon", "Lithophage Outbreak", "Elite Threat"]
+SEASONS = [["s0", "s1", "s3", "s6"], ["s3"], ["s1"], ["s6"]]
+
+
+def synth_day(day: date, rng: random.Random, slots: int = 48, biomes: int = 5, per_biome: int = 5) -> dict:
+    """doublexp.net bulkmissions 형식의 하루치 합성 데이터 (타임슬롯 + dailyDeal + ver)."""
+    out = {}
+    step = 24 * 60 // slots
+    for i in range(slots):
+        minutes = step * i
+        ts = f"{day:%Y-%m-%d}T{minutes // 60:02d}:{minutes % 60:02d}:00Z"
+        content = {"Biomes": {}, "timestamp": ts}
+        for b in rng.sample(BIOMES, biomes):
+            missions = []
+            for _ in range(per_biome):
+                m = {
+                    "PrimaryObjective": rng.choice(MISSION_TYPES),
+                    "SecondaryObjective": rng.choice(SECONDARIES),
+                    "CodeName": f"Code {rng.randrange(10_000)}",
+                    "Length": str(rng.randint(1, 3)),
+                    "Complexity": str(rng.randint(1, 3)),
+                    "id": rng.randrange(100_000),
+                    "included_in": rng.choice(SEASONS),
+                }
+                if rng.random() < 0.25:
+                    m["MissionMutator"] = rng.choice(MUTATORS)
+                if rng.random() < 0.3:
+                    m["MissionWarnings"] = rng.sample(WARNINGS, rng.randint(1, 2))
+                missions.append(m)
+            content["Biomes"][b] = missions
+        out[ts] = content
+    out["dailyDeal"] = {"ResourceAmount": rng.randint(50, 200), "DealType": "Buy", "Resource": "Jadiz"}
+    out["ver"] = 5
+    return out
+
+
+def synth_deep_dive(rng: random.Random) -> dict:
+    """DD_<날짜>T11-00-00Z.json 형식의 합성 Deep Dive (Normal / Elite 각 3 스테이지)."""
+    dives = {}
+    for kind in ("Deep Dive Normal", "Deep Dive Elite"):
+        stages = []
+        for i in range(3):
+            stage = {
+                "PrimaryObjective": rng.choice(MISSION_TYPES),
+                "SecondaryObjective": rng.choice(SECONDARIES),
+                "Length": str(rng.randint(1, 2)),
+                "Complexity": str(rng.randint(1, 3)),
+                "id": rng.randrange(1_000),
+            }
+            if rng.random() < 0.7:
+                stage["MissionWarnings"] = rng.sample(WARNINGS, 1)
+            stages.append(stage)
+        dives[kind] = {"Stages": stages, "Biome": rng.choice(BIOMES), "CodeName": f"Code {rng.randrange(10_000)}"}
+    return {"Deep Dives": dives}
+
+
+def write_fixture(
+    root: Path,
+    days: int,
+    seed: int = 0,
+    slots: int = 48,
+    biomes: int = 5,
+    per_biome: int = 5,
+) -> list[tuple[str, Path]]:
+    rng = random.Random(seed)
+    first = date(2026, 1, 1)
+    sources = []
+    for i in range(days):
+        d = first + timedelta(days=i)
+        path = root / f"{d:%Y-%m-%d}.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(synth_day(d, rng, slots, biomes, per_biome), f)
+        sources.append((d.strftime("%Y-%m-%d"), path))
+    return sources
@@ -0,0 +1,82 @@
+"""
+30분 슬롯 타임라인 — 빈 슬롯 찾기 / 증분 병합 / 보존 기간 정리
+
+하루는 48 슬롯(00:00 ~ 23:30 UTC)이다. 기존 daily_missions.json 의 키를 기대 타임라인과
+비교해 빈 슬롯이 있는 날짜만 다시 받고, 받은 슬롯을 기존 슬롯 위에 덮어쓴 뒤
+보존 기간 밖의 슬롯을 버린다 (fetch_daily_missions.py --incremental).
+--watch 의 깨어날 시각도 같은 슬롯 경계(MissionService._getTimeKey 와 같은 30분 단위)로 계산한다.
+"""
+
+from collections.abc import Iterable
+
+from .codec import SLOT_MINUTES, SLOT_SECONDS, CodecError, slot_index, slot_key
+
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+
+
+def day_start(date: str) -> int:
+    """'YYYY-MM-DD' → 그날 00:00 UTC 의 슬롯번호."""
+    return slot_index(f"{date}T00:00:00Z")
+
+
+def day_keys(date: str) -> list[str]:
+    """그날의 타임슬롯 키 48개."""
+    start = day_start(date)
+    return [slot_key(start + i) for i in range(SLOTS_PER_DAY)]
+
+
+def next_boundary(now: float, offset: float = 0.0) -> float:
+    """now(epoch 초) 이후 첫 슬롯 경계 + offset 초 (이미 지난 경우 다음 경계)."""
+    boundary = (int(now) // SLOT_SECONDS) * SLOT_SECONDS + offset
+    while boundary <= now:
+        boundary += SLOT_SECONDS
+    return boundary
+
+
+def is_slot_key(key: str) -> bool:
+    """30분 타임슬롯 키인지 ('dailyDeal' 같은 키는 아니다)."""
+    try:
+        slot_index(key)
+    except CodecError:
+        return False
+    return True
+
+
+def count_slots(keys: Iterable[str]) -> int:
+    """타임슬롯 키 수 — 병합 / 증분 보고용 ('dailyDeal' 등은 세지 않는다)."""
+    return sum(1 for key in keys if is_slot_key(key))
+
+
+def missing_slots(keys: Iterable[str], dates: list[str]) -> dict[str, int]:
+    """날짜별 빈 슬롯 수 (빈 슬롯이 있는 날짜만)."""
+    have = {key for key in keys if is_slot_key(key)}
+    gaps = {}
+    for date in dates:
+        n = sum(1 for k in day_keys(date) if k not in have)
+        if n:
+            gaps[date] = n
+    return gaps
+
+
+def merge_slots(
+    existing: dict[str, list],
+    fresh: Iterable[tuple[str, list]],
+    keep_from: int,
+) -> tuple[dict[str, list], int]:
+    """
+    기존 슬롯 위에 새 슬롯을 덮어쓰고 keep_from(슬롯번호) 이전 슬롯은 버린다.
+    반환: (병합 결과, 버린 타임슬롯 수). 타임슬롯 키는 시간순, 그 밖의 키('dailyDeal' 등)는
+    뒤에 두고 새 값을 우선한다 (보존 기간과 무관하게 남고 버린 수에도 들지 않는다).
+    """
+    slots: dict[int, tuple[str, list]] = {}
+    others: dict[str, list] = {}
+    for source in (existing.items(), fresh):
+        for key, value in source:
+            try:
+                slots[slot_index(key)] = (key, value)
+            except CodecError:
+                others[key] = value
+    pruned = sum(1 for si in slots if si < keep_from)
+    merged = {key: value for si, (key, value) in sorted(slots.items()) if si >= keep_from}
+    merged.update(others)
+    return merged, pruned
@@ -0,0 +1,124 @@
+"""
+bulkmissions 원본 → 앱용 압축 레코드 {b,t,so,cn,l,c,bf,df,s} 변환
+
+두 가지 경로를 제공한다.
+  transform_in_memory() : 날짜별 원본 dict 전체를 받아 한 번에 변환 (기존 방식, 비교용)
+  iter_compact_slots()  : 날짜별 원본 파일을 증분 파싱하며 타임슬롯 단위로 yield
+두 경로의 결과는 같은 내용이다 (iter_compact_slots 는 'dailyDeal' 같은 타임슬롯이 아닌 키를 맨 뒤에 둔다).
+"""
+
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from .jsonstream import iter_object_items
+from .missions import Mission
+from .timeline import is_slot_key
+
+
+def compact_mission(biome_name: str, m: dict) -> dict:
+    """원본 미션 하나 → 압축 레코드 (스키마는 missions.Mission 이 정의)."""
+    return Mission.from_raw(biome_name, m).to_compact()
+
+
+def compact_slot(content: dict) -> list[dict]:
+    """타임슬롯 하나의 Biomes → 압축 레코드 목록."""
+    missions_list = []
+    biomes = content.get("Biomes", {})
+    for biome_name, missions in biomes.items():
+        for m in missions:
+            missions_list.append(compact_mission(biome_name, m))
+    return missions_list
+
+
+def transform_in_memory(raw_days: list[dict]) -> dict[str, list[dict]]:
+    """날짜순 원본 dict 목록 → {타임슬롯: [레코드...]} (모든 데이터를 메모리에 유지)."""
+    optimized_data = {}
+    for raw in raw_days:
+        for ts, content in raw.items():
+            if not isinstance(content, dict):
+                continue
+            optimized_data[ts] = compact_slot(content)
+    return optimized_data
+
+
+class SlotStats:
+    """스트리밍 변환 중 누적되는 통계 (출력 후 요약 / 계측용). 타임슬롯만 센다 ('dailyDeal' 등 제외)."""
+    __slots__ = ("slots", "missions", "double_xp", "transform_seconds")
+
+    def __init__(self):
+        self.slots = 0
+        self.missions = 0
+        self.double_xp = False
+        self.transform_seconds = 0.0   # compact_slot 에 쓴 시간 (나머지는 파싱)
+
+
+def _read_day(path: Path, stats: SlotStats) -> tuple[dict[str, list[dict]], dict[str, list[dict]]]:
+    """날짜 파일 하나를 끝까지 파싱·변환 → ({타임슬롯: 레코드}, {'dailyDeal' 등: 레코드}). 실패 시 예외."""
+    day: dict[str, list[dict]] = {}
+    others: dict[str, list[dict]] = {}
+    with open(path, encoding="utf-8") as f:
+        for ts, content in iter_object_items(f):
+            if not isinstance(content, dict):
+                continue
+            started = time.perf_counter()
+            missions = compact_slot(content)
+            stats.transform_seconds += time.perf_counter() - started
+            (day if is_slot_key(ts) else others)[ts] = missions
+    return day, others
+
+
+def _count(stats: SlotStats, day: dict[str, list[dict]]) -> None:
+    for missions in day.values():
+        stats.slots += 1
+        stats.missions += len(missions)
+        if not stats.double_xp:
+            stats.double_xp = any(m["bf"] == "Double XP" for m in missions)
+
+
+def iter_compact_slots(
+    sources: list[tuple[str, Path]],
+    stats: SlotStats | None = None,
+    on_error=None,
+) -> Iterator[tuple[str, list[dict]]]:
+    """
+    (날짜 'YYYY-MM-DD', 원본 파일 경로) 목록을 날짜순으로 증분 파싱하며
+    (타임슬롯, 압축 레코드 목록)을 하나씩 yield 한다. 원본은 한 번만 읽는다.
+
+    날짜 파일은 끝까지 파싱한 뒤에야 내보내고, 직전 날짜 하나는 다음 날짜를 읽을 때까지 들고 있다.
+    그래서 같은 타임슬롯이 다시 나오면 transform_in_memory 처럼 처음 자리에 마지막 값이 남는다
+    (날짜 경계 슬롯이 이웃 파일에 겹치는 경우). 메모리는 날짜 수와 무관하게 이틀치로 묶인다.
+    날짜 파일마다 반복되는 'dailyDeal' 같은 키는 마지막 값을 모든 타임슬롯 뒤에 내보낸다
+    (timeline.merge_slots 와 같은 배치).
+
+    on_error(date, exc): 날짜 파일 하나가 실패하면 호출하고 그 날짜의 슬롯은 하나도 내보내지 않는다
+    (잘린 파일의 앞부분만 남지 않게). 이미 내보낸 날짜의 슬롯이 두 날짜 넘어 다시 나와도
+    덮어쓸 수 없으므로 그 날짜를 같은 방식으로 실패시킨다. on_error 가 없으면 예외를 그대로 올린다.
+    """
+    stats = stats if stats is not None else SlotStats()
+    emitted: set[str] = set()
+    held: dict[str, list[dict]] = {}
+    others: dict[str, list[dict]] = {}
+
+    for date, path in sources:
+        try:
+            day, day_others = _read_day(path, stats)
+            stale = [ts for ts in day if ts in emitted]
+            if stale:
+                raise ValueError(f"이미 내보낸 타임슬롯이 다시 나옴: {', '.join(stale[:3])}")
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(date, e)
+            continue
+        others.update(day_others)
+        for ts in [ts for ts in day if ts in held]:
+            held[ts] = day.pop(ts)
+        _count(stats, held)
+        yield from held.items()
+        emitted.update(held)
+        held = day
+
+    _count(stats, held)
+    yield from held.items()
+    yield from others.items()
@@ -0,0 +1,187 @@
+"""
+속성 값별 "다음 등장 슬롯" 표 (data/next_occurrence.bin) + mmap 리더
+
+"다음 Double XP / Gold Rush / Elimination 은 언제?" 에 답하려면 지금 이후 슬롯을 순서대로 돌며
+미션 목록을 훑어야 한다. 파이프라인이 슬롯 × 추적 값(변이 / 주의보 / 미션 타입 / 바이옴)마다
+"이 슬롯부터 몇 슬롯 뒤에 처음 나오는지" 를 미리 계산해 두면 질문 하나가 칸 하나 읽기다.
+
+파일 구조 (리틀 엔디언, digest.py 와 같은 방식):
+  헤더 32 바이트
+    0   4s  magic  b"DRGN"
+    4   H   버전 (1)
+    6   H   칸 크기 (2)
+    8   q   첫 슬롯번호 (epoch 초 // 1800)
+    16  I   슬롯 수
+    20  I   열(추적 값) 수
+    24  8x  예약
+  칸 × 슬롯 수 × 열 수 — 행 우선, 위치 = 32 + ((슬롯번호 - 첫 슬롯번호) * 열 수 + 열) * 2
+    H   그 슬롯부터 다음 등장까지 슬롯 수 (0 = 이 슬롯), 0xFFFF = 데이터 끝까지 없음
+  열 테이블 — 칸 뒤, 열 순서대로 "속성\\t값" 을 "\\n" 으로 이음 (속성: mutator / warning / type / biome)
+
+한 행이 그 슬롯 기준의 모든 값 카운트다운이라 upcoming() 은 행 하나만 읽는다.
+"Low Oxygen 없는 Deep Scan" 처럼 한 미션에 대한 복합 조건은 SlotStore.slots(start=...) 를 쓴다.
+"""
+
+import mmap
+import struct
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .codec import CodecError, SLOT_SECONDS, slot_index, slot_key
+from .jsonstream import write_if_changed
+from .missions import WARNING_SEPARATOR
+
+MAGIC = b"DRGN"
+TABLE_VERSION = 1
+HEADER = struct.Struct("<4sHHqII8x")
+CELL = struct.Struct("<H")
+NONE = 0xFFFF
+MAX_SLOTS = NONE           # 칸 하나(H)로 표현할 수 있는 거리 상한
+
+# 추적 속성 → 압축 레코드 필드 (이름은 missions.FILTERS 와 같다)
+TRACKED = {"mutator": "bf", "warning": "df", "type": "t", "biome": "b"}
+
+Column = tuple[str, str]   # (속성, 값)
+
+
+def record_values(m: dict) -> Iterable[Column]:
+    """압축 레코드 하나가 갖는 (속성, 값) — 주의보는 각각."""
+    for attr, field in TRACKED.items():
+        v = m.get(field)
+        if not v:
+            continue
+        if attr == "warning":
+            for w in v.split(WARNING_SEPARATOR):
+                yield attr, w
+        else:
+            yield attr, v
+
+
+def build_table(slots: Iterable[tuple[str, list[dict]]]) -> bytes:
+    """(타임슬롯 키, 압축 레코드 목록) 스트림 → 다음 등장 표 바이트. 타임슬롯이 아닌 키는 제외."""
+    present: dict[int, set[Column]] = {}
+    for ts, missions in slots:
+        try:
+            si = slot_index(ts)
+        except CodecError:
+            continue
+        present[si] = {c for m in missions for c in record_values(m)}
+
+    columns = sorted({c for cs in present.values() for c in cs}, key=lambda c: (list(TRACKED).index(c[0]), c[1]))
+    col_of = {c: i for i, c in enumerate(columns)}
+    first = min(present) if present else 0
+    count = max(present) - first + 1 if present else 0
+    width = len(columns)
+    if count > MAX_SLOTS:
+        raise ValueError(f"슬롯 범위가 {MAX_SLOTS}개를 넘습니다: {count}")
+
+    out = bytearray(HEADER.pack(MAGIC, TABLE_VERSION, CELL.size, first, count, width))
+    out += bytes(CELL.size * count * width)
+    ahead = [NONE] * width
+    # 뒤에서부터: 이 슬롯에 있으면 0, 없으면 다음 슬롯 값 + 1
+    for row in range(count - 1, -1, -1):
+        here = present.get(first + row, ())
+        hits = {col_of[c] for c in here}
+        base = HEADER.size + row * width * CELL.size
+        for col in range(width):
+            if col in hits:
+                ahead[col] = 0
+            elif ahead[col] != NONE:
+                ahead[col] += 1
+            CELL.pack_into(out, base + col * CELL.size, ahead[col])
+    out += "\n".join(f"{a}\t{v}" for a, v in columns).encode("utf-8")
+    return bytes(out)
+
+
+def write_table(slots: Iterable[tuple[str, list[dict]]], path: Path) -> bool:
+    return write_if_changed(Path(path), build_table(slots))
+
+
+class NextOccurrence:
+    """
+    next_occurrence.bin mmap 리더.
+
+      with NextOccurrence(Path("data/next_occurrence.bin")) as table:
+          table.next_key("mutator", "Double XP")     # 다음 Double XP 슬롯 키 (없으면 None)
+          table.next_slot("type", "Elimination", when)
+          table.upcoming(attr="mutator")             # 지금 기준 변이별 다음 슬롯 (가까운 순)
+    """
+
+    def __init__(self, path: Path):
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:   # 빈 파일
+            self._file.close()
+            raise ValueError(f"빈 다음 등장 표: {path}") from None
+        magic, version, cell_size, self.first_slot, self.slot_count, self.width = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != TABLE_VERSION or cell_size != CELL.size:
+            self.close()
+            raise ValueError(f"지원하지 않는 다음 등장 표: {magic!r} v{version}")
+        self._columns: list[Column] | None = None
+        self._col_of: dict[Column, int] | None = None
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "NextOccurrence":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def columns(self) -> list[Column]:
+        """열 순서의 (속성, 값) (파일 끝 테이블, 처음 필요할 때만 읽는다)."""
+        if self._columns is None:
+            tail = self._mm[HEADER.size + self.slot_count * self.width * CELL.size:].decode("utf-8")
+            self._columns = [tuple(line.split("\t", 1)) for line in tail.split("\n")] if self.width else []
+        return self._columns
+
+    def column(self, attr: str, value: str) -> int | None:
+        """(속성, 값) → 열 번호 (데이터에 한 번도 없으면 None)."""
+        if self._col_of is None:
+            self._col_of = {c: i for i, c in enumerate(self.columns)}
+        return self._col_of.get((attr, value))
+
+    def values(self, attr: str) -> list[str]:
+        return [v for a, v in self.columns if a == attr]
+
+    @staticmethod
+    def slot_at(when: datetime | None = None) -> int:
+        when = when or datetime.now(timezone.utc)
+        return int(when.timestamp()) // SLOT_SECONDS
+
+    def _cell(self, row: int, col: int) -> int:
+        return CELL.unpack_from(self._mm, HEADER.size + (row * self.width + col) * CELL.size)[0]
+
+    def next_slot(self, attr: str, value: str, when: datetime | None = None) -> int | None:
+        """when(기본 지금) 슬롯 이후 value 가 처음 나오는 슬롯번호 (지금 슬롯 포함). 데이터에 없으면 None."""
+        if attr not in TRACKED:
+            raise ValueError(f"알 수 없는 속성: {attr} (가능: {', '.join(TRACKED)})")
+        col = self.column(attr, value)
+        row = self.slot_at(when) - self.first_slot
+        if col is None or row >= self.slot_count:
+            return None
+        row = max(row, 0)   # 데이터 시작 전이면 첫 슬롯부터
+        ahead = self._cell(row, col)
+        return None if ahead == NONE else self.first_slot + row + ahead
+
+    def next_key(self, attr: str, value: str, when: datetime | None = None) -> str | None:
+        si = self.next_slot(attr, value, when)
+        return slot_key(si) if si is not None else None
+
+    def upcoming(self, when: datetime | None = None, attr: str | None = None) -> list[tuple[str, str, int]]:
+        """when 슬롯 기준 값마다 (속성, 값, 다음 슬롯번호) — 행 하나만 읽는다. 가까운 순."""
+        row = self.slot_at(when) - self.first_slot
+        if row >= self.slot_count or not self.width:
+            return []
+        row = max(row, 0)
+        start = HEADER.size + row * self.width * CELL.size
+        cells = struct.unpack_from(f"<{self.width}H", self._mm, start)
+        found = [(a, v, self.first_slot + row + ahead)
+                 for (a, v), ahead in zip(self.columns, cells)
+                 if ahead != NONE and (attr is None or a == attr)]
+        return sorted(found, key=lambda f: (f[2], f[0], f[1]))
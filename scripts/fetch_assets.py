@@ -5,6 +5,13 @@ DRG Bosco Terminal — 게임 에셋 자동 다운로더
 
 소스: Deep Rock Galactic Wiki (deeprockgalactic.fandom.com)
       MediaWiki API를 통해 이미지를 검색 후 다운로드합니다.
+      - 직접 지정 파일(DIRECT_WIKI_FILES)은 titles= 로 최대 50개씩 한 번에 URL 조회
+      - 검색은 generator=search + prop=imageinfo 로 검색과 URL 조회를 한 요청에 처리
+      - 이름별 처리는 스레드 풀에서 병렬 실행, API 요청 속도는 토큰 버킷으로 제한
+      - 해석 결과(위키 파일명 → CDN URL → ETag/크기/sha256)는 scripts/assets.lock.json 에 기록,
+        재실행 시 검색 없이 조건부 GET 만 보내고 변경 없으면 304 로 끝난다
+      - 원본은 .cache/assets/ 에 받고, 앱 에셋은 프로세스 풀에서 카테고리별 목표 크기의
+        1x/2x/3x WebP(또는 PNG)로 만들어 assets/ 에 쓴다 (Pillow 필요, 없으면 원본 복사)
 
 사용법:
   python scripts/fetch_assets.py                          # 전체 다운로드
@@ -14,15 +21,37 @@ DRG Bosco Terminal — 게임 에셋 자동 다운로더
   python scripts/fetch_assets.py --category missions
   python scripts/fetch_assets.py --category mutators
   python scripts/fetch_assets.py --category warnings
+  python scripts/fetch_assets.py --refresh               # 잠금 무시하고 다시 검색
+  python scripts/fetch_assets.py --verify                # 오프라인 sha256 검증만 (커밋된 assets/ 기준)
+  python scripts/fetch_assets.py --lock-existing         # 이미 있는 앱 에셋을 잠금 파일에 등록 (오프라인)
+  python scripts/fetch_assets.py --format png            # WebP 대신 최적화 PNG
+  python scripts/fetch_assets.py --no-optimize           # 최적화 없이 원본 그대로 복사
+  python scripts/fetch_assets.py --wiki-api http://127.0.0.1:8765/api.php --rate 20   # 로컬 대역 서버 (mock_server.py)
+  python scripts/fetch_assets.py --profile               # cProfile 로 감싸 실행 (.cache/metrics/*.prof)
+
+실행마다 요청별 DNS/연결/TTFB/전송 시간과 카테고리별 해석·최적화 단계 시간을
+.cache/metrics/fetch_assets.json 에 기록한다 (--metrics 로 경로 변경).
 """
 
+import hashlib
 import io
+import json
+import os
 import re
+import shutil
 import sys
-import time
 import argparse
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from drg_data import imageopt
+from drg_data.asset_lock import AssetLock, output_record, verify_outputs, verify_raw
+from drg_data.metrics import Metrics, install as install_metrics, run_profiled
+from drg_data.ratelimit import HostRateLimiter
 
 # Windows 터미널 UTF-8 출력 강제
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
@@ -30,16 +59,44 @@ sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="repla
 
 # ── 설정 ─────────────────────────────────────────────────────────────────────
 WIKI_API = "https://deeprockgalactic.fandom.com/api.php"
-REQUEST_DELAY = 0.6   # API 요청 간격 (초) — 과부하 방지, 너무 낮추지 마세요
+REQUEST_RATE = 3.0     # Wiki API 초당 요청 수 — 과부하 방지, 너무 높이지 마세요
+REQUEST_BURST = 3      # 토큰 버킷 최대 적립량 (연속 요청 허용 개수)
+CDN_RATE = 10.0        # 이미지 CDN 초당 다운로드 요청 수
+WORKERS = 4            # 이름별 검색/다운로드 동시 실행 수
+TITLES_PER_QUERY = 50  # MediaWiki API titles= 한 요청당 최대 개수
+RETRIES = 2            # 연결 실패 / 429·5xx 재시도 횟수 (Retry-After 존중, 지수 백오프)
 
 SESSION = requests.Session()
 SESSION.headers.update({
     "User-Agent": "DRG-BoscoTerminal-AssetFetcher/1.0 (fan app, non-commercial)",
     "Accept": "application/json",
 })
+RETRY = Retry(
+    total=RETRIES, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods={"GET"}, respect_retry_after_header=True, raise_on_status=False,
+)
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=WORKERS, max_retries=RETRY))
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=WORKERS, max_retries=RETRY))
+
+# 요청별 타이밍 / 단계별 시간 (실행 끝에 --metrics 경로로 저장)
+METRICS = Metrics("fetch_assets")
+
+
+def make_rate_limiter(api: str, rate: float = REQUEST_RATE) -> HostRateLimiter:
+    """호스트별 토큰 버킷 — Wiki API 호스트는 rate, 그 외(CDN)는 CDN_RATE."""
+    return HostRateLimiter(
+        {urlsplit(api).netloc: (rate, REQUEST_BURST)},
+        default=(CDN_RATE, int(CDN_RATE)),
+    )
+
+
+RATE_LIMITER = make_rate_limiter(WIKI_API)
 
 # 프로젝트 루트 기준 출력 경로
 BASE_DIR = Path(__file__).parent.parent
+LOCK_PATH = Path(__file__).parent / "assets.lock.json"
+METRICS_PATH = BASE_DIR / ".cache" / "metrics" / "fetch_assets.json"
+RAW_DIR = BASE_DIR / ".cache" / "assets"   # 위키 원본 (커밋 안 함), 앱 에셋은 여기서 생성
 OUTPUT_DIRS = {
     "biomes":   BASE_DIR / "assets" / "images" / "biomes",
     "missions": BASE_DIR / "assets" / "images" / "missions",
@@ -151,52 +208,88 @@ def to_snake(name: str) -> str:
     return s
 
 
-def wiki_search(query: str, limit: int = 8) -> list[str]:
+def raw_path(category: str, name: str, url: str) -> Path:
+    """위키 원본 캐시 경로 — .cache/assets/<category>/<snake><URL 확장자> (쿼리스트링 제거)."""
+    ext = Path(url.split("?")[0]).suffix or ".png"
+    return RAW_DIR / category / f"{to_snake(name)}{ext}"
+
+
+def _log(log: list[str] | None, message: str) -> None:
+    """병렬 처리 중에는 이름별로 모아 두었다가 순서대로 출력한다."""
+    if log is None:
+        print(message)
+    else:
+        log.append(message)
+
+
+def api_get(params: dict) -> dict:
+    """속도 제한을 지키며 Wiki API 호출."""
+    RATE_LIMITER.acquire(WIKI_API)
+    with METRICS.request(WIKI_API) as rec:
+        r = SESSION.get(WIKI_API, params=params, timeout=15, stream=True)
+        rec.response(r)
+        r.raise_for_status()
+        body = b"".join(rec.body(r.iter_content(chunk_size=65536)))
+    return json.loads(body)
+
+
+def wiki_search(query: str, limit: int = 8, log: list[str] | None = None) -> list[tuple[str, str | None]]:
     """
-    DRG Wiki File 네임스페이스(ns=6)에서 이미지 파일명 목록을 반환합니다.
-    반환값: ["FileName.png", "AnotherFile.jpg", ...]
+    DRG Wiki File 네임스페이스(ns=6) 검색 + CDN URL 조회를 한 요청으로 처리합니다.
+    (generator=search + prop=imageinfo)
+    반환값: [("FileName.png", "https://static.wikia.nocookie.net/..."), ...] — 검색 순위 순
     """
     params = {
         "action": "query",
-        "list": "search",
-        "srsearch": query,
-        "srnamespace": "6",
-        "srlimit": str(limit),
+        "generator": "search",
+        "gsrsearch": query,
+        "gsrnamespace": "6",
+        "gsrlimit": str(limit),
+        "prop": "imageinfo",
+        "iiprop": "url",
         "format": "json",
     }
     try:
-        r = SESSION.get(WIKI_API, params=params, timeout=15)
-        r.raise_for_status()
-        results = r.json().get("query", {}).get("search", [])
-        return [x["title"].removeprefix("File:") for x in results]
+        pages = api_get(params).get("query", {}).get("pages", {})
     except Exception as e:
-        print(f"    ⚠ 검색 오류: {e}")
+        _log(log, f"    ⚠ 검색 오류: {e}")
         return []
+    ranked = sorted(pages.values(), key=lambda p: p.get("index", 0))
+    results = []
+    for page in ranked:
+        info = page.get("imageinfo", [])
+        results.append((page["title"].removeprefix("File:"), info[0].get("url") if info else None))
+    return results
 
 
-def wiki_file_url(filename: str) -> str | None:
+def wiki_file_urls(filenames: list[str]) -> dict[str, str | None]:
     """
-    파일명 → wikia CDN 실제 다운로드 URL
-    예: "SaltPits.jpg" → "https://static.wikia.nocookie.net/..."
+    파일명 목록 → wikia CDN 실제 다운로드 URL (TITLES_PER_QUERY 개씩 묶어 조회)
+    예: ["SaltPits.jpg"] → {"SaltPits.jpg": "https://static.wikia.nocookie.net/..."}
+    위키에 없는 파일은 None.
     """
-    params = {
-        "action": "query",
-        "titles": f"File:{filename}",
-        "prop": "imageinfo",
-        "iiprop": "url",
-        "format": "json",
-    }
-    try:
-        r = SESSION.get(WIKI_API, params=params, timeout=15)
-        r.raise_for_status()
-        pages = r.json().get("query", {}).get("pages", {})
-        for page in pages.values():
+    urls: dict[str, str | None] = {}
+    for i in range(0, len(filenames), TITLES_PER_QUERY):
+        batch = filenames[i:i + TITLES_PER_QUERY]
+        params = {
+            "action": "query",
+            "titles": "|".join(f"File:{f}" for f in batch),
+            "prop": "imageinfo",
+            "iiprop": "url",
+            "format": "json",
+        }
+        try:
+            query = api_get(params).get("query", {})
+        except Exception as e:
+            print(f"    ⚠ URL 조회 오류: {e}")
+            continue
+        # API가 정규화한 제목(예: 밑줄 → 공백)을 요청한 이름으로 되돌린다
+        original = {n["to"]: n["from"] for n in query.get("normalized", [])}
+        for page in query.get("pages", {}).values():
+            title = original.get(page.get("title"), page.get("title", ""))
             info = page.get("imageinfo", [])
-            if info:
-                return info[0].get("url")
-    except Exception as e:
-        print(f"    ⚠ URL 조회 오류: {e}")
-    return None
+            urls[title.removeprefix("File:")] = info[0].get("url") if info else None
+    return urls
 
 
 def pick_best(
@@ -235,21 +328,54 @@ def pick_best(
     return pool[0] if pool else None
 
 
-def download_file(url: str, dest: Path) -> bool:
-    """URL에서 dest 경로로 바이너리 다운로드"""
+def download_file(
+    url: str,
+    dest: Path,
+    log: list[str] | None = None,
+    cached: dict | None = None,
+) -> dict | None:
+    """
+    URL에서 dest 경로로 바이너리 다운로드.
+    cached(잠금 기록)의 URL이 같고 로컬 원본이 기록과 일치하면 조건부 GET — 304면 다운로드 생략.
+    반환: 잠금 파일에 기록할 검증 정보 {etag, last_modified, size, sha256}, 실패 시 None
+    """
+    headers = {}
+    rel_dest = dest.relative_to(BASE_DIR).as_posix()
+    if cached and cached.get("url") == url and verify_raw(dest, cached) is None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
     try:
-        r = SESSION.get(url, timeout=30, stream=True)
-        r.raise_for_status()
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        with open(dest, "wb") as f:
-            for chunk in r.iter_content(chunk_size=8192):
-                f.write(chunk)
-        size_kb = dest.stat().st_size // 1024
-        print(f"    ✓ 저장: {dest.relative_to(BASE_DIR)}  ({size_kb} KB)")
-        return True
+        RATE_LIMITER.acquire(url)
+        with METRICS.request(url) as rec:
+            r = SESSION.get(url, timeout=30, stream=True, headers=headers)
+            rec.response(r)
+            if r.status_code == 304 and headers:
+                r.close()
+                _log(log, f"    ✓ 변경 없음 (304): {rel_dest}")
+                return {k: cached.get(k) for k in ("etag", "last_modified", "size", "sha256")}
+            r.raise_for_status()
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            digest = hashlib.sha256()
+            size = 0
+            tmp = dest.with_name(dest.name + ".tmp")
+            with open(tmp, "wb") as f:
+                for chunk in rec.body(r.iter_content(chunk_size=8192)):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+        os.replace(tmp, dest)
+        _log(log, f"    ✓ 저장: {rel_dest}  ({size // 1024} KB)")
+        return {
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+            "size": size,
+            "sha256": digest.hexdigest(),
+        }
     except Exception as e:
-        print(f"    ✗ 다운로드 실패: {e}")
-        return False
+        _log(log, f"    ✗ 다운로드 실패: {e}")
+        return None
 
 
 # ── 카테고리별 다운로드 전략 ──────────────────────────────────────────────────
@@ -289,112 +415,289 @@ CATEGORY_CONFIG: dict[str, dict] = {
 }
 
 
-def fetch_category(
+def _lock_current(name: str, entry: dict | None) -> bool:
+    """잠금 기록이 현재 설정(MANUAL_URLS / DIRECT_WIKI_FILES)과 맞는지."""
+    if not entry:
+        return False
+    if name in MANUAL_URLS:
+        return entry.get("source") == "manual" and entry.get("url") == MANUAL_URLS[name]
+    if name in DIRECT_WIKI_FILES:
+        return entry.get("source") == "direct" and entry.get("file") == DIRECT_WIKI_FILES[name]
+    return entry.get("source") == "search"
+
+
+def _process_name(
+    name: str,
     category: str,
-    dry_run: bool = False,
-    missing_only: bool = False,
-) -> dict[str, list[str]]:
+    out_dir: Path,
+    direct_urls: dict[str, str | None],
+    lock: AssetLock,
+    dry_run: bool,
+    missing_only: bool,
+    refresh: bool = False,
+) -> tuple[list[str], str]:
     """
-    한 카테고리의 모든 이미지를 순서대로 다운로드합니다.
-    반환: {"ok": [...], "fail": [...], "skip": [...]}
+    이름 하나를 해석·다운로드합니다 (스레드 풀에서 실행).
+    반환: (출력할 로그 줄, "ok" | "fail" | "skip")
     """
     cfg = CATEGORY_CONFIG[category]
-    names: list[str] = cfg["names"]
-    out_dir: Path = OUTPUT_DIRS[category]
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    stats: dict[str, list[str]] = {"ok": [], "fail": [], "skip": []}
-
-    for name in names:
-        snake = to_snake(name)
-        print(f"\n  [{name}]")
-
-        # ① 수동 URL이 있으면 즉시 사용 (최우선)
-        if name in MANUAL_URLS:
-            url = MANUAL_URLS[name]
-            ext = Path(url.split("?")[0]).suffix or ".png"
-            dest = out_dir / f"{snake}{ext}"
-            if dry_run:
-                print(f"    [dry-run] MANUAL: {url}")
-                stats["ok"].append(name)
-            elif download_file(url, dest):
-                stats["ok"].append(name)
-            else:
-                stats["fail"].append(name)
-            continue
-
+    snake = to_snake(name)
+    log = [f"\n  [{name}]"]
+    locked = None if refresh else lock.get(category, name)
+    if not _lock_current(name, locked):
+        locked = None
+
+    # ① 수동 URL이 있으면 즉시 사용 (최우선)
+    if name in MANUAL_URLS:
+        url = MANUAL_URLS[name]
+        source, chosen_file = "manual", None
+
+    else:
         # ② missing_only 모드: 이미 파일이 있으면 스킵
         if missing_only:
             existing = list(out_dir.glob(f"{snake}.*"))
             if existing:
-                print(f"    → 스킵 (기존 파일: {existing[0].name})")
-                stats["skip"].append(name)
-                continue
+                log.append(f"    → 스킵 (기존 파일: {existing[0].name})")
+                return log, "skip"
 
-        # ③ DIRECT_WIKI_FILES: 알려진 파일명 직접 조회 (검색보다 정확)
         chosen_file: str | None = None
-        cached_url: str | None = None   # 직접 조회 시 URL 재사용
+        url: str | None = None
+
+        # ③ 잠금 파일: 이전 실행의 해석 결과 재사용 (검색 없음)
+        if locked:
+            source, chosen_file, url = locked["source"], locked["file"], locked["url"]
+            log.append(f"    → 잠금: {chosen_file}")
 
-        if name in DIRECT_WIKI_FILES:
+        # ④ DIRECT_WIKI_FILES: 알려진 파일명 직접 조회 결과 (카테고리 단위로 미리 일괄 조회됨)
+        elif name in DIRECT_WIKI_FILES:
             direct_name = DIRECT_WIKI_FILES[name]
-            cached_url = wiki_file_url(direct_name)
-            time.sleep(REQUEST_DELAY)
-            if cached_url:
-                chosen_file = direct_name
-                print(f"    → 직접 지정: {chosen_file}")
+            url = direct_urls.get(direct_name)
+            if url:
+                source, chosen_file = "direct", direct_name
+                log.append(f"    → 직접 지정: {chosen_file}")
             else:
-                print(f"    ⚠ 직접 지정 파일 없음 ({direct_name}), 검색으로 전환...")
+                log.append(f"    ⚠ 직접 지정 파일 없음 ({direct_name}), 검색으로 전환...")
 
-        # ④ Wiki 검색 (직접 지정 실패 시 폴백)
+        # ⑤ Wiki 검색 (직접 지정 실패 시 폴백) — 검색 결과에 CDN URL이 함께 온다
         if not chosen_file:
+            source = "search"
             for suffix_tmpl in cfg["search_suffixes"]:
                 query = suffix_tmpl.format(name=name)
-                candidates = wiki_search(query)
-                time.sleep(REQUEST_DELAY)
+                results = dict(wiki_search(query, log=log))
 
-                if candidates:
+                if results:
                     chosen_file = pick_best(
-                        candidates,
+                        list(results),
                         name,
                         prefer_ext=cfg["prefer_ext"],
                         require_keywords=cfg["require_keywords"],
                     )
                     if chosen_file:
-                        print(f"    → 검색 결과: {chosen_file}")
+                        url = results[chosen_file]
+                        log.append(f"    → 검색 결과: {chosen_file}")
                         break
 
         if not chosen_file:
-            print(f"    ✗ 찾기 실패 — MANUAL_URLS 또는 DIRECT_WIKI_FILES에 추가 필요")
-            stats["fail"].append(name)
-            continue
-
-        # ⑤ CDN URL 획득 (직접 조회 시 재사용, 검색 결과는 신규 조회)
-        url = cached_url or wiki_file_url(chosen_file)
-        if not cached_url:
-            time.sleep(REQUEST_DELAY)
+            log.append("    ✗ 찾기 실패 — MANUAL_URLS 또는 DIRECT_WIKI_FILES에 추가 필요")
+            return log, "fail"
 
         if not url:
-            print(f"    ✗ URL 획득 실패")
-            stats["fail"].append(name)
-            continue
+            log.append("    ✗ URL 획득 실패")
+            return log, "fail"
+
+    # 원본은 캐시에 받고 앱 에셋은 build_assets() 가 만든다
+    dest = raw_path(category, name, url)
+
+    if dry_run:
+        log.append(f"    [dry-run] {'MANUAL: ' if source == 'manual' else ''}{url}")
+        log.append(f"           → {dest.relative_to(BASE_DIR)}")
+        return log, "ok"
+
+    meta = download_file(url, dest, log, cached=lock.get(category, name))
+    if meta is None:
+        # 잠금된 URL이 더 이상 유효하지 않으면(위키 재업로드 등) 한 번 새로 해석
+        if locked and source != "manual":
+            log.append("    ⚠ 잠금 URL 실패, 다시 해석...")
+            retry_log, status = _process_name(
+                name, category, out_dir, direct_urls, lock, dry_run, missing_only, refresh=True,
+            )
+            return log + retry_log[1:], status
+        return log, "fail"
+
+    # 앱 에셋 생성 기록(outputs 등)은 유지 — 원본 sha256 이 바뀌었으면 build_assets() 가 다시 만든다
+    entry = lock.get(category, name) or {}
+    entry.pop("dest", None)   # 예전 잠금 파일의 원본 경로 (이제 raw_path() 로 정해진다)
+    entry.update({
+        "source": source,
+        "file": chosen_file,
+        "url": url,
+        **meta,
+    })
+    lock.put(category, name, entry)
+    return log, "ok"
 
-        # 확장자 추출 (쿼리스트링 제거)
-        ext = Path(url.split("?")[0]).suffix or ".png"
-        dest = out_dir / f"{snake}{ext}"
 
-        if dry_run:
-            print(f"    [dry-run] {url}")
-            print(f"           → {dest.relative_to(BASE_DIR)}")
-            stats["ok"].append(name)
-        else:
-            if download_file(url, dest):
-                stats["ok"].append(name)
-            else:
-                stats["fail"].append(name)
+def fetch_category(
+    category: str,
+    lock: AssetLock,
+    dry_run: bool = False,
+    missing_only: bool = False,
+    refresh: bool = False,
+) -> dict[str, list[str]]:
+    """
+    한 카테고리의 모든 이미지를 병렬로 해석·다운로드합니다 (출력은 이름 순서 유지).
+    잠금 파일에 현재 설정과 맞는 기록이 있으면 검색 없이 조건부 GET 만 보냅니다.
+    반환: {"ok": [...], "fail": [...], "skip": [...]}
+    """
+    cfg = CATEGORY_CONFIG[category]
+    names: list[str] = cfg["names"]
+    out_dir: Path = OUTPUT_DIRS[category]
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    stats: dict[str, list[str]] = {"ok": [], "fail": [], "skip": []}
+
+    # 잠금 기록이 없는 직접 지정 파일만 한 번의 API 요청으로 일괄 조회
+    direct_files = [
+        DIRECT_WIKI_FILES[n] for n in names
+        if n in DIRECT_WIKI_FILES and n not in MANUAL_URLS
+        and (refresh or not _lock_current(n, lock.get(category, n)))
+        and not (missing_only and any(out_dir.glob(f"{to_snake(n)}.*")))
+    ]
+    direct_urls = wiki_file_urls(direct_files) if direct_files else {}
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        results = pool.map(
+            lambda n: _process_name(
+                n, category, out_dir, direct_urls, lock, dry_run, missing_only, refresh,
+            ),
+            names,
+        )
+        for name, (log, status) in zip(names, results):
+            for line in log:
+                print(line)
+            stats[status].append(name)
 
     return stats
 
 
+def build_assets(
+    all_stats: dict[str, dict[str, list[str]]],
+    lock: AssetLock,
+    fmt: str = "webp",
+    optimize: bool = True,
+) -> dict[str, dict[str, int]]:
+    """
+    원본 캐시(RAW_DIR) → 앱 에셋 폴더.
+    optimize=True 면 프로세스 풀에서 목표 크기 1x/2x/3x 로 변환, 아니면 원본을 그대로 복사.
+    원본 sha256 과 설정이 같고 출력이 기록과 일치하면 건너뜁니다.
+    반환: 카테고리별 바이트 예산 {category: {"files", "before", "x1", "all"}}
+    """
+    jobs: list[tuple[str, str, tuple[int, int], str]] = []
+    owners: list[tuple[str, str, str]] = []
+    for cat, stats in all_stats.items():
+        box = imageopt.TARGETS[cat]
+        prof = imageopt.profile(box, fmt) if optimize else "copy"
+        for name in stats["ok"]:
+            entry = lock.get(cat, name)
+            if not entry:
+                continue
+            if (entry.get("built_from") == entry["sha256"] and entry.get("profile") == prof
+                    and verify_outputs(BASE_DIR, entry) is None):
+                continue
+            raw = raw_path(cat, name, entry["url"])
+            if not raw.exists():
+                continue
+            snake = to_snake(name)
+            if optimize:
+                jobs.append((str(raw), str(OUTPUT_DIRS[cat] / f"{snake}.png"), box, fmt))
+                owners.append((cat, name, prof))
+                continue
+            out = OUTPUT_DIRS[cat] / f"{snake}{raw.suffix}"
+            shutil.copyfile(raw, out)
+            data = out.read_bytes()
+            _record_outputs(lock, cat, name, prof, {
+                str(out): {"bytes": len(data), "sha256": hashlib.sha256(data).hexdigest()},
+            })
+
+    if jobs:
+        print(f"\n🖼  이미지 최적화: {len(jobs)}개 ({fmt}, {os.cpu_count()} 프로세스)")
+    for (cat, name, prof), result in zip(owners, imageopt.optimize_all(jobs)):
+        if isinstance(result, Exception):
+            print(f"  ✗ {cat}/{name}: {result}")
+            continue
+        outputs = {p: {"bytes": o["bytes"], "sha256": o["sha256"]} for p, o in result["outputs"].items()}
+        _record_outputs(lock, cat, name, prof, outputs)
+
+    totals: dict[str, dict[str, int]] = {}
+    for cat in all_stats:
+        t = {"files": 0, "before": 0, "x1": 0, "all": 0}
+        for entry in lock.entries(cat).values():
+            outputs = entry.get("outputs")
+            if not outputs or not entry.get("built_from"):   # --lock-existing 로만 등록된 항목은 원본 크기를 모른다
+                continue
+            t["files"] += 1
+            t["before"] += entry["size"]
+            t["all"] += sum(o["bytes"] for o in outputs.values())
+            t["x1"] += sum(o["bytes"] for rel, o in outputs.items() if "/2.0x/" not in rel and "/3.0x/" not in rel)
+        totals[cat] = t
+    return totals
+
+
+def _record_outputs(lock: AssetLock, cat: str, name: str, prof: str, outputs: dict[str, dict]) -> None:
+    """새 출력 경로를 잠금에 기록하고, 예전 출력 중 이번에 안 만든 파일(다른 밀도/확장자)은 지운다."""
+    entry = lock.get(cat, name)
+    new = {Path(p).relative_to(BASE_DIR).as_posix(): o for p, o in outputs.items()}
+    for rel in set(entry.get("outputs") or {}) - set(new):
+        (BASE_DIR / rel).unlink(missing_ok=True)
+    entry.update(profile=prof, built_from=entry["sha256"], outputs=new)
+    lock.put(cat, name, entry)
+
+
+def lock_existing(categories: list[str], lock: AssetLock) -> int:
+    """
+    네트워크 없이 assets/ 에 이미 있는 앱 에셋(1x 와 2.0x/3.0x 변형)을 잠금 파일의 outputs 로
+    등록합니다 (outputs 기록이 없는 이름만). 위키 해석 정보는 다음 실행에서 채워진다.
+    반환: 새로 등록한 이름 수
+    """
+    added = 0
+    for cat in categories:
+        for name in CATEGORY_CONFIG[cat]["names"]:
+            entry = lock.get(cat, name) or {}
+            if entry.get("outputs"):
+                continue
+            found = sorted(OUTPUT_DIRS[cat].glob(f"{to_snake(name)}.*"))
+            if not found:
+                continue
+            paths = [imageopt.variant_path(found[0], d) for d in imageopt.DENSITIES]
+            entry["outputs"] = output_record(BASE_DIR, [p for p in paths if p.exists()])
+            lock.put(cat, name, entry)
+            added += 1
+    return added
+
+
+def verify_assets(categories: list[str], lock: AssetLock) -> bool:
+    """
+    네트워크 없이 커밋된 앱 에셋(assets/)을 잠금 파일의 크기/sha256 과 대조합니다.
+    원본 캐시(.cache/assets/)는 보지 않으므로 새로 받은 저장소에서도 돈다.
+    반환: 모두 일치하면 True
+    """
+    all_ok = True
+    for cat in categories:
+        entries = lock.entries(cat)
+        problems: list[tuple[str, str]] = []
+        for name in CATEGORY_CONFIG[cat]["names"]:
+            entry = entries.get(name)
+            problem = verify_outputs(BASE_DIR, entry) if entry else "잠금 기록 없음"
+            if problem:
+                problems.append((name, problem))
+        checked = len(CATEGORY_CONFIG[cat]["names"])
+        print(f"  {cat:12} {checked - len(problems):3}/{checked} 일치")
+        for name, problem in problems:
+            print(f"    ✗ {name}: {problem}")
+        all_ok = all_ok and not problems
+    return all_ok
+
+
 # ── 결과 리포트 ───────────────────────────────────────────────────────────────
 def print_report(all_stats: dict[str, dict[str, list[str]]]) -> None:
     total_ok = total_fail = total_skip = 0
@@ -437,6 +740,7 @@ def print_report(all_stats: dict[str, dict[str, list[str]]]) -> None:
 
 # ── 진입점 ────────────────────────────────────────────────────────────────────
 def main() -> None:
+    global WIKI_API, RATE_LIMITER
     parser = argparse.ArgumentParser(
         description="DRG Bosco Terminal 에셋 다운로더 — Wiki에서 이미지를 자동으로 수집합니다."
     )
@@ -453,7 +757,81 @@ def main() -> None:
         choices=list(CATEGORY_CONFIG.keys()),
         help="특정 카테고리만 처리합니다.",
     )
+    parser.add_argument(
+        "--refresh", action="store_true",
+        help="잠금 파일의 해석 결과를 무시하고 위키에서 다시 검색합니다.",
+    )
+    parser.add_argument(
+        "--verify", action="store_true",
+        help="네트워크 없이 로컬 파일을 잠금 파일의 sha256과 대조만 합니다.",
+    )
+    parser.add_argument(
+        "--lock-existing", action="store_true",
+        help="네트워크 없이 assets/ 에 이미 있는 앱 에셋을 잠금 파일에 등록합니다 (--verify 기준).",
+    )
+    parser.add_argument(
+        "--format", choices=imageopt.FORMATS, default="webp",
+        help="앱 에셋 인코딩 (기본 webp, 파일명은 AssetHelper 규칙대로 .png 유지).",
+    )
+    parser.add_argument(
+        "--no-optimize", action="store_true",
+        help="리사이즈/재인코딩 없이 원본을 그대로 앱 에셋 폴더에 복사합니다.",
+    )
+    parser.add_argument(
+        "--wiki-api", default=WIKI_API,
+        help=f"MediaWiki API 주소 (기본 {WIKI_API}, 로컬 대역 서버 시험용).",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=REQUEST_RATE,
+        help=f"Wiki API 초당 요청 수 상한 (기본 {REQUEST_RATE}).",
+    )
+    parser.add_argument(
+        "--metrics", type=Path, default=METRICS_PATH,
+        help="계측 결과 JSON 경로 (기본 .cache/metrics/fetch_assets.json).",
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="cProfile 로 감싸 실행하고 누적 시간 상위 함수를 출력합니다 (계측 JSON 옆에 .prof 저장).",
+    )
     args = parser.parse_args()
+    WIKI_API = args.wiki_api
+    RATE_LIMITER = make_rate_limiter(WIKI_API, args.rate)
+
+    if args.verify or args.lock_existing:
+        run(args)
+        return
+
+    install_metrics()
+    try:
+        if args.profile:
+            run_profiled(lambda: run(args), args.metrics.with_suffix(".prof"))
+        else:
+            run(args)
+    finally:
+        doc = METRICS.write(args.metrics)
+        print(f"\n📈 계측 저장: {args.metrics}")
+        for line in Metrics.report_lines(doc):
+            print(line)
+
+
+def run(args: argparse.Namespace) -> None:
+    """검색 → 다운로드 → 앱 에셋 생성 (main 이 계측/프로파일로 감싼다)."""
+    categories = [args.category] if args.category else list(CATEGORY_CONFIG.keys())
+    lock = AssetLock(LOCK_PATH)
+
+    if args.verify:
+        print(f"🔍 {LOCK_PATH.relative_to(BASE_DIR)} 기준 로컬 파일 검증")
+        if not verify_assets(categories, lock):
+            print("\n⚠ 불일치 항목이 있습니다. fetch_assets.py 를 다시 실행하세요.")
+            sys.exit(1)
+        print("\n✅ 모든 파일이 잠금 기록과 일치합니다.")
+        return
+
+    if args.lock_existing:
+        added = lock_existing(categories, lock)
+        saved = lock.save()
+        print(f"🔒 기존 앱 에셋 {added}개 등록 — {'저장' if saved else '변경 없음'}: {LOCK_PATH.relative_to(BASE_DIR)}")
+        return
 
     print("=" * 60)
     print("  DRG Bosco Terminal — 에셋 다운로더")
@@ -464,7 +842,6 @@ def main() -> None:
         print("  모드: MISSING ONLY (누락 파일만)")
     print("=" * 60)
 
-    categories = [args.category] if args.category else list(CATEGORY_CONFIG.keys())
     all_stats: dict[str, dict[str, list[str]]] = {}
 
     for cat in categories:
@@ -473,14 +850,33 @@ def main() -> None:
         print(f"  📁 {cat.upper()} — {names_count}개")
         print(f"{'─'*60}")
 
-        all_stats[cat] = fetch_category(
-            cat,
-            dry_run=args.dry_run,
-            missing_only=args.missing,
-        )
+        with METRICS.phase(f"resolve:{cat}", records=names_count):
+            all_stats[cat] = fetch_category(
+                cat,
+                lock,
+                dry_run=args.dry_run,
+                missing_only=args.missing,
+                refresh=args.refresh,
+            )
 
     print_report(all_stats)
 
+    if not args.dry_run:
+        optimize = not args.no_optimize
+        if optimize and not imageopt.available():
+            print("\n⚠ Pillow 가 없어 최적화 없이 원본을 복사합니다 (pip install Pillow)")
+            optimize = False
+        with METRICS.phase("optimize") as info:
+            totals = build_assets(all_stats, lock, fmt=args.format, optimize=optimize)
+            info["records"] = sum(t["files"] for t in totals.values())
+        if any(t["files"] for t in totals.values()):
+            print("\n📦 앱 에셋 바이트 예산 (원본 → 최적화)")
+            for line in imageopt.budget_report(totals):
+                print(line)
+
+    if not args.dry_run and lock.save():
+        print(f"\n🔒 잠금 파일 갱신: {LOCK_PATH.relative_to(BASE_DIR)}")
+
     if args.dry_run:
         print("\n💡 실제 다운로드하려면 --dry-run 옵션을 제거하고 실행하세요.")
 
@@ -1,100 +1,515 @@
+"""
+scripts/fetch_daily_missions.py
+doublexp.net 미션 / Deep Dive 데이터 수집기
+
+사용법:
+  python scripts/fetch_daily_missions.py                  # 오늘+내일 미션 + 이번 주 Deep Dive
+  python scripts/fetch_daily_missions.py --days 7         # 오늘부터 7일치
+  python scripts/fetch_daily_missions.py --past-days 14   # 지난 14일 백필 포함
+  python scripts/fetch_daily_missions.py --no-cache       # 응답 캐시 없이 항상 전체 다운로드
+  python scripts/fetch_daily_missions.py --incremental    # 기존 파일의 빈 슬롯이 있는 날짜만 받아 병합
+  python scripts/fetch_daily_missions.py --packed         # daily_missions.packed.json 도 생성
+  python scripts/fetch_daily_missions.py --shards slot    # data/missions/ 슬롯별 샤드 + manifest
+  python scripts/fetch_daily_missions.py --index          # data/mission_index.json 역색인 생성
+  python scripts/fetch_daily_missions.py --archive        # 이력 아카이브(SQLite)에 병합 (조회: mission_archive.py)
+  python scripts/fetch_daily_missions.py --artifacts      # data/dist/ 사전 압축 + 해시 파일명 산출물
+  python scripts/fetch_daily_missions.py --digest         # data/alarm_digest.bin 알림용 고정 폭 다이제스트
+  python scripts/fetch_daily_missions.py --upcoming       # data/next_occurrence.bin 값별 다음 등장 슬롯 표 (조회: next_mission.py)
+  python scripts/fetch_daily_missions.py --seasons        # data/seasons/ 시즌별 뷰 (+ 전체 시즌 뷰, 크기 보고)
+  python scripts/fetch_daily_missions.py --delta          # data/deltas/ 직전 게시본 대비 슬롯 단위 델타
+  python scripts/fetch_daily_missions.py --dd-since 2025-01-02   # 지난 Deep Dive 주간 이력 백필 (조회: deep_dive_history.py)
+  python scripts/fetch_daily_missions.py --base-url http://127.0.0.1:8765/static/json/  # 로컬 대역 서버 (mock_server.py)
+  python scripts/fetch_daily_missions.py --profile        # cProfile 로 감싸 실행 (.cache/metrics/*.prof)
+  python scripts/fetch_daily_missions.py --watch --incremental --on-change "sh publish.sh"   # 상주 모드
+
+실행마다 요청별 DNS/연결/TTFB/전송 시간과 단계별(fetch/parse/transform/write...) 시간을
+.cache/metrics/fetch_daily_missions.json 에 기록한다 (--metrics 로 경로 변경).
+
+--watch 는 프로세스를 띄워 둔 채 30분 슬롯 경계(+--watch-offset 초)마다 수집을 반복한다.
+목요일 11:00 UTC Deep Dive 리셋도 슬롯 경계이므로 리셋 직후 첫 수집에서 새 주 파일을 받는다.
+세션(커넥션 풀)과 응답 캐시를 재사용하고, 실패하면 지터를 섞은 지수 백오프로 다시 시도하며,
+data/ 내용 해시가 바뀐 경우에만 --on-change 명령으로 게시한다.
+
+이번 주 Deep Dive 는 실행마다 data/deep_dive_history.json 에도 쌓인다 (이미 있는 주는 다시 받지 않음).
+
+응답 캐시(.cache/http)에 ETag/Last-Modified와 원본 바디를 저장해 두고 조건부 요청을 보낸다.
+304 또는 바디 해시가 같으면 변환과 data/*.json 쓰기를 모두 건너뛴다.
+변환은 원본을 증분 파싱해 타임슬롯 단위로 출력 파일에 써 내려가므로 일수와 무관하게
+메모리 사용량이 일정하다 (비교: scripts/bench_pipeline.py).
+"""
+
 import sys
 import io
+import itertools
+import signal
+import subprocess
+import tempfile
+import time
+import argparse
+import hashlib
+import threading
 import requests
 import json
-import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from drg_data import (
+    CachedResponse, HttpCache, codec, deep_dives, delta, fingerprint, seasons, shards, timeline,
+)
+from drg_data.archive import MissionArchive
+from drg_data.artifacts import build_artifacts, size_report
+from drg_data.digest import AlarmDigest, write_digest
+from drg_data.index import build_index
+from drg_data.jsonstream import (
+    file_sha256, iter_file_items, object_sha256, write_if_changed, write_object_stream,
+)
+from drg_data.metrics import IterTimer, Metrics, install as install_metrics, run_profiled
+from drg_data.ratelimit import backoff_delay
+from drg_data.transform import SlotStats, iter_compact_slots
+from drg_data.upcoming import NextOccurrence, write_table
 
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
 
+# ── 설정 ─────────────────────────────────────────────────────────────────────
+BASE_URL = "https://doublexp.net/static/json/"
+REQUEST_TIMEOUT = 15   # 요청 1건당 최대 대기 (초)
+DEADLINE = 60          # 전체 fetch 마감 (초) — 넘으면 남은 요청은 실패 처리
+MAX_PER_HOST = 4       # 호스트당 동시 요청 수 상한 — doublexp.net 과부하 방지
+RETRIES = 2            # 연결 실패 / 429·5xx 재시도 횟수 (Retry-After 존중, 지수 백오프)
+WATCH_OFFSET = 20      # --watch: 슬롯 경계 후 몇 초 뒤에 수집할지 (업스트림 게시 여유)
+BACKOFF_BASE = 15      # --watch: 실패 후 첫 재시도 대기 (초), 연속 실패마다 2배
+BACKOFF_CAP = 30 * 60  # --watch: 재시도 대기 상한 (초) = 슬롯 하나
 
-def fetch_bulk_data():
-    """오늘과 내일의 미션 데이터를 doublexp.net에서 가져와 압축 포맷으로 저장."""
-    base_url = "https://doublexp.net/static/json/bulkmissions/"
-    dates = [(datetime.now(timezone.utc) + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(0, 2)]
-    optimized_data = {}
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / "data"
+CACHE_DIR = BASE_DIR / ".cache" / "http"
+ARCHIVE_PATH = BASE_DIR / ".cache" / "missions_archive.sqlite3"
+DD_HISTORY_PATH = DATA_DIR / "deep_dive_history.json"
+METRICS_PATH = BASE_DIR / ".cache" / "metrics" / "fetch_daily_missions.json"
 
-    for date in dates:
-        url = f"{base_url}{date}.json"
-        print(f"Fetching {url}...")
+# --artifacts 대상 (논리 이름). 없는 파일은 건너뛴다.
+ARTIFACT_SOURCES = [
+    "daily_missions.json",
+    "deep_dive.json",
+    "strings.json",
+    "version.json",
+    "daily_missions.packed.json",
+    "mission_index.json",
+]
+
+# 요청 스레드별 전체 마감 (DeadlineRetry 가 재시도 대기를 여기까지로 자른다)
+_request_deadline = threading.local()
+
+
+class DeadlineRetry(Retry):
+    """재시도 대기(Retry-After / 지수 백오프)가 이 스레드의 전체 마감을 넘기지 않게 한다."""
+
+    def sleep(self, response=None) -> None:
+        deadline = getattr(_request_deadline, "value", None)
+        if deadline is None:
+            return super().sleep(response)
+        wait = self.get_retry_after(response) if self.respect_retry_after_header and response else None
+        if wait is None:
+            wait = self.get_backoff_time()
+        remaining = deadline - time.monotonic()
+        if wait >= remaining:
+            time.sleep(max(0.0, remaining))
+            raise TimeoutError("전체 마감 시간 초과 (재시도 대기 중)")
+        time.sleep(wait)
+
+
+# 모든 요청이 하나의 세션(커넥션 풀)을 공유한다.
+RETRY = DeadlineRetry(
+    total=RETRIES, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods={"GET"}, respect_retry_after_header=True, raise_on_status=False,
+)
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=MAX_PER_HOST, max_retries=RETRY))
+SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=MAX_PER_HOST, max_retries=RETRY))
+
+# 요청별 타이밍 / 단계별 시간 (실행 끝에 METRICS_PATH 로 저장)
+METRICS = Metrics("fetch_daily_missions")
+
+_host_slots: dict[str, threading.Semaphore] = {}
+_host_slots_lock = threading.Lock()
+
+
+def _host_semaphore(url: str) -> threading.Semaphore:
+    host = urlsplit(url).netloc
+    with _host_slots_lock:
+        if host not in _host_slots:
+            _host_slots[host] = threading.Semaphore(MAX_PER_HOST)
+        return _host_slots[host]
+
+
+def _get(url: str, deadline: float, cache: HttpCache, inflight: set | None = None) -> CachedResponse:
+    """
+    호스트별 동시성 상한 안에서 GET. 전체 마감까지 남은 시간을 timeout으로 사용.
+    조건부 요청을 보내고, 304면 캐시된 바디를 돌려준다.
+    200 바디는 메모리에 모으지 않고 캐시 파일로 바로 흘려 쓴다.
+    inflight: 본문을 받는 동안 urllib3 응답을 넣어 두는 집합 (fetch_all 이 마감에 끊는다)
+    """
+    headers = cache.conditional_headers(url)
+    _request_deadline.value = deadline
+    with _host_semaphore(url):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("전체 마감 시간 초과")
         try:
-            res = requests.get(url, timeout=15)
-            if res.status_code == 200:
-                raw = res.json()
-                for ts, content in raw.items():
-                    if not isinstance(content, dict):
-                        continue
-
-                    missions_list = []
-                    biomes = content.get("Biomes", {})
-                    for biome_name, missions in biomes.items():
-                        for m in missions:
-                            mutator = m.get("MissionMutator")
-                            warnings = m.get("MissionWarnings", [])
-
-                            missions_list.append({
-                                "b": biome_name,
-                                "t": m.get("PrimaryObjective"),
-                                "so": m.get("SecondaryObjective"),
-                                "cn": m.get("CodeName"),
-                                "l": int(m.get("Length", 1)),
-                                "c": int(m.get("Complexity", 1)),
-                                "bf": mutator if mutator else None,
-                                "df": ", ".join(warnings) if warnings else None,
-                                "s": m.get("included_in", [])
-                            })
-                    optimized_data[ts] = missions_list
+            with METRICS.request(url) as rec, SESSION.get(
+                url, headers=headers, stream=True, timeout=min(REQUEST_TIMEOUT, remaining),
+            ) as res:
+                rec.response(res)
+                if res.status_code == 200:
+                    if inflight is not None:
+                        inflight.add(res.raw)
+                    try:
+                        chunks = _until(deadline, res.iter_content(chunk_size=64 * 1024))
+                        return cache.store(url, res.headers, rec.body(chunks))
+                    finally:
+                        if inflight is not None:
+                            inflight.discard(res.raw)
+        except requests.ConnectionError as e:
+            if e.args and isinstance(e.args[0], TimeoutError):   # DeadlineRetry 가 재시도를 멈춤
+                raise e.args[0] from None
+            raise
+
+    if res.status_code == 304:
+        cached = cache.load(url)
+        if cached:
+            return cached
+    return CachedResponse(url, res.status_code, None, "", True)
+
+
+def _until(deadline: float, chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """마감이 지나면 바디 읽기를 끊는다 (요청 timeout 은 청크 사이 대기만 제한하므로).
+    청크 하나를 기다리며 막혀 있는 읽기는 fetch_all 이 소켓을 닫아 깨운다."""
+    for chunk in chunks:
+        if time.monotonic() > deadline:
+            raise TimeoutError("전체 마감 시간 초과 (본문 수신 중)")
+        yield chunk
+
+
+def fetch_all(
+    urls: list[str],
+    deadline_sec: float,
+    cache: HttpCache,
+) -> dict[str, CachedResponse | Exception]:
+    """
+    URL 목록을 공용 세션으로 동시에 가져온다.
+    워커 수는 호스트 수 × MAX_PER_HOST — 그 이상은 호스트 세마포어에서 기다리기만 한다.
+    반환: {url: CachedResponse 또는 발생한 예외} — 마감까지 끝나지 않은 요청은 TimeoutError
+    """
+    deadline = time.monotonic() + deadline_sec
+    results: dict[str, CachedResponse | Exception] = {}
+    hosts = {urlsplit(url).netloc for url in urls}
+    inflight: set = set()
+
+    pool = ThreadPoolExecutor(max_workers=max(1, min(len(urls), MAX_PER_HOST * len(hosts))))
+    try:
+        futures = {pool.submit(_get, url, deadline, cache, inflight): url for url in urls}
+        _, pending = wait(futures, timeout=deadline_sec)
+        if pending:
+            # 본문 청크를 기다리며 막힌 읽기를 깨운다 (urllib3 HTTPResponse.shutdown, 2.3+)
+            for raw in list(inflight):
+                try:
+                    raw.shutdown()
+                except (AttributeError, ValueError, RuntimeError, OSError):
+                    pass
+        for fut, url in futures.items():
+            if fut in pending:
+                results[url] = TimeoutError("전체 마감 시간 초과")
+            elif fut.exception() is not None:
+                results[url] = fut.exception()
             else:
-                print(f"Failed to fetch {date}: Status {res.status_code}")
-        except Exception as e:
-            print(f"Error processing {date}: {e}")
+                results[url] = fut.result()
+    finally:
+        # 마감을 넘기면 기다리지 않는다 — 대기열의 요청은 취소되고, 본문을 받던 요청은
+        # 위에서 소켓이 닫혀, 연결 / 헤더 대기 중인 요청은 요청 timeout 으로 끝난다
+        pool.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+# ── URL 계산 ──────────────────────────────────────────────────────────────────
+def mission_dates(days: int = 2, past_days: int = 0, now: datetime | None = None) -> list[str]:
+    """오늘 기준 과거 past_days일 ~ 앞으로 days일(오늘 포함)의 날짜 문자열 목록."""
+    now = now or datetime.now(timezone.utc)
+    return [(now + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(-past_days, days)]
 
-    if optimized_data:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        out_path = os.path.join(script_dir, '..', 'data', 'daily_missions.json')
-        out_path = os.path.normpath(out_path)
-        os.makedirs(os.path.dirname(out_path), exist_ok=True)
-        with open(out_path, 'w', encoding='utf-8') as f:
-            json.dump(optimized_data, f, ensure_ascii=False)
-        print(f"💾 저장 위치: {out_path}")
-        print(f"✅ 최적화 완료: {len(optimized_data)} 개의 타임슬롯 저장됨")
 
-        has_double_xp = any(m['bf'] == "Double XP" for ms in optimized_data.values() for m in ms)
-        print(f"🔍 Double XP 데이터 포함 여부: {has_double_xp}")
+def bulk_mission_url(date: str) -> str:
+    return f"{BASE_URL}bulkmissions/{date}.json"
 
 
-def fetch_deep_dive():
-    """이번 주 Deep Dive 데이터를 doublexp.net에서 가져와 저장.
+def deep_dive_url(now: datetime | None = None) -> str:
+    """
+    now 시점(기본: 지금)의 Deep Dive 파일 URL.
 
     Deep Dive는 매주 목요일 11:00 UTC(KST 20:00)에 리셋된다.
     가장 최근 목요일 11:00 UTC 시점의 데이터를 가져온다.
     """
-    now = datetime.now(timezone.utc)
+    return BASE_URL + deep_dives.file_name(deep_dives.week_start(now))
+
+
+def deep_dive_backfill_weeks(since: str, history: deep_dives.DeepDiveHistory) -> list[datetime]:
+    """since(YYYY-MM-DD) 주부터 지난주까지, 이력에 아직 없는 주의 리셋 시각 목록."""
+    start = datetime.fromisoformat(since).replace(tzinfo=timezone.utc)
+    weeks = deep_dives.weeks_between(start)[:-1]   # 이번 주는 매 실행 기본으로 받는다
+    return [w for w in weeks if deep_dives.week_key(w) not in history]
+
+
+# ── 변환 / 저장 ───────────────────────────────────────────────────────────────
+def _bulk_sources(
+    dates: list[str],
+    responses: dict[str, CachedResponse | Exception],
+) -> list[tuple[str, CachedResponse]]:
+    """날짜별 응답 중 성공한 것만 (날짜, 응답) 으로. 실패는 출력만 한다."""
+    fetched = []
+    for date in dates:
+        res = responses.get(bulk_mission_url(date))
+        if isinstance(res, Exception):
+            print(f"Error processing {date}: {res}")
+        elif not res.ok:
+            print(f"Failed to fetch {date}: Status {res.status}")
+        else:
+            fetched.append((date, res))
+    return fetched
+
+
+def fetch_bulk_data(
+    dates: list[str],
+    responses: dict[str, CachedResponse | Exception],
+    cache: HttpCache,
+) -> bool:
+    """
+    날짜별 미션 응답을 압축 포맷으로 변환해 저장.
+    원본을 증분 파싱하며 타임슬롯 단위로 변환 → 바로 출력 파일에 써 내려가므로
+    날짜 수와 무관하게 메모리 사용량이 일정하다.
+    반환: 이번 실행에서 daily_missions.json 을 새로 만들었는지 (변경 없음/실패 시 False)
+    """
+    out_path = DATA_DIR / "daily_missions.json"
+    fetched = _bulk_sources(dates, responses)
+    sources = [(date, res.path) for date, res in fetched]
+    if not sources:
+        return False
+    fp = fingerprint([res for _, res in fetched])
+    if out_path.exists() and cache.output_unchanged(out_path.name, fp):
+        print("⏭ 미션 데이터 변경 없음 (304/동일 해시) — 변환/저장 생략")
+        return False
 
-    # 가장 최근 목요일 계산 (weekday: Mon=0, Thu=3)
-    days_since_thursday = (now.weekday() - 3) % 7
-    thursday = now - timedelta(days=days_since_thursday)
-    thursday = thursday.replace(hour=11, minute=0, second=0, microsecond=0)
+    stats = SlotStats()
+    failed: list[str] = []
 
-    # 오늘이 목요일인데 아직 11:00 UTC 전이면 지난주 목요일
-    if now < thursday:
-        thursday -= timedelta(days=7)
+    def on_error(date: str, e: Exception) -> None:
+        failed.append(date)
+        print(f"Error processing {date}: {e}")
 
-    date_str = thursday.strftime('%Y-%m-%d')
-    url = f"https://doublexp.net/static/json/DD_{date_str}T11-00-00Z.json"
-    print(f"Fetching Deep Dive: {url}...")
+    # 파싱·변환(생산자)과 직렬화·쓰기(소비자)가 한 스트림으로 엮여 있어 next() 시간으로 나눠 잰다
+    producer = IterTimer()
+    started = time.perf_counter()
+    slots = producer.wrap(iter_compact_slots(sources, stats, on_error=on_error))
+    # 슬롯이 하나도 없으면 기존 파일을 덮어쓰지 않는다
+    first = next(slots, None)
+    if first is None:
+        return False
 
+    written = write_object_stream(out_path, itertools.chain([first], slots))
+    # 변환에 실패한 날짜가 있으면 같은 응답으로 다음 실행이 다시 만들도록 지문을 남기지 않는다
+    cache.record_output(out_path.name, "" if failed else fp)
+    METRICS.add_phase("parse", producer.seconds - stats.transform_seconds, stats.missions)
+    METRICS.add_phase("transform", stats.transform_seconds, stats.missions)
+    METRICS.add_phase("write", time.perf_counter() - started - producer.seconds, stats.missions)
+    print(f"💾 저장 위치: {out_path}" if written else f"💾 내용 동일 — 쓰기 생략: {out_path}")
+    print(f"✅ 최적화 완료: {stats.slots} 개의 타임슬롯 저장됨")
+    print(f"🔍 Double XP 데이터 포함 여부: {stats.double_xp}")
+    return True
+
+
+def load_missions(path: Path) -> dict[str, list]:
+    """기존 daily_missions.json (없거나 깨졌으면 빈 dict)."""
+    if not path.exists():
+        return {}
     try:
-        res = requests.get(url, timeout=15)
-        if res.status_code == 200:
-            data = res.json()
+        return dict(iter_file_items(path))
+    except Exception as e:
+        print(f"⚠ 기존 미션 파일을 읽지 못해 전체를 다시 받습니다: {e}")
+        return {}
+
+
+def merge_bulk_data(
+    dates: list[str],
+    responses: dict[str, CachedResponse | Exception],
+    existing: dict[str, list],
+    keep_from: int,
+    expected: list[str],
+    cache: HttpCache,
+) -> bool:
+    """
+    --incremental: 다시 받은 날짜의 슬롯을 기존 데이터 위에 덮어쓰고 keep_from 이전 슬롯을 정리한다.
+    일부(또는 전부) 날짜가 실패해도 기존 슬롯은 그대로 남는다. 쓰기는 임시 파일 + 교체로 원자적.
+    반환: daily_missions.json 을 새로 썼는지
+    """
+    out_path = DATA_DIR / "daily_missions.json"
+    sources = [(date, res.path) for date, res in _bulk_sources(dates, responses)]
+    stats = SlotStats()
+    with METRICS.phase("merge") as info:
+        fresh = iter_compact_slots(
+            sources, stats,
+            on_error=lambda date, e: print(f"Error processing {date}: {e}"),
+        )
+        merged, pruned = timeline.merge_slots(existing, fresh, keep_from)
+        info["records"] = stats.missions
+    if not merged:
+        return False
+    if not sources and not pruned:
+        print("⏭ 증분 병합: 새 슬롯 / 정리할 슬롯 없음 — 저장 생략")
+        _warn_gaps(merged, expected)
+        return False
+
+    written = write_object_stream(out_path, merged.items())
+    if written:
+        # 병합 결과는 이번 입력 지문만으로 재현되지 않으므로 지문을 지워 다음 전체 실행이 다시 만들게 한다
+        cache.record_output(out_path.name, "")
+    print(f"🧩 증분 병합: 새로 받은 슬롯 {stats.slots}개, 보존 기간 밖 정리 {pruned}개, "
+          f"누적 {timeline.count_slots(merged)}개 — {'저장' if written else '내용 동일, 쓰기 생략'}: {out_path}")
+    _warn_gaps(merged, expected)
+    return written
+
 
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            out_path = os.path.join(script_dir, '..', 'data', 'deep_dive.json')
-            out_path = os.path.normpath(out_path)
-            os.makedirs(os.path.dirname(out_path), exist_ok=True)
-            with open(out_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False)
+def _warn_gaps(slots: dict[str, list], expected: list[str]) -> None:
+    gaps = timeline.missing_slots(slots, expected)
+    if gaps:
+        print(f"⚠ 아직 빈 슬롯: {', '.join(f'{d} {n}개' for d, n in gaps.items())} (다음 실행에서 다시 시도)")
+
+
+def write_packed(src: Path) -> None:
+    """
+    daily_missions.json → daily_missions.packed.json (사전 인코딩 포맷, drg_data.codec).
+    써 놓은 packed 파일을 다시 디코드해 원본과 바이트 단위로 같은지 검증한다.
+    """
+    dst = src.with_name("daily_missions.packed.json")
+    stats = codec.PackStats()
+    try:
+        write_object_stream(dst, codec.encode_items(lambda: iter_file_items(src), stats), compact=True)
+        with open(dst, encoding="utf-8") as f:
+            doc = json.load(f)
+        version = doc["v"]
+        if object_sha256(codec.iter_decoded(doc)) != file_sha256(src):
+            raise codec.CodecError("디코드 결과가 원본과 다릅니다")
+    except codec.CodecError as e:
+        print(f"⚠ packed 포맷 생성 실패: {e}")
+        dst.unlink(missing_ok=True)
+        return
+    print(f"📦 packed 저장: {dst} (v{version}, "
+          f"{src.stat().st_size // 1024} KB → {dst.stat().st_size // 1024} KB)")
+    print(f"🧬 미션 중복도: {stats.records} 레코드 / {stats.unique} 고유 미션 ({stats.ratio:.2f}배)")
+
+
+def write_mission_shards(src: Path, granularity: str) -> None:
+    """daily_missions.json → data/missions/ 샤드 + manifest (drg_data.shards)."""
+    out_dir = src.parent / "missions"
+    report = shards.write_shards(iter_file_items(src), out_dir, granularity)
+    print(f"🗂 샤드 저장: {out_dir} ({granularity} 단위, 새로 씀 {report.written} / "
+          f"변경 없음 {report.unchanged} / 삭제 {report.removed}, 합계 {report.bytes // 1024} KB)")
+
+
+def write_mission_index(src: Path) -> None:
+    """daily_missions.json → data/mission_index.json (drg_data.index 역색인)."""
+    dst = src.with_name("mission_index.json")
+    doc = build_index(iter_file_items(src))
+    write_if_changed(dst, json.dumps(doc, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    counts = ", ".join(f"{attr} {len(values)}" for attr, values in doc["index"].items())
+    print(f"🔎 색인 저장: {dst} ({dst.stat().st_size // 1024} KB, {counts})")
+
+
+def write_alarm_digest(src: Path) -> None:
+    """daily_missions.json → data/alarm_digest.bin (슬롯별 변이 / Double XP 미션 타입 비트마스크)."""
+    dst = src.with_name("alarm_digest.bin")
+    write_digest(iter_file_items(src), dst)
+    with AlarmDigest(dst) as digest:
+        now = digest.buffed_types()
+        print(f"🔔 알림 다이제스트 저장: {dst} ({dst.stat().st_size} B, 슬롯 {digest.slot_count}개, "
+              f"타입 {len(digest.types)}개, 지금 변이 미션: {', '.join(now) or '없음'})")
+
+
+def write_next_occurrence(src: Path) -> None:
+    """daily_missions.json → data/next_occurrence.bin (슬롯 × 변이/주의보/타입/바이옴 다음 등장 슬롯)."""
+    dst = src.with_name("next_occurrence.bin")
+    write_table(iter_file_items(src), dst)
+    with NextOccurrence(dst) as table:
+        nxt = table.next_key("mutator", "Double XP")
+        print(f"⏭ 다음 등장 표 저장: {dst} ({dst.stat().st_size // 1024} KB, 슬롯 {table.slot_count}개 × "
+              f"값 {table.width}개, 다음 Double XP: {nxt or '없음'})")
+
+
+def write_season_views(src: Path) -> None:
+    """daily_missions.json → data/seasons/ 시즌별 뷰 + manifest."""
+    out_dir = src.parent / "seasons"
+    manifest = seasons.write_views(lambda: iter_file_items(src), out_dir)
+    print(f"🗓 시즌별 뷰 저장: {out_dir} (시즌 {', '.join(manifest['seasons']) or '없음'})")
+    for line in seasons.size_report(manifest, src):
+        print(line)
+
+
+def write_delta(previous: bytes, src: Path) -> None:
+    """직전 게시본 → 새 daily_missions.json 델타를 data/deltas/ 에 추가 (drg_data.delta)."""
+    out_dir = src.parent / "deltas"
+    current = src.read_bytes()
+    try:
+        entry = delta.publish(previous, current, out_dir)
+    except delta.DeltaError as e:
+        print(f"⚠ 델타 생성 실패: {e}")
+        return
+    kept = len(delta.load_manifest(out_dir)["deltas"])
+    if entry is None:
+        print(f"⚠ 델타가 전체 파일보다 커서 생략 (보관 델타 {kept}개)")
+        return
+    print(f"🩹 델타 저장: {out_dir / entry['file']} ({entry['bytes'] // 1024} KB, "
+          f"전체 {len(current) // 1024} KB 대비 {entry['bytes'] / len(current):.0%}, 보관 델타 {kept}개)")
+
+
+def merge_archive(src: Path, archive_path: Path) -> None:
+    """daily_missions.json 의 슬롯을 이력 아카이브에 병합 (이미 있는 슬롯은 유지)."""
+    with MissionArchive(archive_path) as archive:
+        new_slots, new_rows = archive.merge(iter_file_items(src))
+        first, last, total = archive.span()
+    print(f"🗄 아카이브 병합: 새 슬롯 {new_slots}개 / 미션 {new_rows}건 (누적 {total}슬롯, {first} ~ {last})")
+
+
+def write_artifacts() -> None:
+    """data/*.json → data/dist/ 해시 파일명 + gzip/brotli/zstd 변형 + manifest."""
+    out_dir = DATA_DIR / "dist"
+    manifest = build_artifacts([DATA_DIR / name for name in ARTIFACT_SOURCES], out_dir)
+    print(f"🗜 배포 산출물: {out_dir}")
+    for line in size_report(manifest):
+        print(line)
+
+
+def fetch_deep_dive(
+    url: str,
+    responses: dict[str, CachedResponse | Exception],
+    cache: HttpCache,
+):
+    """이번 주 Deep Dive 응답을 저장."""
+    out_path = DATA_DIR / "deep_dive.json"
+    res = responses.get(url)
+    try:
+        if isinstance(res, Exception):
+            raise res
+        if res.ok:
+            fp = fingerprint([res])
+            if out_path.exists() and cache.output_unchanged(out_path.name, fp):
+                print("⏭ Deep Dive 변경 없음 (304/동일 해시) — 저장 생략")
+                return
+
+            data = res.json()
+            write_if_changed(out_path, json.dumps(data, ensure_ascii=False).encode("utf-8"))
+            cache.record_output(out_path.name, fp)
 
             # 검증
             dd = data.get("Deep Dives", {})
@@ -104,11 +519,307 @@ def fetch_deep_dive():
             print(f"   Normal: {normal.get('Biome', 'N/A')} - {normal.get('CodeName', 'N/A')}")
             print(f"   Elite:  {elite.get('Biome', 'N/A')} - {elite.get('CodeName', 'N/A')}")
         else:
-            print(f"Failed to fetch Deep Dive: Status {res.status_code}")
+            print(f"Failed to fetch Deep Dive: Status {res.status}")
     except Exception as e:
         print(f"Error fetching Deep Dive: {e}")
 
 
+def update_deep_dive_history(
+    weeks: list[datetime],
+    responses: dict[str, CachedResponse | Exception],
+    history: deep_dives.DeepDiveHistory,
+) -> None:
+    """받아 온 주간 Deep Dive 응답을 이력에 병합하고 바뀌었으면 저장."""
+    added, missing = 0, []
+    for week in weeks:
+        res = responses.get(deep_dive_url(week))
+        try:
+            if isinstance(res, Exception):
+                raise res
+            if not res.ok:
+                raise ValueError(f"Status {res.status}")
+            added += history.add(deep_dives.week_key(week), res.json())
+        except Exception as e:
+            missing.append(f"{deep_dives.week_key(week)} ({e})")
+    if history.save(DD_HISTORY_PATH):
+        print(f"🗓 Deep Dive 이력 저장: {DD_HISTORY_PATH} (갱신 {added}주, 누적 {len(history)}주)")
+    if missing:
+        print(f"⚠ Deep Dive 이력 누락 {len(missing)}주: {', '.join(missing[:5])}{' ...' if len(missing) > 5 else ''}")
+
+
+# ── 진입점 ────────────────────────────────────────────────────────────────────
+def main() -> None:
+    global BASE_URL
+    parser = argparse.ArgumentParser(
+        description="doublexp.net에서 미션/Deep Dive 데이터를 수집해 data/에 저장합니다."
+    )
+    parser.add_argument(
+        "--base-url", default=BASE_URL,
+        help=f"미션/Deep Dive JSON 기준 URL (기본 {BASE_URL}, 로컬 대역 서버 시험용).",
+    )
+    parser.add_argument(
+        "--days", type=int, default=2,
+        help="오늘부터 앞으로 가져올 일수 (오늘 포함, 기본 2 = 오늘+내일).",
+    )
+    parser.add_argument(
+        "--past-days", type=int, default=0,
+        help="오늘 이전으로 거슬러 가져올 일수 (백필용, 기본 0).",
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="기존 daily_missions.json 을 유지하고 빈 슬롯이 있는 날짜만 받아 병합합니다 (일부 실패해도 기존 슬롯 유지).",
+    )
+    parser.add_argument(
+        "--retention-days", type=int, default=0,
+        help="--incremental 에서 가져오는 첫 날짜보다 이만큼 더 이전 슬롯까지 보존 (기본 0).",
+    )
+    parser.add_argument(
+        "--deadline", type=float, default=DEADLINE,
+        help=f"전체 fetch 마감 시간(초, 기본 {DEADLINE}).",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="응답 캐시를 쓰지 않고 항상 전체 다운로드 + 저장합니다.",
+    )
+    parser.add_argument(
+        "--cache-dir", type=Path, default=CACHE_DIR,
+        help="응답 캐시 디렉터리 (기본 .cache/http).",
+    )
+    parser.add_argument(
+        "--packed", action="store_true",
+        help="사전 인코딩 포맷(daily_missions.packed.json)도 함께 생성합니다.",
+    )
+    parser.add_argument(
+        "--shards", choices=shards.GRANULARITIES,
+        help="data/missions/ 에 슬롯(slot) 또는 시간(hour) 단위 샤드와 manifest 를 생성합니다.",
+    )
+    parser.add_argument(
+        "--index", action="store_true",
+        help="변이/주의보/타입/바이옴/2차 목표/시즌 역색인(mission_index.json)을 생성합니다.",
+    )
+    parser.add_argument(
+        "--digest", action="store_true",
+        help="알림 워커용 고정 폭 바이너리 다이제스트(alarm_digest.bin)를 생성합니다.",
+    )
+    parser.add_argument(
+        "--upcoming", action="store_true",
+        help="슬롯마다 변이/주의보/미션 타입/바이옴 값의 다음 등장 슬롯 표(next_occurrence.bin)를 생성합니다.",
+    )
+    parser.add_argument(
+        "--seasons", action="store_true",
+        help="시즌 하나만 받는 클라이언트용 data/seasons/ 시즌별 뷰를 생성하고 크기를 보고합니다.",
+    )
+    parser.add_argument(
+        "--delta", action="store_true",
+        help="직전 게시본 대비 슬롯 단위 델타를 data/deltas/ 에 생성합니다 (base 해시로 찾음).",
+    )
+    parser.add_argument(
+        "--archive", type=Path, nargs="?", const=ARCHIVE_PATH,
+        help="미션 이력 아카이브(SQLite)에 병합합니다 (기본 .cache/missions_archive.sqlite3).",
+    )
+    parser.add_argument(
+        "--artifacts", action="store_true",
+        help="data/dist/ 에 gzip/brotli/zstd 사전 압축 + 콘텐츠 해시 파일명 산출물과 manifest 를 생성합니다.",
+    )
+    parser.add_argument(
+        "--dd-since", metavar="YYYY-MM-DD",
+        help="이 날짜가 속한 주부터 이력에 없는 Deep Dive 주간 파일을 모두 받아 이력에 병합합니다.",
+    )
+    parser.add_argument(
+        "--metrics", type=Path, default=METRICS_PATH,
+        help="계측 결과 JSON 경로 (기본 .cache/metrics/fetch_daily_missions.json).",
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="cProfile 로 감싸 실행하고 누적 시간 상위 함수를 출력합니다 (계측 JSON 옆에 .prof 저장).",
+    )
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="상주 모드: 30분 슬롯 경계마다 수집을 반복합니다 (Ctrl+C / SIGTERM 으로 종료).",
+    )
+    parser.add_argument(
+        "--watch-offset", type=float, default=WATCH_OFFSET,
+        help=f"--watch: 슬롯 경계 후 수집까지 대기 (초, 기본 {WATCH_OFFSET}).",
+    )
+    parser.add_argument(
+        "--on-change", metavar="CMD",
+        help="--watch: data/ 내용 해시가 바뀐 수집 뒤에만 실행할 게시 명령 (저장소 루트에서 셸로 실행).",
+    )
+    args = parser.parse_args()
+    BASE_URL = args.base_url if args.base_url.endswith("/") else args.base_url + "/"
+
+    install_metrics()
+    if args.watch:
+        watch(args)
+        return
+    try:
+        if args.profile:
+            run_profiled(lambda: run(args), args.metrics.with_suffix(".prof"))
+        else:
+            run(args)
+    finally:
+        doc = METRICS.write(args.metrics)
+        print(f"\n📈 계측 저장: {args.metrics}")
+        for line in Metrics.report_lines(doc):
+            print(line)
+
+
+def data_hash() -> str:
+    """data/ 아래 모든 파일의 (경로, sha256) 지문 — 게시 여부 판단용."""
+    h = hashlib.sha256()
+    for path in sorted(p for p in DATA_DIR.rglob("*") if p.is_file() and not p.name.endswith(".tmp")):
+        h.update(path.relative_to(DATA_DIR).as_posix().encode("utf-8"))
+        h.update(file_sha256(path).encode("ascii"))
+    return h.hexdigest()
+
+
+def watch(args: argparse.Namespace) -> None:
+    """
+    --watch: 슬롯 경계 + watch_offset 마다 run() 을 반복한다.
+    수집에 실패한 요청이 있으면 다음 경계까지 기다리지 않고 backoff_delay 뒤 다시 시도한다.
+    data/ 해시가 바뀐 경우에만 --on-change 명령을 실행한다.
+    """
+    global METRICS
+    sys.stdout.reconfigure(line_buffering=True)   # 상주 로그는 줄마다 바로 내보낸다
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    published = data_hash()
+    failures = 0
+    print(f"👀 상주 모드 시작 — 슬롯 경계 +{args.watch_offset:.0f}s 마다 수집 (종료: Ctrl+C)")
+    try:
+        while True:
+            METRICS = Metrics("fetch_daily_missions")
+            print(f"\n{'─' * 60}\n🔄 {datetime.now(timezone.utc):%Y-%m-%d %H:%M:%S} UTC 수집")
+            try:
+                failed = run(args)
+            except Exception as e:
+                print(f"❌ 수집 중 오류: {e}")
+                failed = 1
+            METRICS.write(args.metrics)
+
+            current = data_hash()
+            if current != published:
+                if args.on_change:
+                    result = subprocess.run(args.on_change, shell=True, cwd=BASE_DIR)
+                    print(f"📤 게시 명령 실행 (종료 코드 {result.returncode}): {args.on_change}")
+                    if result.returncode == 0:
+                        published = current
+                else:
+                    print("📤 data/ 변경됨 (--on-change 없음)")
+                    published = current
+
+            now = time.time()
+            if failed:
+                failures += 1
+                wake = now + backoff_delay(failures, BACKOFF_BASE, BACKOFF_CAP)
+                print(f"⚠ 실패 {failed}건 (연속 {failures}회) — {wake - now:.0f}s 뒤 재시도")
+            else:
+                failures = 0
+                wake = timeline.next_boundary(now, args.watch_offset)
+                reset = deep_dives.week_start(datetime.fromtimestamp(wake, timezone.utc))
+                note = " (Deep Dive 리셋)" if 0 <= wake - reset.timestamp() < codec.SLOT_SECONDS else ""
+                print(f"💤 다음 수집: {datetime.fromtimestamp(wake, timezone.utc):%H:%M:%S} UTC{note}")
+            time.sleep(max(0.0, wake - time.time()))
+    except (KeyboardInterrupt, SystemExit):
+        print("\n👋 상주 모드 종료")
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    수집 → 변환 → 출력 (main 이 계측/프로파일로 감싼다).
+    반환: 실패한 미션/이번 주 Deep Dive 요청 수 (--watch 재시도 판단용, 백필 누락 주는 제외)
+    """
+    if not args.no_cache:
+        return _run(args, HttpCache(args.cache_dir))
+    # --no-cache: 빈 임시 캐시를 쓰면 조건부 요청/생략 없이 항상 전체 처리된다 (예외가 나도 지운다)
+    with tempfile.TemporaryDirectory() as tmp:
+        return _run(args, HttpCache(Path(tmp)))
+
+
+def _run(args: argparse.Namespace, cache: HttpCache) -> int:
+    missions_path = DATA_DIR / "daily_missions.json"
+    dates = mission_dates(args.days, args.past_days)
+    fetch_dates = dates
+    if args.incremental:
+        # 기존 파일과 기대 타임라인(하루 48 슬롯)을 비교해 빈 슬롯이 있는 날짜만 받는다
+        existing = load_missions(missions_path)
+        keep_from = timeline.day_start(dates[0]) - args.retention_days * timeline.SLOTS_PER_DAY
+        gaps = timeline.missing_slots(existing, dates)
+        fetch_dates = [d for d in dates if d in gaps]
+        print(f"🧩 증분 모드: 기존 슬롯 {timeline.count_slots(existing)}개, 다시 받을 날짜 "
+              f"{', '.join(f'{d}(빈 슬롯 {gaps[d]})' for d in fetch_dates) or '없음'}")
+    bulk_urls = [bulk_mission_url(d) for d in fetch_dates]
+    this_week = deep_dives.week_start()
+    dd_url = deep_dive_url(this_week)
+    dd_history = deep_dives.DeepDiveHistory.load(DD_HISTORY_PATH)
+    dd_weeks = deep_dive_backfill_weeks(args.dd_since, dd_history) if args.dd_since else []
+    backfill_urls = [deep_dive_url(w) for w in dd_weeks]
+    urls = bulk_urls + [dd_url] + backfill_urls
+
+    # 모든 날짜 + Deep Dive 파일(+ 백필 주간 파일)을 한 번에 동시 요청
+    for url in bulk_urls + [dd_url]:
+        print(f"Fetching {url}...")
+    if backfill_urls:
+        print(f"Fetching Deep Dive 이력 {len(backfill_urls)}주 ({deep_dives.week_key(dd_weeks[0])} ~)...")
+    started = time.monotonic()
+    with METRICS.phase("fetch", records=len(urls)):
+        responses = fetch_all(urls, args.deadline, cache)
+    not_modified = sum(1 for r in responses.values() if isinstance(r, CachedResponse) and not r.changed)
+    print(f"⏱ fetch 완료: {len(responses)}건 (변경 없음 {not_modified}건), {time.monotonic() - started:.2f}s")
+
+    # --delta: 덮어쓰기 전 직전 게시본
+    previous = missions_path.read_bytes() if args.delta and missions_path.exists() else None
+    if args.incremental:
+        regenerated = merge_bulk_data(fetch_dates, responses, existing, keep_from, dates, cache)
+    else:
+        regenerated = fetch_bulk_data(dates, responses, cache)
+    if previous is not None and missions_path.exists() and missions_path.read_bytes() != previous:
+        with METRICS.phase("delta"):
+            write_delta(previous, missions_path)
+    if args.packed and missions_path.exists() and (
+        regenerated or not missions_path.with_name("daily_missions.packed.json").exists()
+    ):
+        with METRICS.phase("packed"):
+            write_packed(missions_path)
+    if args.shards and missions_path.exists() and (
+        regenerated or not (DATA_DIR / "missions" / shards.MANIFEST_NAME).exists()
+    ):
+        with METRICS.phase("shards"):
+            write_mission_shards(missions_path, args.shards)
+    if args.index and missions_path.exists() and (
+        regenerated or not missions_path.with_name("mission_index.json").exists()
+    ):
+        with METRICS.phase("index"):
+            write_mission_index(missions_path)
+    if args.digest and missions_path.exists() and (
+        regenerated or not missions_path.with_name("alarm_digest.bin").exists()
+    ):
+        with METRICS.phase("digest"):
+            write_alarm_digest(missions_path)
+    if args.upcoming and missions_path.exists() and (
+        regenerated or not missions_path.with_name("next_occurrence.bin").exists()
+    ):
+        with METRICS.phase("upcoming"):
+            write_next_occurrence(missions_path)
+    if args.seasons and missions_path.exists():
+        # 크기 보고는 실행마다 — 변경이 없으면 뷰 파일은 다시 쓰이지 않는다
+        with METRICS.phase("seasons"):
+            write_season_views(missions_path)
+    if args.archive and missions_path.exists() and (regenerated or not args.archive.exists()):
+        with METRICS.phase("archive"):
+            merge_archive(missions_path, args.archive)
+    with METRICS.phase("deep_dive"):
+        fetch_deep_dive(dd_url, responses, cache)
+    with METRICS.phase("deep_dive_history", records=len(dd_weeks) + 1):
+        update_deep_dive_history(dd_weeks + [this_week], responses, dd_history)
+    if args.artifacts:
+        with METRICS.phase("artifacts"):
+            write_artifacts()
+
+    return sum(
+        1 for url in bulk_urls + [dd_url]
+        if isinstance(responses[url], Exception) or not responses[url].ok
+    )
+
+
 if __name__ == "__main__":
-    fetch_bulk_data()
-    fetch_deep_dive()
+    main()
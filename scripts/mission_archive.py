@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+scripts/mission_archive.py
+미션 이력 아카이브(SQLite) 병합 / 조회 CLI
+
+fetch_daily_missions.py --archive 가 실행마다 슬롯을 병합해 두는 아카이브를 조회합니다.
+
+사용법:
+  python scripts/mission_archive.py ingest                                 # data/daily_missions.json 병합
+  python scripts/mission_archive.py count --mutator "Double XP" --type "Industrial Sabotage" --days 90
+  python scripts/mission_archive.py top --by mutator --days 30             # 변이별 등장 횟수
+  python scripts/mission_archive.py list --warning "Low Oxygen" --biome "Magma Core" --limit 20
+  python scripts/mission_archive.py info                                   # 보관 범위
+"""
+
+import argparse
+import io
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from drg_data.archive import FILTERS, GROUP_COLUMNS, MissionArchive
+from drg_data.codec import SLOT_SECONDS
+from drg_data.jsonstream import iter_file_items
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_ARCHIVE = BASE_DIR / ".cache" / "missions_archive.sqlite3"
+
+
+def _slot_range(args) -> tuple[int | None, int | None]:
+    now = datetime.now(timezone.utc)
+    start = end = None
+    if args.days is not None:
+        # "최근 N일" 은 지금까지 — 파일에 이미 들어 있는 미래 슬롯은 세지 않는다 (--until 로 덮어쓸 수 있음)
+        start, end = now - timedelta(days=args.days), now
+    if args.since:
+        start = datetime.fromisoformat(args.since).replace(tzinfo=timezone.utc)
+    if args.until:
+        end = datetime.fromisoformat(args.until).replace(tzinfo=timezone.utc)
+
+    def to_slot(dt: datetime | None) -> int | None:
+        return int(dt.timestamp()) // SLOT_SECONDS if dt else None
+
+    return to_slot(start), to_slot(end)
+
+
+def _filters(args) -> dict:
+    return {name: getattr(args, name) for name in FILTERS if getattr(args, name) is not None}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="미션 이력 아카이브 병합 / 범위·빈도 조회")
+    parser.add_argument("--db", type=Path, default=DEFAULT_ARCHIVE, help="아카이브 경로 (기본 .cache/missions_archive.sqlite3)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_ingest = sub.add_parser("ingest", help="압축 포맷 미션 파일을 아카이브에 병합")
+    p_ingest.add_argument("files", nargs="*", type=Path, default=[BASE_DIR / "data" / "daily_missions.json"])
+
+    sub.add_parser("info", help="보관 중인 슬롯 범위")
+
+    for name, help_text in (("count", "조건에 맞는 등장 횟수"),
+                            ("top", "값별 등장 횟수 순위"),
+                            ("list", "조건에 맞는 최근 등장 목록")):
+        p = sub.add_parser(name, help=help_text)
+        for f in FILTERS:
+            p.add_argument(f"--{f}", type=int if f in ("length", "complexity") else str)
+        p.add_argument("--days", type=float, help="최근 N일 (지금까지)")
+        p.add_argument("--since", help="시작 시각 (UTC, 예: 2026-01-01)")
+        p.add_argument("--until", help="끝 시각 (UTC, 미포함)")
+        if name == "top":
+            p.add_argument("--by", choices=list(GROUP_COLUMNS), required=True)
+        if name == "list":
+            p.add_argument("--limit", type=int, default=50)
+
+    args = parser.parse_args()
+    started = time.perf_counter()
+
+    with MissionArchive(args.db) as archive:
+        if args.command == "ingest":
+            for path in args.files:
+                slots, rows = archive.merge(iter_file_items(path))
+                print(f"📥 {path}: 새 슬롯 {slots}개, 미션 {rows}건 병합")
+        elif args.command == "info":
+            first, last, n = archive.span()
+            print(f"🗄 {args.db}: 슬롯 {n}개 ({first} ~ {last})")
+        else:
+            start, end = _slot_range(args)
+            filters = _filters(args)
+            if args.command == "count":
+                r = archive.count(filters, start, end)
+                print(f"등장 {r['occurrences']}회 / 슬롯 {r['slots']}개  (처음 {r['first']}, 마지막 {r['last']})")
+            elif args.command == "top":
+                for value, n in archive.frequency(args.by, filters, start, end):
+                    print(f"  {n:6}  {value or '-'}")
+            else:
+                for ts, m in archive.occurrences(filters, start, end, args.limit):
+                    print(f"  {ts}  {m['b']:28} {m['t'] or '-':20} {m['bf'] or '-':18} {m['df'] or '-'}")
+
+    print(f"⏱ {(time.perf_counter() - started) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
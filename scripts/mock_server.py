@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+scripts/mock_server.py
+doublexp.net / DRG Wiki(MediaWiki API) 로컬 대역 서버
+
+네트워크 없이 fetch_daily_missions.py / fetch_assets.py 의 동시성·재시도·속도 제한을
+재현 가능하게 시험하기 위한 서버입니다. 응답 우선순위:
+  1) 녹화본  scripts/fixtures/recorded/ (--record 로 실제 호스트 응답을 저장)
+  2) 내장본  bulkmissions 는 날짜 시드 합성 데이터, DD 는 이번 주면 scripts/fixtures/deep_dive.json
+            지난 주면 날짜 시드 합성 데이터 (미래 주는 404),
+            api.php 는 titles=/generator=search 를 흉내 낸 응답, 이미지는 파일 이름 시드 합성 PNG
+            (저장소 assets/ 는 fetch_assets.py 가 최적화 결과로 덮어쓰므로 절대 읽지 않는다 —
+             읽으면 실행마다 원본이 바뀌어 304 비교와 최적화 전/후 크기가 재현되지 않는다)
+
+경로:
+  /static/json/bulkmissions/<YYYY-MM-DD>.json   doublexp.net 미션
+  /static/json/DD_<YYYY-MM-DD>T11-00-00Z.json   doublexp.net Deep Dive
+  /api.php?...                                  DRG Wiki MediaWiki API
+  /wikia/<path>                                 위키 이미지 CDN (static.wikia.nocookie.net 대역)
+
+조절 옵션:
+  --latency / --jitter   첫 바이트까지 지연 (ms)
+  --bandwidth            응답 전송 속도 상한 (KB/s)
+  --error-rate           이 확률로 --error-status (기본 503) 응답
+  --no-304               If-None-Match / If-Modified-Since 를 무시하고 항상 200
+
+사용법:
+  python scripts/mock_server.py                                    # http://127.0.0.1:8765
+  python scripts/mock_server.py --latency 150 --jitter 100 --bandwidth 512 --error-rate 0.05
+  python scripts/mock_server.py --record                           # 없는 응답은 실제 호스트에서 받아 녹화
+  python scripts/fetch_daily_missions.py --base-url http://127.0.0.1:8765/static/json/
+  python scripts/fetch_assets.py --wiki-api http://127.0.0.1:8765/api.php
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import random
+import re
+import struct
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urlsplit
+
+import requests
+
+from drg_data.synth import synth_day, synth_deep_dive
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace", line_buffering=True)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+RECORDED_DIR = FIXTURES_DIR / "recorded"
+DD_FIXTURE = FIXTURES_DIR / "deep_dive.json"
+
+UPSTREAMS = {
+    "/static/json/": "https://doublexp.net/static/json/",
+    "/api.php": "https://deeprockgalactic.fandom.com/api.php",
+    "/wikia/": "https://static.wikia.nocookie.net/",
+}
+WIKIA_CDN = "https://static.wikia.nocookie.net/"
+CHUNK = 16 * 1024
+
+
+def _synth_png(rng: random.Random) -> bytes:
+    """
+    시드 합성 RGBA PNG — 그라데이션 위에 사각형 몇 개, zlib 1단계 압축.
+    같은 시드면 같은 바이트(ETag/304 재현)이고, 위키 원본처럼 최적화할 여지가 남아 있다.
+    """
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    size = rng.choice((96, 128, 192, 256))
+    r0, g0, b0 = (rng.randrange(256) for _ in range(3))
+    rects = [(rng.randrange(size), rng.randrange(size), rng.randrange(8, size // 2), rng.randrange(8, size // 2),
+              bytes((rng.randrange(256), rng.randrange(256), rng.randrange(256), 255))) for _ in range(6)]
+    raw = bytearray()
+    for y in range(size):
+        row = bytearray()
+        for x in range(size):
+            row += bytes(((r0 + x) & 255, (g0 + y) & 255, (b0 + x + y) & 255, 255))
+        for rx, ry, rw, rh, color in rects:
+            if ry <= y < ry + rh:
+                w = min(rw, size - rx)
+                row[rx * 4:(rx + w) * 4] = color * w
+        raw += b"\x00" + row
+    header = struct.pack(">IIBBBBB", size, size, 8, 6, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(bytes(raw), 1)) + chunk(b"IEND", b""))
+
+
+def _snake(text: str) -> str:
+    """fetch_assets.to_snake 와 같은 규칙 (import 부작용 없이)."""
+    return re.sub(r"[^\w]", "", re.sub(r"[\s\-]+", "_", text.strip().lower()))
+
+
+class Recorder:
+    """요청 경로+쿼리 → 녹화 파일. index.json 에 키 → 파일명 / Content-Type 을 기록."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._lock = threading.Lock()
+        index = root / "index.json"
+        self.index: dict[str, dict] = json.loads(index.read_text(encoding="utf-8")) if index.exists() else {}
+
+    @staticmethod
+    def key(path: str, query: str) -> str:
+        params = sorted(parse_qsl(query, keep_blank_values=True))
+        return f"{path}?{urlencode(params)}" if params else path
+
+    def load(self, key: str) -> tuple[bytes, str] | None:
+        entry = self.index.get(key)
+        if not entry:
+            return None
+        return (self.root / entry["file"]).read_bytes(), entry["content_type"]
+
+    def save(self, key: str, body: bytes, content_type: str) -> None:
+        name = hashlib.sha256(key.encode()).hexdigest()[:16] + Path(urlsplit(key).path).suffix
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            (self.root / name).write_bytes(body)
+            self.index[key] = {"file": name, "content_type": content_type}
+            (self.root / "index.json").write_text(
+                json.dumps(self.index, ensure_ascii=False, indent=1, sort_keys=True), encoding="utf-8")
+
+
+class Stand:
+    """내장 대역 응답 (녹화본이 없을 때)."""
+
+    def __init__(self, seed: int):
+        self.seed = seed
+        self._bulk: dict[str, bytes] = {}
+        self._images: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def bulkmissions(self, day: str) -> bytes:
+        with self._lock:
+            if day not in self._bulk:
+                d = date.fromisoformat(day)
+                rng = random.Random(self.seed * 1_000_003 + d.toordinal())
+                self._bulk[day] = json.dumps(synth_day(d, rng)).encode("utf-8")
+            return self._bulk[day]
+
+    def deep_dive(self, day: str) -> bytes | None:
+        """이번 주는 녹화본(fixtures/deep_dive.json), 지난 주들은 날짜 시드 합성 데이터."""
+        d = date.fromisoformat(day)
+        today = datetime.now(timezone.utc).date()   # 주 키는 UTC 기준
+        if d > today:
+            return None
+        if today - d < timedelta(days=7):
+            return DD_FIXTURE.read_bytes()
+        return json.dumps(synth_deep_dive(random.Random(self.seed * 1_000_003 + d.toordinal()))).encode("utf-8")
+
+    @staticmethod
+    def _image_url(host: str, title: str) -> str:
+        return f"http://{host}/wikia/drg/images/{quote(title.removeprefix('File:'))}"
+
+    def api(self, host: str, params: dict[str, str]) -> bytes:
+        """titles=...&prop=imageinfo 와 generator=search 만 흉내 낸다. 모든 파일이 존재한다고 가정."""
+        query: dict = {}
+        if "titles" in params:
+            pages, normalized = {}, []
+            for i, title in enumerate(params["titles"].split("|")):
+                norm = title.replace("_", " ")
+                if norm != title:
+                    normalized.append({"from": title, "to": norm})
+                pages[str(-1 - i)] = {
+                    "ns": 6, "title": norm, "imageinfo": [{"url": self._image_url(host, norm)}],
+                }
+            query = {"normalized": normalized, "pages": pages} if normalized else {"pages": pages}
+        elif params.get("generator") == "search":
+            term = params.get("gsrsearch", "")
+            limit = int(params.get("gsrlimit", 8))
+            titles = [f"File:{term}.png", f"File:{term} icon.png", f"File:{term}.jpg", f"File:{term} map.png"]
+            query = {"pages": {
+                str(1000 + i): {"ns": 6, "title": t, "index": i + 1,
+                                "imageinfo": [{"url": self._image_url(host, t)}]}
+                for i, t in enumerate(titles[:limit])
+            }}
+        return json.dumps({"batchcomplete": "", "query": query}).encode("utf-8")
+
+    def image(self, file_name: str) -> bytes:
+        """파일 이름 시드 합성 PNG (빌드 산출물 assets/ 와 무관하게 항상 같은 바이트)."""
+        stem = _snake(Path(unquote(file_name)).stem.replace(" icon", ""))
+        with self._lock:
+            if stem not in self._images:
+                rng = random.Random(self.seed * 1_000_003 + zlib.crc32(stem.encode("utf-8")))
+                self._images[stem] = _synth_png(rng)
+            return self._images[stem]
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "DRGMock/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args):  # 기본 stderr 로그 대신 _log 사용
+        pass
+
+    def do_GET(self):
+        opts = self.server.opts
+        started = time.perf_counter()
+        url = urlsplit(self.path)
+
+        delay = (opts.latency + random.uniform(0, opts.jitter)) / 1000
+        if delay:
+            time.sleep(delay)
+
+        if opts.error_rate and random.random() < opts.error_rate:
+            self._send(opts.error_status, b'{"error": "injected"}', "application/json",
+                       extra={"Retry-After": "1"})
+            return self._log(opts.error_status, 0, started)
+
+        found = self._resolve(url.path, url.query)
+        if found is None:
+            self._send(404, b"not found", "text/plain")
+            return self._log(404, 0, started)
+        body, content_type = found
+
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        last_modified = self.server.started_http
+        if not opts.no_304 and self._not_modified(etag):
+            self._send(304, b"", None, extra={"ETag": etag, "Last-Modified": last_modified})
+            return self._log(304, 0, started)
+
+        self._send(200, body, content_type, extra={"ETag": etag, "Last-Modified": last_modified})
+        self._log(200, len(body), started)
+
+    def _not_modified(self, etag: str) -> bool:
+        inm = self.headers.get("If-None-Match")
+        if inm is not None:
+            return etag in [t.strip() for t in inm.split(",")] or inm.strip() == "*"
+        ims = self.headers.get("If-Modified-Since")
+        if ims:
+            try:
+                return parsedate_to_datetime(ims) >= self.server.started_at.replace(microsecond=0)
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _resolve(self, path: str, query: str) -> tuple[bytes, str] | None:
+        recorder: Recorder = self.server.recorder
+        key = Recorder.key(path, query)
+        recorded = recorder.load(key)
+        if recorded:
+            body, content_type = recorded
+            return self._rewrite(body, content_type), content_type
+
+        if self.server.opts.record:
+            for prefix, upstream in UPSTREAMS.items():
+                if path.startswith(prefix):
+                    r = requests.get(upstream + path[len(prefix):] + (f"?{query}" if query else ""), timeout=30)
+                    if r.ok:
+                        content_type = r.headers.get("Content-Type", "application/octet-stream")
+                        recorder.save(key, r.content, content_type)
+                        return self._rewrite(r.content, content_type), content_type
+                    return None
+
+        stand: Stand = self.server.stand
+        m = re.fullmatch(r"/static/json/bulkmissions/(\d{4}-\d{2}-\d{2})\.json", path)
+        if m:
+            return stand.bulkmissions(m.group(1)), "application/json"
+        m = re.fullmatch(r"/static/json/DD_(\d{4}-\d{2}-\d{2})T11-00-00Z\.json", path)
+        if m:
+            body = stand.deep_dive(m.group(1))
+            return (body, "application/json") if body else None
+        if path == "/api.php":
+            return stand.api(self.headers.get("Host", "127.0.0.1"), dict(parse_qsl(query))), "application/json"
+        if path.startswith("/wikia/"):
+            return stand.image(path.rsplit("/", 1)[-1]), "image/png"
+        return None
+
+    def _rewrite(self, body: bytes, content_type: str) -> bytes:
+        """녹화된 위키 응답의 CDN 주소를 이 서버(/wikia/)로 돌린다."""
+        if "json" not in content_type:
+            return body
+        host = self.headers.get("Host", "127.0.0.1")
+        return body.replace(WIKIA_CDN.encode(), f"http://{host}/wikia/".encode()) \
+                   .replace(WIKIA_CDN.replace("/", "\\/").encode(), f"http:\\/\\/{host}\\/wikia\\/".encode())
+
+    def _send(self, status: int, body: bytes, content_type: str | None, extra: dict | None = None) -> None:
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        for k, v in (extra or {}).items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not body:
+            return
+        rate = self.server.opts.bandwidth * 1024
+        if not rate:
+            self.wfile.write(body)
+            return
+        # 대역폭 상한: CHUNK 단위로 보내고 누적 바이트 / rate 만큼 시간을 맞춘다
+        began = time.perf_counter()
+        for i in range(0, len(body), CHUNK):
+            self.wfile.write(body[i:i + CHUNK])
+            ahead = (i + CHUNK) / rate - (time.perf_counter() - began)
+            if ahead > 0:
+                time.sleep(ahead)
+
+    def _log(self, status: int, size: int, started: float) -> None:
+        self.server.counts[status] += 1
+        if not self.server.opts.quiet:
+            ms = (time.perf_counter() - started) * 1000
+            print(f"  {status} {ms:7.1f} ms {size:>9} B  {self.path[:110]}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="doublexp.net / DRG Wiki API 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0, help="응답 전 고정 지연 (ms)")
+    parser.add_argument("--jitter", type=float, default=0, help="지연에 더할 무작위 범위 (ms)")
+    parser.add_argument("--bandwidth", type=float, default=0, help="전송 속도 상한 KB/s (0 = 무제한)")
+    parser.add_argument("--error-rate", type=float, default=0, help="오류 응답 확률 (0~1)")
+    parser.add_argument("--error-status", type=int, default=503, help="주입할 오류 상태 코드 (기본 503)")
+    parser.add_argument("--no-304", action="store_true", help="조건부 요청을 무시하고 항상 200")
+    parser.add_argument("--record", action="store_true", help="녹화본이 없으면 실제 호스트에서 받아 녹화")
+    parser.add_argument("--seed", type=int, default=0, help="합성 bulkmissions 시드")
+    parser.add_argument("--quiet", action="store_true", help="요청별 로그 생략")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), Handler)
+    server.daemon_threads = True
+    server.opts = args
+    server.recorder = Recorder(RECORDED_DIR)
+    server.stand = Stand(args.seed)
+    server.counts = Counter()
+    server.started_at = datetime.now(timezone.utc)
+    server.started_http = formatdate(server.started_at.timestamp(), usegmt=True)
+
+    base = f"http://{args.host}:{args.port}"
+    print(f"🛰  대역 서버: {base}  (녹화본 {len(server.recorder.index)}개)")
+    print(f"   미션:  --base-url {base}/static/json/")
+    print(f"   위키:  --wiki-api {base}/api.php")
+    print(f"   지연 {args.latency:.0f}±{args.jitter:.0f} ms, 대역폭 {args.bandwidth or '무제한'} KB/s, "
+          f"오류 {args.error_rate:.0%} ({args.error_status}), 304 {'끔' if args.no_304 else '켬'}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        summary = ", ".join(f"{status}: {n}" for status, n in sorted(server.counts.items()))
+        print(f"\n📊 응답 합계 — {summary or '요청 없음'}")
+
+
+if __name__ == "__main__":
+    main()
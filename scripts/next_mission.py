@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+scripts/next_mission.py
+"다음 X 는 언제?" 조회 CLI
+
+fetch_daily_missions.py --upcoming 이 만드는 data/next_occurrence.bin 을 읽어
+슬롯을 훑지 않고 칸 하나(값 하나) 또는 행 하나(전체 목록)만 읽어 답합니다.
+
+사용법:
+  python scripts/next_mission.py mutator "Double XP"            # 다음 Double XP
+  python scripts/next_mission.py type Elimination --at 2026-10-20T09:00:00Z
+  python scripts/next_mission.py list --attr mutator           # 변이별 다음 등장 (가까운 순)
+  python scripts/next_mission.py values warning                # 표에 있는 주의보 목록
+"""
+
+import argparse
+import io
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from drg_data.codec import SLOT_SECONDS, slot_key
+from drg_data.upcoming import TRACKED, NextOccurrence
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_TABLE = BASE_DIR / "data" / "next_occurrence.bin"
+
+
+def _parse_time(text: str) -> datetime:
+    """ISO 8601 (끝의 Z 허용 — Python 3.10 의 fromisoformat 은 Z 를 읽지 못한다). 시간대가 없으면 UTC."""
+    when = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    return when if when.tzinfo else when.replace(tzinfo=timezone.utc)
+
+
+def _countdown(slot: int, now: datetime) -> str:
+    minutes = max(0, int(slot * SLOT_SECONDS - now.timestamp()) // 60)
+    if minutes == 0:
+        return "지금"
+    return f"{minutes // 60}시간 {minutes % 60}분 뒤" if minutes >= 60 else f"{minutes}분 뒤"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="값별 다음 등장 슬롯 조회")
+    parser.add_argument("--table", type=Path, default=DEFAULT_TABLE,
+                        help="다음 등장 표 (기본 data/next_occurrence.bin)")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--at", type=_parse_time, help="기준 시각 (ISO 8601, 기본 지금)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for attr in TRACKED:
+        p = sub.add_parser(attr, parents=[common], help=f"{attr} 값의 다음 등장")
+        p.add_argument("value")
+    p_list = sub.add_parser("list", parents=[common], help="기준 시각에서 값마다 다음 등장 (가까운 순)")
+    p_list.add_argument("--attr", choices=list(TRACKED))
+    p_list.add_argument("--limit", type=int, default=30)
+    p_values = sub.add_parser("values", help="표에 있는 값 목록")
+    p_values.set_defaults(at=None)
+    p_values.add_argument("attr", choices=list(TRACKED))
+
+    args = parser.parse_args()
+    now = args.at or datetime.now(timezone.utc)
+    started = time.perf_counter()
+
+    with NextOccurrence(args.table) as table:
+        if args.command == "values":
+            print(", ".join(table.values(args.attr)))
+        elif args.command == "list":
+            for attr, value, slot in table.upcoming(now, args.attr)[:args.limit]:
+                print(f"  {slot_key(slot)}  {_countdown(slot, now):>14}  {attr:8} {value}")
+        else:
+            slot = table.next_slot(args.command, args.value, now)
+            if slot is None:
+                print(f"데이터 범위 안에 {args.command}={args.value} 가 없습니다 "
+                      f"(마지막 슬롯 {slot_key(table.first_slot + table.slot_count - 1)})")
+            else:
+                print(f"⏭ {args.command}={args.value}: {slot_key(slot)} ({_countdown(slot, now)})")
+
+    print(f"⏱ {(time.perf_counter() - started) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+scripts/pack_atlas.py
+DRG Bosco Terminal — 아이콘 스프라이트 아틀라스 생성기
+
+assets/icons/ 의 아이콘 패밀리(mutators / warnings / secondary / ui)를 패밀리당
+아틀라스 이미지 하나로 묶고, 스프라이트 좌표를 assets/atlas/manifest.json 에 기록합니다.
+manifest 의 키는 AssetHelper 가 쓰는 to_snake() 파일명 그대로입니다.
+웹(PWA) 빌드에서 아이콘 수십 개 대신 패밀리당 한 번만 요청하도록 하기 위한 것입니다.
+
+fetch_assets.py 로 아이콘을 받은 뒤 실행하세요 (Pillow 필요).
+
+사용법:
+  python scripts/pack_atlas.py                    # 1x 아이콘으로 PNG 아틀라스
+  python scripts/pack_atlas.py --density 3        # 3.0x/ 변형이 있으면 그것으로 패킹
+  python scripts/pack_atlas.py --format webp      # 무손실 WebP 아틀라스
+  python scripts/pack_atlas.py --max-size 64      # 긴 변 64px 초과 아이콘은 축소
+"""
+
+import argparse
+import io
+import sys
+from pathlib import Path
+
+from drg_data import atlas
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
+
+BASE_DIR = Path(__file__).parent.parent
+ICONS_DIR = BASE_DIR / "assets" / "icons"
+OUT_DIR = BASE_DIR / "assets" / "atlas"
+
+# 처리 순서 = 중복 아이콘의 소유 순서 (앞 패밀리의 아틀라스에만 실린다)
+FAMILIES: dict[str, Path] = {
+    "mutators":  ICONS_DIR / "mutators",
+    "warnings":  ICONS_DIR / "warnings",
+    "secondary": ICONS_DIR / "secondary",
+    "ui":        ICONS_DIR / "ui",
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="아이콘 패밀리별 스프라이트 아틀라스 + 좌표 manifest 생성")
+    parser.add_argument("--format", choices=("png", "webp"), default="png", help="아틀라스 인코딩 (기본 png)")
+    parser.add_argument("--density", type=int, choices=(1, 2, 3), default=1,
+                        help="패킹할 해상도 변형 (<N>.0x/ 가 없으면 1x 사용)")
+    parser.add_argument("--max-size", type=int, default=128, help="아이콘 긴 변 최대 픽셀 (기본 128)")
+    parser.add_argument("--out", type=Path, default=OUT_DIR, help="출력 폴더 (기본 assets/atlas)")
+    args = parser.parse_args()
+
+    if not atlas.available():
+        print("❌ Pillow 가 필요합니다: pip install Pillow")
+        sys.exit(1)
+
+    families = {name: path for name, path in FAMILIES.items() if path.is_dir()}
+    manifest, stats = atlas.build_atlases(
+        families, args.out, max_size=args.max_size, fmt=args.format, density=args.density,
+    )
+
+    print(f"🧩 아틀라스 → {args.out}")
+    print(f"  {'family':10} {'icons':>5} {'packed':>6} {'size':>10} {'개별 합계':>10} {'아틀라스':>10}")
+    for family, s in stats.items():
+        info = manifest["atlases"].get(family)
+        size = f"{info['width']}x{info['height']}" if info else "-"
+        print(f"  {family:10} {s['icons']:>5} {s['packed']:>6} {size:>10}"
+              f" {s['src_bytes'] // 1024:>7} KB {s['atlas_bytes'] // 1024:>7} KB")
+
+    total_icons = sum(s["icons"] for s in stats.values())
+    shared = total_icons - sum(s["packed"] for s in stats.values())
+    print(f"\n✅ 요청 수: 아이콘 {total_icons}개 → 아틀라스 {len(manifest['atlases'])}개 + manifest"
+          f" (중복 {shared}개는 한 번만 수록)")
+
+
+if __name__ == "__main__":
+    main()
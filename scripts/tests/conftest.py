@@ -0,0 +1,55 @@
+"""
+scripts/tests 공용 픽스처
+
+스크립트와 같이 `from drg_data import ...` 로 가져오도록 scripts/ 를 경로에 넣고,
+합성 bulkmissions(drg_data.synth) 를 실제 변환 경로로 돌린 압축 슬롯을 만든다.
+"""
+
+import importlib
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from drg_data.synth import write_fixture  # noqa: E402
+from drg_data.transform import iter_compact_slots  # noqa: E402
+
+
+def import_script(name: str):
+    """
+    scripts/<name>.py 를 모듈로 가져온다. 스크립트는 가져올 때 sys.stdout / sys.stderr 를 UTF-8
+    TextIOWrapper 로 바꾸는데, 그 래퍼가 회수되면 pytest 캡처 버퍼까지 닫히므로 되돌린 뒤 버퍼에서 떼어 낸다.
+    """
+    streams = {attr: getattr(sys, attr) for attr in ("stdout", "stderr")}
+    module = importlib.import_module(name)
+    for attr, stream in streams.items():
+        if getattr(sys, attr) is not stream:
+            getattr(sys, attr).detach()
+            setattr(sys, attr, stream)
+    return module
+
+
+def make_slots(tmp_path: Path, days: int = 2, seed: int = 0) -> list[tuple[str, list[dict]]]:
+    """합성 원본 days 일치 → (타임슬롯 키, 압축 레코드) 목록 (맨 뒤에 'dailyDeal')."""
+    sources = write_fixture(tmp_path, days, seed, slots=48, biomes=3, per_biome=3)
+    return list(iter_compact_slots(sources))
+
+
+@pytest.fixture
+def slots(tmp_path) -> list[tuple[str, list[dict]]]:
+    """
+    이틀치 압축 슬롯. 실제 데이터처럼 같은 미션이 여러 슬롯에 이어지도록 앞 슬롯의 미션을
+    일부 다음 슬롯으로 복사하고, 's': null / [] 미션도 하나씩 섞는다.
+    """
+    items = make_slots(tmp_path)
+    rng = random.Random(1)
+    for i in range(1, len(items) - 1):
+        prev, cur = items[i - 1][1], items[i][1]
+        for pos in rng.sample(range(len(cur)), min(len(cur), len(prev)) // 2):
+            cur[pos] = dict(prev[pos])
+    items[0][1][0]["s"] = None
+    items[1][1][0]["s"] = []
+    return items
@@ -0,0 +1,71 @@
+import sqlite3
+import sys
+from collections import Counter
+
+import pytest
+
+from conftest import import_script
+from drg_data.archive import MissionArchive
+from drg_data.codec import slot_index
+
+cli = import_script("mission_archive")
+
+
+def _timed(slots):
+    return [(ts, ms) for ts, ms in slots if ts != "dailyDeal"]
+
+
+def test_merge_is_idempotent(slots, tmp_path):
+    with MissionArchive(tmp_path / "a.sqlite3") as archive:
+        timed = _timed(slots)
+        assert archive.merge(slots[:10]) == (10, sum(len(ms) for _, ms in timed[:10]))
+        new_slots, _ = archive.merge(slots)
+        assert new_slots == len(timed) - 10
+        assert archive.merge(slots) == (0, 0)
+        assert archive.span() == (timed[0][0], timed[-1][0], len(timed))
+
+
+def test_queries_match_scan(slots, tmp_path):
+    timed = _timed(slots)
+    m = timed[4][1][0]
+    with MissionArchive(tmp_path / "a.sqlite3") as archive:
+        archive.merge(slots)
+        r = archive.count({"biome": m["b"], "type": m["t"]})
+        hits = [(ts, x) for ts, ms in timed for x in ms if (x["b"], x["t"]) == (m["b"], m["t"])]
+        assert r["occurrences"] == len(hits)
+        assert (r["first"], r["last"]) == (hits[0][0], hits[-1][0])
+
+        start = slot_index(timed[48][0])
+        assert archive.count({}, start)["slots"] == len(timed) - 48
+
+        top = dict(archive.frequency("mutator", {}))
+        assert top == Counter(x["bf"] for _, ms in timed for x in ms)
+
+        recent = archive.occurrences({"warning": "Low Oxygen"}, limit=5)
+        assert [ts for ts, _ in recent] == sorted((ts for ts, _ in recent), reverse=True)
+        assert len(recent) == 5 and all("Low Oxygen" in x["df"] for _, x in recent)
+
+        with pytest.raises(ValueError):
+            archive.count({"colour": "red"})
+
+
+def test_backfills_archive_without_slot_tables(slots, tmp_path):
+    path = tmp_path / "old.sqlite3"
+    with MissionArchive(path) as archive:
+        archive.merge(slots)
+        span = archive.span()
+    db = sqlite3.connect(path)
+    db.executescript("DROP TABLE slots; DROP TABLE meta;")
+    db.close()
+    with MissionArchive(path) as archive:
+        assert archive.span() == span
+        assert archive.merge(slots) == (0, 0)
+
+
+def test_list_prints_missions_without_type(slots, tmp_path, monkeypatch, capsys):
+    slots[0][1][0]["t"] = None
+    with MissionArchive(tmp_path / "a.sqlite3") as archive:
+        archive.merge(slots[:1])
+    monkeypatch.setattr(sys, "argv", ["mission_archive.py", "--db", str(tmp_path / "a.sqlite3"), "list"])
+    cli.main()
+    assert f"{slots[0][0]}  {slots[0][1][0]['b']:28} {'-':20}" in capsys.readouterr().out
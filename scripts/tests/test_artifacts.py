@@ -0,0 +1,57 @@
+import gzip
+import hashlib
+
+import brotli
+import zstandard
+
+from drg_data import artifacts
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_hashed_name():
+    assert artifacts.hashed_name("daily_missions.json", "3f9a1c2bdeadbeef") == "daily_missions.3f9a1c2b.json"
+    assert artifacts.hashed_name("LICENSE", "3f9a1c2bdeadbeef") == "LICENSE.3f9a1c2b"
+
+
+def test_encodings_decode_to_source(tmp_path):
+    src = _write(tmp_path / "daily_missions.json", '{"a": [1, 2, 3]}' * 200)
+    out = tmp_path / "dist"
+    manifest = artifacts.build_artifacts([src, tmp_path / "missing.json"], out)
+    assert list(manifest["files"]) == ["daily_missions.json"]
+
+    entry = manifest["files"]["daily_missions.json"]
+    data = src.read_bytes()
+    assert entry["sha256"] == hashlib.sha256(data).hexdigest()
+    assert (out / entry["path"]).read_bytes() == data
+    decoders = {"gzip": gzip.decompress, "br": brotli.decompress,
+                "zstd": zstandard.ZstdDecompressor().decompress}
+    assert set(entry["encodings"]) == set(decoders)
+    for enc, info in entry["encodings"].items():
+        body = (out / info["path"]).read_bytes()
+        assert len(body) == info["bytes"] < len(data)
+        assert decoders[enc](body) == data
+    assert artifacts.load_manifest(out) == manifest
+
+
+def test_keeps_previous_generation_only(tmp_path):
+    src = tmp_path / "deep_dive.json"
+    out = tmp_path / "dist"
+    generations = []
+    for i in range(3):
+        _write(src, f'{{"week": {i}}}')
+        generations.append(artifacts.build_artifacts([src], out))
+
+    names = {p.name for p in out.iterdir()}
+    current, previous, oldest = (artifacts.manifest_paths(m) for m in reversed(generations))
+    assert current | previous | {artifacts.MANIFEST_NAME} == names
+    assert not oldest & names
+
+
+def test_size_report_has_total_row(tmp_path):
+    src = _write(tmp_path / "strings.json", '{"k": "v"}' * 50)
+    lines = artifacts.size_report(artifacts.build_artifacts([src], tmp_path / "dist"))
+    assert len(lines) == 3 and "strings.json" in lines[1] and "합계" in lines[2]
@@ -0,0 +1,69 @@
+import hashlib
+
+from conftest import import_script
+from drg_data.asset_lock import AssetLock, output_record, verify_outputs, verify_raw
+
+fa = import_script("fetch_assets")
+
+
+def test_save_only_on_change(tmp_path):
+    path = tmp_path / "assets.lock.json"
+    lock = AssetLock(path)
+    lock.put("biomes", "Salt Pits", {"source": "direct", "url": "https://x/a.png"})
+    assert lock.save()
+    assert not AssetLock(path).save()   # 키 정렬 — 다시 읽어 써도 바이트가 같다
+    reloaded = AssetLock(path)
+    assert reloaded.get("biomes", "Salt Pits") == {"source": "direct", "url": "https://x/a.png"}
+    reloaded.drop("biomes", "Salt Pits")
+    assert reloaded.entries("biomes") == {}
+
+    path.write_text('{"v": 0, "categories": {"biomes": {"Salt Pits": {}}}}', encoding="utf-8")
+    assert AssetLock(path).get("biomes", "Salt Pits") is None   # 다른 버전은 버린다
+
+
+def test_verify_raw_and_outputs(tmp_path):
+    raw = tmp_path / "raw.png"
+    raw.write_bytes(b"raw")
+    entry = {"size": 3, "sha256": hashlib.sha256(b"raw").hexdigest()}
+    assert verify_raw(raw, entry) is None
+    raw.write_bytes(b"RAW")
+    assert verify_raw(raw, entry) == "sha256 불일치"
+    assert verify_raw(tmp_path / "none.png", entry) == "파일 없음"
+
+    out = tmp_path / "assets" / "a.png"
+    out.parent.mkdir()
+    out.write_bytes(b"app")
+    entry = {"outputs": output_record(tmp_path, [out])}
+    assert entry["outputs"] == {"assets/a.png": {"bytes": 3, "sha256": hashlib.sha256(b"app").hexdigest()}}
+    assert verify_outputs(tmp_path, entry) is None
+    out.write_bytes(b"APP")
+    assert verify_outputs(tmp_path, entry) == "assets/a.png sha256 불일치"
+    assert verify_outputs(tmp_path, {}) == "출력 기록 없음"
+
+
+def test_lock_existing_registers_committed_outputs(tmp_path, monkeypatch):
+    out_dir = tmp_path / "assets" / "icons" / "mutators"
+    (out_dir / "2.0x").mkdir(parents=True)
+    (out_dir / "double_xp.png").write_bytes(b"1x")
+    (out_dir / "2.0x" / "double_xp.png").write_bytes(b"2x")
+    monkeypatch.setattr(fa, "BASE_DIR", tmp_path)
+    monkeypatch.setattr(fa, "OUTPUT_DIRS", {"mutators": out_dir})
+    lock = AssetLock(tmp_path / "assets.lock.json")
+
+    assert fa.lock_existing(["mutators"], lock) == 1
+    assert set(lock.get("mutators", "Double XP")["outputs"]) == {
+        "assets/icons/mutators/double_xp.png", "assets/icons/mutators/2.0x/double_xp.png"}
+    assert fa.lock_existing(["mutators"], lock) == 0
+    # 원본 캐시(.cache/assets)가 없어도 검증은 커밋된 앱 에셋만 본다
+    assert verify_outputs(tmp_path, lock.get("mutators", "Double XP")) is None
+
+
+def test_committed_lockfile_matches_assets():
+    lock = AssetLock(fa.LOCK_PATH)
+    entries = [e for cat in fa.CATEGORY_CONFIG for e in lock.entries(cat).values()]
+    assert entries
+    assert all("dest" not in e and verify_outputs(fa.BASE_DIR, e) is None for e in entries)
+
+
+def test_raw_path_ignores_query():
+    assert fa.raw_path("biomes", "Salt Pits", "https://cdn/x/Salt.jpg?cb=1") == fa.RAW_DIR / "biomes" / "salt_pits.jpg"
@@ -0,0 +1,66 @@
+import hashlib
+
+from PIL import Image
+
+from drg_data import atlas
+
+
+def _icon(path, size, color):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGBA", size, color).save(path, "PNG")
+
+
+def _families(tmp_path):
+    _icon(tmp_path / "mutators" / "double_xp.png", (32, 32), (255, 0, 0, 255))
+    _icon(tmp_path / "mutators" / "shield_disruption.png", (28, 20), (0, 0, 255, 255))
+    _icon(tmp_path / "mutators" / "2.0x" / "double_xp.png", (64, 64), (255, 0, 0, 255))
+    _icon(tmp_path / "warnings" / "low_oxygen.png", (36, 36), (0, 255, 0, 255))
+    _icon(tmp_path / "warnings" / "shield_disruption.png", (28, 20), (0, 0, 255, 255))
+    return {"mutators": tmp_path / "mutators", "warnings": tmp_path / "warnings"}
+
+
+def test_sprites_point_at_their_pixels(tmp_path):
+    out = tmp_path / "atlas"
+    manifest, stats = atlas.build_atlases(_families(tmp_path), out)
+    assert (stats["warnings"]["icons"], stats["warnings"]["packed"]) == (2, 1)
+    # 패밀리를 넘는 중복은 먼저 처리한 패밀리의 아틀라스를 가리킨다
+    assert manifest["sprites"]["warnings"]["shield_disruption"] == manifest["sprites"]["mutators"]["shield_disruption"]
+
+    for family, info in manifest["atlases"].items():
+        data = (out / info["file"]).read_bytes()
+        assert info["bytes"] == len(data) and info["sha256"] == hashlib.sha256(data).hexdigest()
+    for family, sprites in manifest["sprites"].items():
+        for name, s in sprites.items():
+            with Image.open(out / manifest["atlases"][s["atlas"]]["file"]) as im:
+                crop = im.convert("RGBA").crop((s["x"], s["y"], s["x"] + s["w"], s["y"] + s["h"]))
+            with Image.open(tmp_path / family / f"{name}.png") as src:
+                assert crop.tobytes() == src.convert("RGBA").tobytes(), (family, name)
+    assert atlas.load_manifest(out) == manifest
+
+
+def test_shelf_pack_has_no_overlap(tmp_path):
+    sprites = [atlas.Sprite(f"s{i}", "f", Image.new("RGBA", (8 + i * 3, 30 - i * 2)), str(i), 0) for i in range(10)]
+    width, height = atlas.shelf_pack(sprites)
+    boxes = [(s.x, s.y, s.x + s.image.width, s.y + s.image.height) for s in sprites]
+    assert all(x1 <= width and y1 <= height for _, _, x1, y1 in boxes)
+    for i, a in enumerate(boxes):
+        for b in boxes[i + 1:]:
+            assert a[2] <= b[0] or b[2] <= a[0] or a[3] <= b[1] or b[3] <= a[1]
+
+
+def test_density_variant_and_max_size(tmp_path):
+    manifest, _ = atlas.build_atlases(_families(tmp_path), tmp_path / "atlas", max_size=48, density=2)
+    sprite = manifest["sprites"]["mutators"]["double_xp"]
+    assert (sprite["w"], sprite["h"]) == (48, 48)   # 2.0x 변형(64px)을 max_size 로 축소
+    assert manifest["sprites"]["warnings"]["low_oxygen"]["w"] == 36   # 변형이 없으면 1x
+
+
+def test_cleanup_only_touches_previous_atlases(tmp_path):
+    out = tmp_path / "atlas"
+    families = _families(tmp_path)
+    atlas.build_atlases(families, out)
+    _icon(out / "unrelated.png", (4, 4), (0, 0, 0, 255))
+
+    manifest, _ = atlas.build_atlases({"mutators": families["mutators"]}, out, fmt="webp")
+    assert sorted(p.name for p in out.iterdir()) == ["manifest.json", "mutators.webp", "unrelated.png"]
+    assert list(manifest["atlases"]) == ["mutators"]
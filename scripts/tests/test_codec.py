@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+from drg_data import codec
+
+
+def _render(data: dict) -> bytes:
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def test_round_trip(slots):
+    data = dict(slots)
+    doc = codec.encode(data, intern=False)
+    assert doc["v"] == 2
+    # packed 문서 자체도 JSON 직렬화를 거쳐야 한다 (파일로 게시되는 형태)
+    decoded = codec.decode(json.loads(json.dumps(doc)))
+    assert list(decoded) == list(data)
+    assert _render(decoded) == _render(data)
+
+
+def test_null_and_empty_seasons_survive(slots):
+    decoded = codec.decode(codec.encode(dict(slots), intern=False))
+    first, second = slots[0][0], slots[1][0]
+    assert decoded[first][0]["s"] is None
+    assert decoded[second][0]["s"] == []
+
+
+def test_non_timeslot_keys_kept_as_strings(slots):
+    doc = codec.encode(dict(slots), intern=False)
+    keys = [key for key, _ in doc["slots"]]
+    assert "dailyDeal" in keys
+    assert all(isinstance(k, int) for k in keys if k != "dailyDeal")
+
+
+def test_non_canonical_season_order_rejected(slots):
+    data = dict(slots)
+    m = next(m for _, ms in slots for m in ms if m["s"] and len(m["s"]) > 1)
+    m["s"] = list(reversed(m["s"]))
+    with pytest.raises(codec.CodecError):
+        codec.encode(data, intern=False)
+
+
+def test_unsupported_version_rejected():
+    with pytest.raises(codec.CodecError):
+        codec.decode({"v": 99})
+
+
+def test_slot_key_round_trip():
+    assert codec.slot_key(codec.slot_index("2026-03-02T12:30:00Z")) == "2026-03-02T12:30:00Z"
+    with pytest.raises(codec.CodecError):
+        codec.slot_index("dailyDeal")
+    with pytest.raises(codec.CodecError):
+        codec.slot_index("2026-03-02T12:15:00Z")
+
+
+def test_default_is_v2(slots):
+    assert codec.encode(dict(slots))["v"] == 2
+
+
+def test_v4_round_trip_interns_repeated_missions(slots):
+    data = dict(slots)
+    stats = codec.PackStats()
+    doc = codec.encode(data, stats, intern=True)
+    assert doc["v"] == codec.SCHEMA_VERSION
+    assert stats.unique < stats.records
+    assert len(doc["missions"]) == stats.unique
+    decoded = codec.decode(json.loads(json.dumps(doc)))
+    assert _render(decoded) == _render(data)
+    assert decoded[slots[0][0]][0]["s"] is None and decoded[slots[1][0]][0]["s"] == []
+
+
+def _ids_by_content(doc: dict) -> dict[str, int]:
+    """디코드한 미션 내용 → 그 미션의 ID."""
+    out = {}
+    for (_, ids), (_, missions) in zip(doc["slots"], codec.iter_decoded(doc)):
+        for mid, m in zip(ids, missions):
+            out[json.dumps(m)] = mid
+    return out
+
+
+def test_mission_ids_stable_across_runs(slots):
+    """같은 미션은 슬롯 범위·순서·다른 미션과 무관하게 같은 ID."""
+    timed = [(k, v) for k, v in slots if k != "dailyDeal"]
+    full = _ids_by_content(codec.encode(dict(timed), intern=True))
+    later = _ids_by_content(codec.encode(dict(reversed(timed[30:])), intern=True))
+    assert later and later.items() <= full.items()
+    assert all(0 <= mid < 1 << 53 for mid in full.values())   # JSON 숫자로 정확히 표현되는 범위
+
+
+def test_id_collision_fails_loudly(monkeypatch):
+    monkeypatch.setattr(codec, "content_id", lambda key: 7)
+    assert codec.assign_ids([("a",), ("a",)]) == {("a",): 7}
+    with pytest.raises(codec.CodecError):
+        codec.assign_ids([("b",), ("a",)])
+
+
+def test_decodes_v3_index_ids(slots):
+    """v3 (missions 가 목록, ID = 인덱스) 로 게시된 파일도 읽는다."""
+    data = dict(slots)
+    doc = codec.encode(data, intern=True)
+    position = {mid: i for i, mid in enumerate(doc["missions"])}
+    legacy = {**doc, "v": 3, "missions": list(doc["missions"].values()),
+              "slots": [[key, [position[str(mid)] for mid in ids]] for key, ids in doc["slots"]]}
+    assert _render(codec.decode(legacy)) == _render(data)
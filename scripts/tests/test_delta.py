@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from drg_data import delta
+
+
+def _versions(slots: list[tuple[str, list[dict]]]) -> list[bytes]:
+    """게시 세 번: 하루치 → 창이 반나절 밀림 → 슬롯 하나의 미션 하나만 바뀜."""
+    timed = [(k, v) for k, v in slots if k != "dailyDeal"]
+    v1 = dict(timed[:48] + [("dailyDeal", [])])
+    v2 = dict(timed[24:72] + [("dailyDeal", [])])
+    v3 = json.loads(json.dumps(v2))
+    key = next(iter(v3))
+    v3[key][0] = {**v3[key][0], "bf": "Double XP"}
+    return [delta.render(v) for v in (v1, v2, v3)]
+
+
+def test_apply_delta_reproduces_target(slots):
+    base, target, _ = _versions(slots)
+    d = delta.make_delta(json.loads(base), json.loads(target), delta.sha256(base), delta.sha256(target))
+    assert d["removed"] and d["added"] and d["others"] == {"dailyDeal": 48}
+    assert delta.apply_delta(base, d) == target
+
+
+def test_apply_delta_changed_positions_only(slots):
+    _, base, target = _versions(slots)
+    d = delta.make_delta(json.loads(base), json.loads(target), delta.sha256(base), delta.sha256(target))
+    assert not d["added"] and not d["removed"]
+    assert [list(p) for p in d["changed"].values()] == [["0"]]
+    assert delta.apply_delta(base, d) == target
+
+
+def test_apply_delta_keeps_mid_file_others(slots):
+    """dailyDeal 이 타임슬롯 사이에 있어도 같은 위치로 복원한다."""
+    timed = [(k, v) for k, v in slots if k != "dailyDeal"]
+    base = delta.render(dict(timed[:48]))
+    target = delta.render(dict(timed[:10] + [("dailyDeal", [])] + timed[10:50]))
+    d = delta.make_delta(json.loads(base), json.loads(target), delta.sha256(base), delta.sha256(target))
+    assert "order" not in d
+    assert delta.apply_delta(base, d) == target
+
+
+def test_apply_delta_rejects_wrong_base(slots):
+    base, target, other = _versions(slots)
+    d = delta.make_delta(json.loads(base), json.loads(target), delta.sha256(base), delta.sha256(target))
+    with pytest.raises(delta.DeltaError):
+        delta.apply_delta(other, d)
+
+
+def test_catch_up_follows_chain(slots, tmp_path):
+    v1, v2, v3 = _versions(slots)
+    out = tmp_path / "deltas"
+    assert delta.publish(v1, v2, out) is not None
+    assert delta.publish(v2, v3, out) is not None
+    manifest = delta.load_manifest(out)
+    assert manifest["target"] == delta.sha256(v3)
+    assert [e["base"] for e in manifest["deltas"]] == [delta.sha256(v2), delta.sha256(v1)]
+
+    assert delta.catch_up(v1, out) == v3   # 두 단계 뒤처진 클라이언트
+    assert delta.catch_up(v2, out) == v3
+    assert delta.catch_up(v3, out) == v3   # 이미 최신
+
+
+def test_catch_up_broken_chain(slots, tmp_path):
+    v1, v2, v3 = _versions(slots)
+    out = tmp_path / "deltas"
+    delta.publish(v2, v3, out)
+    assert delta.catch_up(v1, out) is None
+
+
+def test_publish_prunes_old_deltas(slots, tmp_path):
+    v1, v2, v3 = _versions(slots)
+    out = tmp_path / "deltas"
+    delta.publish(v1, v2, out, keep=1)
+    delta.publish(v2, v3, out, keep=1)
+    assert sorted(p.name for p in out.iterdir()) == sorted(
+        [delta.MANIFEST_NAME, delta.delta_file_name(delta.sha256(v2))])
+    assert delta.catch_up(v1, out) is None
+
+
+def test_unsorted_target_carries_order(slots):
+    timed = [(k, v) for k, v in slots if k != "dailyDeal"]
+    base = delta.render(dict(timed[:4]))
+    target = delta.render(dict([timed[1], timed[0], timed[2], timed[3]]))
+    d = delta.make_delta(json.loads(base), json.loads(target), delta.sha256(base), delta.sha256(target))
+    assert d["order"] == [timed[1][0], timed[0][0], timed[2][0], timed[3][0]]
+    assert delta.apply_delta(base, d) == target
@@ -0,0 +1,42 @@
+"""AlarmDigest(mmap 리더)의 답을 같은 데이터의 SlotStore 필터와 대조한다."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from drg_data import AlarmDigest, SlotStore
+from drg_data.codec import SLOT_SECONDS
+from drg_data.digest import DOUBLE_XP, write_digest
+
+
+def _at(slot: int) -> datetime:
+    return datetime.fromtimestamp(slot * SLOT_SECONDS + 60, timezone.utc)
+
+
+@pytest.fixture
+def store(slots) -> SlotStore:
+    return SlotStore.from_slots(slots)
+
+
+def test_digest_matches_store(slots, store, tmp_path):
+    path = tmp_path / "alarm_digest.bin"
+    write_digest(slots, path)
+    with AlarmDigest(path) as digest:
+        assert digest.types == sorted(store.values("type"))
+        for si in sorted(set(store.slot)):
+            in_slot = dict(start=si, end=si + 1)
+            buffed = {m.type for m in store.missions(**in_slot) if m.mutator}
+            double = {m.type for m in store.missions(mutator=DOUBLE_XP, **in_slot)}
+            assert set(digest.buffed_types(_at(si))) == buffed
+            assert set(digest.buffed_types(_at(si), double_xp_only=True)) == double
+            assert digest.should_notify(_at(si)) == bool(buffed)
+            assert digest.should_notify(_at(si), exclude=buffed) is False
+
+
+def test_digest_out_of_range(slots, store, tmp_path):
+    path = tmp_path / "alarm_digest.bin"
+    write_digest(slots, path)
+    with AlarmDigest(path) as digest:
+        assert digest.record(digest.first_slot - 1) is None
+        assert digest.record(digest.first_slot + digest.slot_count) is None
+        assert digest.should_notify(_at(digest.first_slot - 1)) is False
@@ -0,0 +1,120 @@
+"""fetch_all — 호스트별 풀 크기, 전체 마감(본문 수신 / 재시도 대기), 임시 캐시 정리."""
+
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from conftest import import_script
+from drg_data import HttpCache
+
+fdm = import_script("fetch_daily_missions")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            if self.path.startswith("/slow"):      # 본문을 천천히 흘린다
+                self.send_response(200)
+                self.send_header("Content-Length", str(100 * 1024))
+                self.end_headers()
+                for _ in range(100):
+                    self.wfile.write(b"x" * 1024)
+                    self.wfile.flush()
+                    time.sleep(0.05)
+            elif self.path.startswith("/busy"):    # 긴 Retry-After
+                self.send_response(503)
+                self.send_header("Retry-After", "30")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            else:
+                time.sleep(0.05)
+                body = self.path.encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+
+@pytest.fixture
+def server():
+    _Handler.active = _Handler.peak = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _workers() -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name.startswith("ThreadPoolExecutor")]
+
+
+def test_pool_sized_per_host(server, tmp_path, monkeypatch):
+    sizes = []
+
+    class Recording(fdm.ThreadPoolExecutor):
+        def __init__(self, max_workers=None, **kw):
+            sizes.append(max_workers)
+            super().__init__(max_workers=max_workers, **kw)
+
+    monkeypatch.setattr(fdm, "ThreadPoolExecutor", Recording)
+    urls = [f"{server}/day/{i}.json" for i in range(12)]
+    results = fdm.fetch_all(urls, 10, HttpCache(tmp_path))
+
+    assert sizes == [fdm.MAX_PER_HOST]
+    assert _Handler.peak <= fdm.MAX_PER_HOST
+    assert all(r.ok and r.path.read_bytes() == url[len(server):].encode() for url, r in results.items())
+
+
+def test_deadline_stops_body_download(server, tmp_path):
+    started = time.monotonic()
+    results = fdm.fetch_all([f"{server}/slow/{i}" for i in range(3)], 0.5, HttpCache(tmp_path))
+    assert all(isinstance(r, TimeoutError) for r in results.values())
+    assert time.monotonic() - started < 2
+    # 워커는 마감 직후 첫 청크에서 끝난다 (본문 5초를 다 받지 않는다)
+    for _ in range(40):
+        if not _workers():
+            break
+        time.sleep(0.05)
+    assert not _workers()
+
+
+def test_retry_wait_clamped_to_deadline(server, tmp_path):
+    started = time.monotonic()
+    results = fdm.fetch_all([f"{server}/busy"], 1.0, HttpCache(tmp_path))
+    assert isinstance(results[f"{server}/busy"], TimeoutError)
+    assert time.monotonic() - started < 3   # Retry-After: 30 을 그대로 자지 않는다
+
+
+def test_no_cache_temp_dir_removed_on_error(monkeypatch, tmp_path):
+    seen = []
+
+    def boom(args, cache):
+        seen.append(cache.root)
+        raise RuntimeError("fail")
+
+    monkeypatch.setattr(fdm, "_run", boom)
+    with pytest.raises(RuntimeError):
+        fdm.run(argparse.Namespace(no_cache=True, cache_dir=tmp_path))
+    assert seen and not seen[0].exists()
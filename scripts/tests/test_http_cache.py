@@ -0,0 +1,61 @@
+import pytest
+
+from drg_data import HttpCache, fingerprint
+
+URL = "https://doublexp.net/static/json/bulkmissions/2026-03-02.json"
+
+
+def test_store_then_conditional_headers(tmp_path):
+    cache = HttpCache(tmp_path)
+    assert cache.conditional_headers(URL) == {}
+    assert cache.load(URL) is None
+
+    res = cache.store(URL, {"ETag": '"abc"', "Last-Modified": "Mon, 02 Mar 2026 00:00:00 GMT"}, [b"{}", b"\n"])
+    assert res.ok and res.changed and res.status == 200
+    assert res.body == b"{}\n"
+    assert cache.conditional_headers(URL) == {
+        "If-None-Match": '"abc"', "If-Modified-Since": "Mon, 02 Mar 2026 00:00:00 GMT"}
+
+    cached = cache.load(URL)
+    assert cached.status == 304 and not cached.changed
+    assert cached.sha256 == res.sha256 and cached.json() == {}
+
+
+def test_same_body_is_unchanged(tmp_path):
+    cache = HttpCache(tmp_path)
+    cache.store(URL, {}, [b"same"])
+    assert not cache.store(URL, {"ETag": '"new"'}, [b"sa", b"me"]).changed
+    assert cache.store(URL, {}, [b"other"]).changed
+
+
+def test_missing_body_means_no_cache(tmp_path):
+    cache = HttpCache(tmp_path)
+    cache.store(URL, {"ETag": '"abc"'}, [b"x"])
+    cache.body_path(URL).unlink()
+    assert cache.meta(URL) is None
+    assert cache.conditional_headers(URL) == {}   # 바디 없이 304 를 받으면 쓸 게 없다
+
+
+def test_interrupted_store_keeps_previous_body(tmp_path):
+    cache = HttpCache(tmp_path)
+    cache.store(URL, {"ETag": '"v1"'}, [b"v1"])
+
+    def broken():
+        yield b"partial"
+        raise TimeoutError("cut")
+
+    with pytest.raises(TimeoutError):
+        cache.store(URL, {"ETag": '"v2"'}, broken())
+    assert cache.load(URL).body == b"v1"
+    assert cache.conditional_headers(URL) == {"If-None-Match": '"v1"'}
+
+
+def test_output_fingerprints(tmp_path):
+    cache = HttpCache(tmp_path)
+    a = cache.store(URL, {}, [b"a"])
+    b = cache.store(URL + "?b", {}, [b"b"])
+    fp = fingerprint([a, b])
+    assert fp != fingerprint([b, a])
+    assert not cache.output_unchanged("daily_missions.json", fp)
+    cache.record_output("daily_missions.json", fp)
+    assert HttpCache(tmp_path).output_unchanged("daily_missions.json", fp)
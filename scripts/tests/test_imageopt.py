@@ -0,0 +1,66 @@
+import hashlib
+
+import pytest
+from PIL import Image
+
+from drg_data import imageopt
+
+
+def _source(path, size, mode="RGBA"):
+    im = Image.new(mode, size, (200, 100, 50, 128) if mode == "RGBA" else (200, 100, 50))
+    im.info["comment"] = b"metadata"
+    im.save(path, "PNG")
+    return path
+
+
+@pytest.mark.parametrize("fmt", imageopt.FORMATS)
+def test_densities_fit_box(tmp_path, fmt):
+    src = _source(tmp_path / "src.png", (400, 200))
+    out = tmp_path / "assets" / "icon.png"
+    result = imageopt.optimize_image(str(src), str(out), (32, 32), fmt)
+
+    expected = {1: [32, 16], 2: [64, 32], 3: [96, 48]}
+    assert set(result["outputs"]) == {str(imageopt.variant_path(out, d)) for d in expected}
+    for d, size in expected.items():
+        path = imageopt.variant_path(out, d)
+        info = result["outputs"][str(path)]
+        assert info["size"] == size
+        data = path.read_bytes()
+        assert info["bytes"] == len(data) and info["sha256"] == hashlib.sha256(data).hexdigest()
+        with Image.open(path) as im:
+            assert im.format == fmt.upper() and im.mode == "RGBA" and list(im.size) == size
+            assert "comment" not in im.info
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_never_upscales_and_skips_duplicate_densities(tmp_path):
+    src = _source(tmp_path / "src.png", (40, 40), mode="RGB")
+    out = tmp_path / "icon.png"
+    result = imageopt.optimize_image(str(src), str(out), (32, 32), "png")
+    assert [o["size"] for o in result["outputs"].values()] == [[32, 32], [40, 40]]
+    assert not imageopt.variant_path(out, 3).exists()
+
+
+def test_optimize_all_keeps_order_and_errors(tmp_path):
+    good = _source(tmp_path / "good.png", (64, 64))
+    jobs = [
+        (str(tmp_path / "missing.png"), str(tmp_path / "a.png"), (16, 16), "webp"),
+        (str(good), str(tmp_path / "b.png"), (16, 16), "webp"),
+    ]
+    results = imageopt.optimize_all(jobs, workers=2)
+    assert isinstance(results[0], Exception)
+    assert str(tmp_path / "b.png") in results[1]["outputs"]
+    assert imageopt.optimize_all([]) == []
+
+
+def test_profile_changes_with_settings():
+    assert imageopt.profile((32, 32), "webp") != imageopt.profile((32, 32), "png")
+    assert imageopt.profile((32, 32), "webp") != imageopt.profile((48, 48), "webp")
+
+
+def test_budget_report_totals():
+    lines = imageopt.budget_report({
+        "biomes": {"files": 2, "before": 4096, "x1": 1024, "all": 2048},
+        "mutators": {"files": 1, "before": 2048, "x1": 1024, "all": 1024},
+    })
+    assert len(lines) == 4 and lines[-1].split()[:2] == ["합계", "3"]
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from drg_data.index import MissionIndex, build_index, mission_values, resolve
+
+
+def _scan(slots, **filters) -> list[tuple[str, int]]:
+    """색인 없이 전체를 훑은 기대값."""
+    return [
+        (ts, pos)
+        for ts, missions in slots if ts != "dailyDeal"
+        for pos, m in enumerate(missions)
+        if all(value in mission_values(attr, m) for attr, value in filters.items())
+    ]
+
+
+@pytest.fixture
+def index(slots) -> MissionIndex:
+    return MissionIndex(json.loads(json.dumps(build_index(slots))))
+
+
+def test_find_matches_full_scan(slots, index):
+    m = slots[5][1][0]
+    queries = [
+        {"mutator": "Double XP"},
+        {"type": m["t"], "biome": m["b"]},
+        {"season": "s3", "biome": m["b"]},
+        {"secondary": m["so"], "type": m["t"], "biome": m["b"]},
+    ]
+    for q in queries:
+        hits = index.find(**q)
+        assert hits == _scan(slots, **q), q
+    assert (slots[5][0], 0) in index.find(type=m["t"], biome=m["b"])
+
+
+def test_warnings_indexed_separately(slots, index):
+    m = next(m for _, ms in slots for m in ms if m["df"] and ", " in m["df"])
+    for warning in m["df"].split(", "):
+        assert index.count("warning", warning) == len(_scan(slots, warning=warning))
+
+
+def test_slots_and_resolve(slots, index):
+    data = dict(slots)
+    keys = index.slots(mutator="Double XP")
+    assert keys == sorted(set(keys)) == sorted({ts for ts, _ in _scan(slots, mutator="Double XP")})
+    assert all(m["bf"] == "Double XP" for m in resolve(index.find(mutator="Double XP"), data))
+    assert "dailyDeal" not in index.slot_keys
+
+
+def test_bad_queries_rejected(index):
+    with pytest.raises(ValueError):
+        index.find()
+    with pytest.raises(ValueError):
+        index.find(colour="red")
+    with pytest.raises(ValueError):
+        MissionIndex({"v": 99})
@@ -0,0 +1,58 @@
+import io
+import json
+
+import pytest
+
+from drg_data.jsonstream import iter_file_items, iter_object_items, write_object_stream
+
+# 버퍼 경계가 숫자 / 이스케이프 / 서로게이트 쌍 / 키와 ':' 사이에 걸리기 쉬운 값들
+DOC = {
+    "2026-03-02T00:00:00Z": {"Biomes": {"Magma Core": [{"Length": "2", "id": 12345}]}},
+    "n": 1.5,
+    "neg": -0.25e-3,
+    "big": 12345678901234567890,
+    "int": 7,
+    "esc": "탭\t줄\n따옴표\"역슬래시\\ é \U0001F600",
+    "arr": [1, [2, [3, {}]], "]}", "{"],
+    "t": True,
+    "f": False,
+    "z": None,
+    "empty": {},
+    "last": 0,
+}
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_every_chunk_size_splits_cleanly(indent):
+    text = json.dumps(DOC, ensure_ascii=False, indent=indent)
+    expected = list(DOC.items())
+    for chunk_size in range(1, 40):
+        assert list(iter_object_items(io.StringIO(text), chunk_size)) == expected, chunk_size
+
+
+def test_number_cut_at_buffer_end():
+    """'1.5' 가 '1.' 에서 잘려도 1 로 읽지 않는다."""
+    text = '{"a": 1.5, "b": 250}'
+    for chunk_size in range(1, len(text) + 1):
+        assert dict(iter_object_items(io.StringIO(text), chunk_size)) == {"a": 1.5, "b": 250}
+
+
+@pytest.mark.parametrize("text", ["{}", " { } ", "\n{\n}\n"])
+def test_empty_object(text):
+    assert list(iter_object_items(io.StringIO(text), 1)) == []
+
+
+@pytest.mark.parametrize("text", ['{"a": 1', '{"a": 1,', '{"a" 1}', '[1, 2]', '{1: 2}'])
+def test_malformed_input_raises(text):
+    with pytest.raises(ValueError):
+        list(iter_object_items(io.StringIO(text), 2))
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_write_round_trip(tmp_path, compact):
+    path = tmp_path / "out.json"
+    assert write_object_stream(path, iter(DOC.items()), compact=compact)
+    separators = (",", ":") if compact else None
+    assert path.read_bytes() == json.dumps(DOC, ensure_ascii=False, separators=separators).encode("utf-8")
+    assert list(iter_file_items(path)) == list(DOC.items())
+    assert not write_object_stream(path, iter(DOC.items()), compact=compact)   # 내용 동일 — 쓰기 생략
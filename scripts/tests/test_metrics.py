@@ -0,0 +1,97 @@
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from drg_data import metrics
+from drg_data.metrics import IterTimer, Metrics
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def do_GET(self):
+        body = b"x" * 1000
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def port():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def resolver(monkeypatch):
+    """'drg.test' → 닫힌 주소(127.0.0.2) 다음 서버 주소(127.0.0.1). 조회마다 20ms, 호출 수를 센다."""
+    calls = []
+
+    def fake(host, port, *args, **kwargs):
+        if host != "drg.test":
+            return socket._socket.getaddrinfo(host, port, *args, **kwargs)
+        calls.append(host)
+        time.sleep(0.02)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (ip, port)) for ip in ("127.0.0.2", "127.0.0.1")]
+
+    monkeypatch.setattr(metrics, "_original_getaddrinfo", fake)
+    monkeypatch.setattr(socket, "getaddrinfo", socket.getaddrinfo)   # uninstall() 뒤 진짜 함수로 복원
+    metrics.install()
+    yield calls
+    metrics.uninstall()
+
+
+def test_falls_back_across_addresses_with_one_lookup(port, resolver):
+    m = Metrics("test")
+    with requests.Session() as session:
+        for _ in range(2):
+            with m.request(f"http://drg.test:{port}/") as rec:
+                res = session.get(f"http://drg.test:{port}/")
+                rec.response(res)
+                list(rec.body([res.content]))
+    assert resolver == ["drg.test"]   # 첫 주소 실패 후 다시 조회하지 않는다
+    first, second = (r.as_dict() for r in m.requests)
+    assert first["status"] == 200 and first["bytes"] == 1000
+    assert 0.02 <= first["dns"] < 0.5 and first["connect"] < first["dns"]
+    assert second["reused"]
+
+
+def test_hooks_pass_through_without_request(port, resolver):
+    assert socket.getaddrinfo("drg.test", port)[0][4] == ("127.0.0.2", port)
+    assert requests.get(f"http://drg.test:{port}/").status_code == 200
+    metrics.uninstall()
+    assert socket.getaddrinfo is metrics._original_getaddrinfo
+
+
+def test_phases_and_report():
+    m = Metrics("test")
+    with m.phase("parse") as info:
+        info["records"] = 10
+    m.add_phase("parse", 0.5, 5)
+    doc = m.as_dict()
+    assert doc["phases"]["parse"]["records"] == 15 and doc["phases"]["parse"]["calls"] == 2
+    assert any(line.lstrip().startswith("parse") for line in Metrics.report_lines(doc))
+
+
+def test_iter_timer_counts_only_producer_time():
+    def slow():
+        for i in range(3):
+            time.sleep(0.01)
+            yield i
+
+    timer = IterTimer()
+    for _ in timer.wrap(slow()):
+        time.sleep(0.02)
+    assert 0.03 <= timer.seconds < 0.06
@@ -0,0 +1,33 @@
+import json
+
+from drg_data import seasons
+from drg_data.jsonstream import iter_file_items, write_object_stream
+
+
+def test_views_hold_only_their_season(slots, tmp_path):
+    full = tmp_path / "daily_missions.json"
+    write_object_stream(full, iter(slots))
+    out = tmp_path / "seasons"
+    manifest = seasons.write_views(lambda: iter_file_items(full), out)
+
+    timed = [(ts, ms) for ts, ms in slots if ts != "dailyDeal"]
+    assert manifest["seasons"] == sorted({s for _, ms in timed for m in ms for s in m["s"] or ()})
+    assert set(manifest["views"]) == set(manifest["seasons"])
+    for season, entry in manifest["views"].items():
+        view = json.loads((out / entry["file"]).read_text(encoding="utf-8"))
+        expected = {ts: [m for m in ms if season in (m["s"] or ())] for ts, ms in timed}
+        assert view == {ts: ms for ts, ms in expected.items() if ms}
+        assert (entry["slots"], entry["missions"]) == (len(view), sum(len(ms) for ms in view.values()))
+        assert entry["bytes"] == (out / entry["file"]).stat().st_size
+    assert len(seasons.size_report(manifest, full)) == len(manifest["views"]) + 2
+
+
+def test_rewrite_prunes_old_views(slots, tmp_path):
+    out = tmp_path / "seasons"
+    out.mkdir()
+    (out / "all.json").write_text("{}", encoding="utf-8")                    # 예전 실행의 전체 시즌 뷰
+    (out / seasons.view_file_name("s99")).write_text("{}", encoding="utf-8")  # 사라진 시즌
+
+    manifest = seasons.write_views(lambda: iter(slots), out)
+    names = {p.name for p in out.iterdir()}
+    assert names == {seasons.MANIFEST_NAME} | {v["file"] for v in manifest["views"].values()}
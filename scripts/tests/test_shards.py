@@ -0,0 +1,44 @@
+import hashlib
+import json
+
+import pytest
+
+from drg_data import shards
+
+
+@pytest.mark.parametrize("granularity, count", [("slot", 96), ("hour", 48)])
+def test_shards_cover_every_slot(slots, tmp_path, granularity, count):
+    out = tmp_path / "missions"
+    report = shards.write_shards(slots, out, granularity)
+    manifest = shards.load_manifest(out)
+    assert manifest["granularity"] == granularity
+    assert report.written == len(manifest["shards"]) == count
+
+    merged = {}
+    for entry in manifest["shards"]:
+        body = (out / entry["file"]).read_bytes()
+        assert len(body) == entry["bytes"] and hashlib.sha256(body).hexdigest() == entry["sha256"]
+        merged.update(json.loads(body))
+    timed = [(k, v) for k, v in slots if k != "dailyDeal"]
+    assert list(merged.items()) == timed
+    assert all(":" not in e["file"] for e in manifest["shards"])
+
+
+def test_read_slot(slots, tmp_path):
+    shards.write_shards(slots, tmp_path, "hour")
+    ts, missions = slots[3]
+    assert shards.read_slot(tmp_path, ts) == missions
+    assert shards.read_slot(tmp_path, "2030-01-01T00:00:00Z") is None
+
+
+def test_rewrite_skips_unchanged_and_prunes(slots, tmp_path):
+    shards.write_shards(slots, tmp_path)
+    report = shards.write_shards(slots[10:], tmp_path)
+    assert report.written == 0
+    assert report.unchanged == 86 and report.removed == 10
+    assert not (tmp_path / shards.shard_file_name(slots[0][0])).exists()
+
+
+def test_unknown_granularity_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        shards.write_shards([], tmp_path, "day")
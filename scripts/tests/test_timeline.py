@@ -0,0 +1,57 @@
+from drg_data import timeline
+from drg_data.codec import SLOT_SECONDS, slot_index
+
+
+def _day(date: str, tag: str) -> list[tuple[str, list]]:
+    return [(key, [tag]) for key in timeline.day_keys(date)]
+
+
+def test_day_keys():
+    keys = timeline.day_keys("2026-03-02")
+    assert len(keys) == timeline.SLOTS_PER_DAY == 48
+    assert keys[0] == "2026-03-02T00:00:00Z" and keys[-1] == "2026-03-02T23:30:00Z"
+
+
+def test_merge_overwrites_and_prunes():
+    existing = dict(_day("2026-03-01", "old") + _day("2026-03-02", "old") + [("dailyDeal", ["old"])])
+    fresh = _day("2026-03-02", "new") + _day("2026-03-03", "new") + [("dailyDeal", ["new"])]
+    keep_from = timeline.day_start("2026-03-02")
+
+    merged, pruned = timeline.merge_slots(existing, fresh, keep_from)
+
+    assert pruned == 48
+    assert list(merged) == timeline.day_keys("2026-03-02") + timeline.day_keys("2026-03-03") + ["dailyDeal"]
+    assert {tuple(v) for v in merged.values()} == {("new",)}
+
+
+def test_merge_keeps_existing_when_fetch_fails():
+    existing = dict(_day("2026-03-02", "old"))
+    merged, pruned = timeline.merge_slots(existing, [], timeline.day_start("2026-03-02"))
+    assert merged == existing and pruned == 0
+
+
+def test_merge_sorts_out_of_order_input():
+    day = _day("2026-03-02", "x")
+    merged, _ = timeline.merge_slots({}, reversed(day), 0)
+    assert list(merged) == [key for key, _ in day]
+
+
+def test_missing_slots():
+    keys = timeline.day_keys("2026-03-02")[:40] + timeline.day_keys("2026-03-03")
+    assert timeline.missing_slots(keys, ["2026-03-02", "2026-03-03", "2026-03-04"]) == {
+        "2026-03-02": 8, "2026-03-04": 48}
+
+
+def test_counts_skip_non_timeslot_keys():
+    keys = timeline.day_keys("2026-03-02") + ["dailyDeal", "ver"]
+    assert timeline.count_slots(keys) == 48
+    assert not timeline.is_slot_key("dailyDeal")
+    assert timeline.missing_slots(keys, ["2026-03-02"]) == {}
+
+
+def test_next_boundary():
+    start = slot_index("2026-03-02T12:00:00Z") * SLOT_SECONDS
+    assert timeline.next_boundary(start) == start + SLOT_SECONDS
+    assert timeline.next_boundary(start + 10) == start + SLOT_SECONDS
+    assert timeline.next_boundary(start + 10, offset=60) == start + 60
+    assert timeline.next_boundary(start + 120, offset=60) == start + SLOT_SECONDS + 60
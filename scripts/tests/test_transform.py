@@ -0,0 +1,91 @@
+import json
+
+from conftest import import_script
+from drg_data import HttpCache
+from drg_data.jsonstream import iter_file_items
+from drg_data.synth import write_fixture
+from drg_data.transform import SlotStats, iter_compact_slots, transform_in_memory
+
+fdm = import_script("fetch_daily_missions")
+
+
+def _fixture(tmp_path, days=3):
+    return write_fixture(tmp_path, days, 0, slots=8, biomes=2, per_biome=2)
+
+
+def _raw(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _errors():
+    seen = []
+    return seen, lambda date, e: seen.append(date)
+
+
+def test_stream_matches_in_memory(tmp_path):
+    sources = _fixture(tmp_path)
+    stats = SlotStats()
+    streamed = list(iter_compact_slots(sources, stats))
+    expected = transform_in_memory([_raw(p) for _, p in sources])
+    assert dict(streamed) == expected
+    assert [k for k, _ in streamed][-1] == "dailyDeal"
+    assert stats.slots == 24 and stats.missions == 24 * 4
+
+
+def test_repeated_slot_keeps_first_position_last_value(tmp_path):
+    sources = _fixture(tmp_path)
+    day1, day2 = _raw(sources[0][1]), _raw(sources[1][1])
+    boundary = next(k for k in reversed(day1) if k.endswith("Z"))
+    day2 = {boundary: day2[next(iter(day2))], **day2}   # 다음 날 파일에 전날 마지막 슬롯이 다시 나옴
+    sources[1][1].write_text(json.dumps(day2), encoding="utf-8")
+
+    streamed = list(iter_compact_slots(sources))
+    expected = transform_in_memory([_raw(p) for _, p in sources])
+    assert streamed[:-1] == [(k, v) for k, v in expected.items() if k != "dailyDeal"]
+    assert [k for k, _ in streamed].count(boundary) == 1
+
+
+def test_truncated_day_is_dropped_whole(tmp_path):
+    sources = _fixture(tmp_path)
+    text = sources[1][1].read_text(encoding="utf-8")
+    sources[1][1].write_text(text[: len(text) // 2], encoding="utf-8")
+    seen, on_error = _errors()
+
+    keys = [k for k, _ in iter_compact_slots(sources, on_error=on_error)]
+    assert seen == [sources[1][0]]
+    assert not any(k.startswith(sources[1][0]) for k in keys)
+    assert sum(k.startswith(sources[0][0]) for k in keys) == 8
+    assert sum(k.startswith(sources[2][0]) for k in keys) == 8
+
+
+def test_repeat_past_window_fails_that_day(tmp_path):
+    sources = _fixture(tmp_path)
+    day1, day3 = _raw(sources[0][1]), _raw(sources[2][1])
+    first = next(iter(day1))
+    sources[2][1].write_text(json.dumps({first: day1[first], **day3}), encoding="utf-8")
+    seen, on_error = _errors()
+
+    keys = [k for k, _ in iter_compact_slots(sources, on_error=on_error)]
+    assert seen == [sources[2][0]]
+    assert keys.count(first) == 1
+    assert not any(k.startswith(sources[2][0]) for k in keys)
+
+
+def test_failed_day_leaves_fingerprint_unrecorded(tmp_path, monkeypatch):
+    for sub in ("data", "raw"):
+        (tmp_path / sub).mkdir()
+    monkeypatch.setattr(fdm, "DATA_DIR", tmp_path / "data")
+    sources = _fixture(tmp_path / "raw")
+    cache = HttpCache(tmp_path / "cache")
+    bodies = {date: path.read_bytes() for date, path in sources}
+    bodies[sources[1][0]] = bodies[sources[1][0]][:100]   # 잘린 응답
+    dates = [date for date, _ in sources]
+
+    def responses():
+        return {fdm.bulk_mission_url(d): cache.store(fdm.bulk_mission_url(d), {}, [bodies[d]]) for d in dates}
+
+    assert fdm.fetch_bulk_data(dates, responses(), cache)
+    out = tmp_path / "data" / "daily_missions.json"
+    assert not any(k.startswith(dates[1]) for k, _ in iter_file_items(out))
+    # 같은 응답으로 다시 돌려도 "변경 없음" 으로 건너뛰지 않는다
+    assert not cache.output_unchanged(out.name, fdm.fingerprint(list(responses().values())))
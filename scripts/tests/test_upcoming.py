@@ -0,0 +1,46 @@
+"""NextOccurrence(mmap 리더)의 답을 같은 데이터의 SlotStore 필터와 대조한다."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from drg_data import NextOccurrence, SlotStore
+from drg_data.codec import SLOT_SECONDS, slot_index
+from drg_data.upcoming import TRACKED, write_table
+
+
+def _at(slot: int) -> datetime:
+    return datetime.fromtimestamp(slot * SLOT_SECONDS + 60, timezone.utc)
+
+
+@pytest.fixture
+def store(slots) -> SlotStore:
+    return SlotStore.from_slots(slots)
+
+
+def test_next_occurrence_matches_store(slots, store, tmp_path):
+    path = tmp_path / "next_occurrence.bin"
+    write_table(slots, path)
+    first, last = min(store.slot), max(store.slot)
+    with NextOccurrence(path) as table:
+        for attr in TRACKED:
+            assert set(table.values(attr)) == {v for v in store.values(attr) if v is not None}
+            for value in table.values(attr):
+                for si in range(first - 1, last + 2, 7):
+                    hits = store.slots(start=si, **{attr: value})
+                    expected = slot_index(hits[0]) if hits else None
+                    assert table.next_slot(attr, value, _at(si)) == expected, (attr, value, si)
+
+
+def test_upcoming_row_matches_next_slot(slots, tmp_path):
+    path = tmp_path / "next_occurrence.bin"
+    write_table(slots, path)
+    with NextOccurrence(path) as table:
+        when = _at(table.first_slot + 30)
+        found = table.upcoming(when)
+        assert found == sorted(found, key=lambda f: (f[2], f[0], f[1]))
+        for attr, value, si in found:
+            assert table.next_slot(attr, value, when) == si
+        assert table.next_slot("mutator", "No Such Mutator", when) is None
+        with pytest.raises(ValueError):
+            table.next_slot("codename", "x", when)